@@ -0,0 +1,121 @@
+"""Benchmark reference parsing over a corpus of real-world references."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import statistics
+import time
+from typing import Any
+
+from getbible import GetBibleReference, ReferenceValidationError
+
+# Commonly requested passages in the forms people type them: full names and
+# abbreviations, ranges and lists, other scripts, book numbers, and the
+# malformed or oversized input that bots send.
+REFERENCES: tuple[tuple[str, str], ...] = (
+    ("John 3:16", "kjv"),
+    ("Jn 3:16-18", "kjv"),
+    ("Genesis 1:1", "kjv"),
+    ("Gen 1:1-5", "kjv"),
+    ("Ps 23", "kjv"),
+    ("Psalm 23:1-6", "kjv"),
+    ("Psalms 119:105", "kjv"),
+    ("Prov 3:5-6", "kjv"),
+    ("Isaiah 40:31", "kjv"),
+    ("Isa. 53:5", "kjv"),
+    ("Jer 29:11", "kjv"),
+    ("Matthew 5:3-12", "kjv"),
+    ("Mt 28:19,20", "kjv"),
+    ("Mark 16:15", "kjv"),
+    ("Luke 2:1-14", "kjv"),
+    ("Romans 8:28,31-39", "kjv"),
+    ("Rom 12:1-2", "kjv"),
+    ("1 Cor 13:4-8", "kjv"),
+    ("First Corinthians 13:13", "kjv"),
+    ("2 Tim 3:16-17", "kjv"),
+    ("Eph 2:8-9", "kjv"),
+    ("Phil 4:13", "kjv"),
+    ("Heb 11:1", "kjv"),
+    ("James 1:2-4", "kjv"),
+    ("1 John 4:7-8", "kjv"),
+    ("1Jn 1:9", "kjv"),
+    ("Rev 21:1-4", "kjv"),
+    ("John 1:2-", "kjv"),
+    ("John 1:-5", "kjv"),
+    ("43 3:16", "kjv"),
+    ("Juan 3:16", "valera"),
+    ("Jean 3:16", "martin"),
+    ("Johannes 3:16", "statenvertaling"),
+    ("Giovanni 14:6", "giovanni"),
+    ("Salmos 23:1-6", "almeida"),
+    ("요한복음 3:16", "korean"),
+    ("创世记1:2-7", "cns"),
+    ("בְּרֵאשִׁית 1:23-30", "codex"),
+    ("John 3:16!", "kjv"),
+    ("Hezekiah 1:1", "kjv"),
+    ("John 1:10-1", "kjv"),
+    ("John 1:1-999999", "kjv"),
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=5)
+    return parser.parse_args()
+
+
+def benchmark(arguments: argparse.Namespace) -> dict[str, Any]:
+    if arguments.iterations < 1:
+        raise ValueError("iterations must be greater than zero")
+    if arguments.repeats < 1:
+        raise ValueError("repeats must be greater than zero")
+
+    # A disabled cache makes every call take the miss path that random bot
+    # references hit; the default cache serves the repeated ones.
+    uncached = GetBibleReference(cache_limit=0)
+    cached = GetBibleReference()
+    outcomes = [_outcome(uncached, reference, code) for reference, code in REFERENCES]
+    if outcomes != [_outcome(cached, reference, code) for reference, code in REFERENCES]:
+        raise RuntimeError("cached and uncached parsers disagree")
+
+    def run(parser: GetBibleReference) -> float:
+        started = time.perf_counter()
+        for _ in range(arguments.iterations):
+            for reference, code in REFERENCES:
+                with contextlib.suppress(ReferenceValidationError):
+                    parser.ref(reference, code)
+        elapsed = time.perf_counter() - started
+        return elapsed / (arguments.iterations * len(REFERENCES))
+
+    uncached_seconds = statistics.median(run(uncached) for _ in range(arguments.repeats))
+    cached_seconds = statistics.median(run(cached) for _ in range(arguments.repeats))
+    return {
+        "references": len(REFERENCES),
+        "valid": sum(1 for outcome in outcomes if outcome == "valid"),
+        "limited": sum(1 for outcome in outcomes if outcome == "RequestLimitError"),
+        "iterations": arguments.iterations,
+        "uncached_median_microseconds": uncached_seconds * 1_000_000,
+        "cached_median_microseconds": cached_seconds * 1_000_000,
+        "uncached_references_per_second": 1 / uncached_seconds,
+    }
+
+
+def _outcome(parser: GetBibleReference, reference: str, code: str) -> str:
+    try:
+        parser.ref(reference, code)
+    except ReferenceValidationError as error:
+        return type(error).__name__
+    return "valid"
+
+
+def main() -> int:
+    arguments = parse_arguments()
+    print(json.dumps(benchmark(arguments), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
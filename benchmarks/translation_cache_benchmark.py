@@ -0,0 +1,87 @@
+"""Benchmark cold translation loads from a populated disk cache."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from datetime import timedelta
+from typing import Any
+
+from getbible import GetBible
+from getbible.repository_client import RepositoryClient
+from getbible.translation_cache import TranslationCache
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--translation", default="kjv")
+    parser.add_argument("--repository", default="https://api.getbible.net")
+    parser.add_argument("--version", default="v2")
+    parser.add_argument("--cache-dir", required=True)
+    parser.add_argument("--iterations", type=int, default=10)
+    return parser.parse_args()
+
+
+def benchmark(arguments: argparse.Namespace) -> dict[str, Any]:
+    if arguments.iterations < 1:
+        raise ValueError("iterations must be greater than zero")
+
+    # Populate the disk cache once; every timed load below starts with an
+    # empty memory cache, as a restarted worker does.
+    GetBible(
+        repo_path=arguments.repository,
+        version=arguments.version,
+        cache_dir=arguments.cache_dir,
+        cache_ttl=timedelta(days=7),
+    ).valid_translation(arguments.translation)
+    repository = RepositoryClient(repo_path=arguments.repository, version=arguments.version)
+
+    def cold_load(validated: bool) -> tuple[float, str]:
+        cache = TranslationCache(
+            repository=repository,
+            refresh_seconds=timedelta(days=7).total_seconds(),
+            cache_dir=arguments.cache_dir,
+        )
+        if not validated:
+            sha = cache.load(arguments.translation).sha
+            cache.artifact_path(sha, cache._validated_name()).unlink(missing_ok=True)
+            cache = TranslationCache(
+                repository=repository,
+                refresh_seconds=timedelta(days=7).total_seconds(),
+                cache_dir=arguments.cache_dir,
+            )
+        started = time.perf_counter()
+        snapshot = cache.load(arguments.translation)
+        elapsed = time.perf_counter() - started
+        if cache.cache_info()["validated_loads"] != int(validated):
+            raise RuntimeError("benchmark load did not take the expected path")
+        return elapsed, snapshot.sha
+
+    full = [cold_load(validated=False) for _ in range(arguments.iterations)]
+    validated = [cold_load(validated=True) for _ in range(arguments.iterations)]
+    if len({sha for _, sha in full + validated}) != 1:
+        raise RuntimeError("benchmark loads returned inconsistent translations")
+
+    full_seconds = statistics.median(elapsed for elapsed, _ in full)
+    validated_seconds = statistics.median(elapsed for elapsed, _ in validated)
+    return {
+        "translation": arguments.translation,
+        "translation_sha": full[0][1],
+        "iterations": arguments.iterations,
+        "validation_version": TranslationCache.VALIDATION_VERSION,
+        "full_validation_median_milliseconds": full_seconds * 1000,
+        "validated_sidecar_median_milliseconds": validated_seconds * 1000,
+        "speedup": full_seconds / validated_seconds,
+    }
+
+
+def main() -> int:
+    arguments = parse_arguments()
+    print(json.dumps(benchmark(arguments), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
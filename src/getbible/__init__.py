@@ -1,3 +1,4 @@
+from .async_getbible import AsyncGetBible
 from .exceptions import (
     CacheIntegrityError,
     GetBibleError,
@@ -14,12 +15,13 @@ from .exceptions import (
     TranslationNotFoundError,
 )
 from .getbible_book_number import GetBibleBookNumber
-from .getbible_reference import BookReference, GetBibleReference
+from .getbible_reference import BookReference, GetBibleReference, ReferenceCompletion
 from .hardened import GetBible, RequestLimits
 from .search import SearchBible, SearchCriteria, SearchLimits
 from .source_generation import SourceGeneration
 
 __all__ = [
+    "AsyncGetBible",
     "BookReference",
     "CacheIntegrityError",
     "GetBible",
@@ -27,6 +29,7 @@ __all__ = [
     "GetBibleError",
     "GetBibleReference",
     "ReferenceValidationError",
+    "ReferenceCompletion",
     "RepositoryError",
     "RepositoryResourceNotFound",
     "RepositoryResponseError",
@@ -0,0 +1,112 @@
+"""Aligned, digest-checked binary column buffers shared by corpus structures."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from .exceptions import CacheIntegrityError
+
+_PREAMBLE = struct.Struct("<8sI")
+_ALIGNMENT = 8
+_MAX_HEADER_BYTES = 256 * 1024 * 1024
+
+
+def encode_columns(
+    magic: bytes,
+    header: Mapping[str, Any],
+    columns: Sequence[tuple[str, bytes]],
+) -> bytes:
+    """Return a preamble, JSON header, and 8-byte aligned column body."""
+    body = bytearray()
+    sections: dict[str, list[int]] = {}
+    for name, content in columns:
+        body.extend(b"\x00" * (-len(body) % _ALIGNMENT))
+        sections[name] = [len(body), len(content)]
+        body.extend(content)
+    encoded = json.dumps(
+        {
+            **header,
+            "byteorder": sys.byteorder,
+            "sections": sections,
+            "digest": hashlib.blake2b(body, digest_size=32).hexdigest(),
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    encoded += b" " * (-(_PREAMBLE.size + len(encoded)) % _ALIGNMENT)
+    return b"".join((_PREAMBLE.pack(magic, len(encoded)), encoded, body))
+
+
+def decode_columns(
+    buffer: bytes | mmap.mmap,
+    magic: bytes,
+    label: str,
+) -> tuple[dict[str, Any], memoryview]:
+    """Validate a column buffer and return its header and body view."""
+    view = memoryview(buffer)
+    if len(view) < _PREAMBLE.size:
+        raise CacheIntegrityError(f"{label} is truncated.")
+    found, header_length = _PREAMBLE.unpack_from(view)
+    body_start = _PREAMBLE.size + header_length
+    if (
+        found != magic
+        or header_length > _MAX_HEADER_BYTES
+        or body_start > len(view)
+        or body_start % _ALIGNMENT
+    ):
+        raise CacheIntegrityError(f"{label} has an invalid header.")
+    try:
+        header = json.loads(bytes(view[_PREAMBLE.size:body_start]))
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise CacheIntegrityError(f"{label} header is not valid JSON.") from error
+    if not isinstance(header, dict):
+        raise CacheIntegrityError(f"{label} header is not an object.")
+    if header.get("byteorder") != sys.byteorder:
+        raise CacheIntegrityError(f"{label} was written with a different byte order.")
+    body = view[body_start:]
+    if header.get("digest") != hashlib.blake2b(body, digest_size=32).hexdigest():
+        raise CacheIntegrityError(f"{label} content does not match its digest.")
+    return header, body
+
+
+def column(
+    body: memoryview,
+    header: Mapping[str, Any],
+    name: str,
+    typecode: str,
+) -> memoryview:
+    """Return one named section as a typed read-only view."""
+    try:
+        offset, length = header["sections"][name]
+    except (KeyError, TypeError, ValueError) as error:
+        raise CacheIntegrityError(f"Missing binary column {name!r}.") from error
+    itemsize = array(typecode).itemsize
+    if (
+        not isinstance(offset, int)
+        or not isinstance(length, int)
+        or offset < 0
+        or length < 0
+        or offset % _ALIGNMENT
+        or length % itemsize
+        or offset + length > len(body)
+    ):
+        raise CacheIntegrityError(f"Binary column {name!r} is out of bounds.")
+    view = body[offset:offset + length]
+    return view if typecode == "B" else view.cast(typecode)
+
+
+def map_file(path: Path) -> mmap.mmap | None:
+    """Map an existing file read-only, or return ``None`` when unavailable."""
+    try:
+        with path.open("rb") as handle:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
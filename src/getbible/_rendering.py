@@ -0,0 +1,288 @@
+"""Response documents rendered from JSON fragments that are encoded once."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Mapping
+from copy import deepcopy
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+# Compact structural bytes around the three top-level search members.
+_SEARCH_ENVELOPE = len('{"query":,"results":,"matches":}')
+_SEARCH_GROUP_LISTS = len(',"ref":[],"verses":[]')
+
+
+def encode_fragment(value: Any) -> tuple[str, int]:
+    """Return ``json.dumps(value, ensure_ascii=False)`` and its compact byte size.
+
+    Public JSON uses the default ``", "`` and ``": "`` separators while
+    response budgets are defined on the compact encoding. Each structural
+    separator is exactly one byte longer in the default form, so both values
+    come from one encoding pass.
+    """
+    encoded = json.dumps(value, ensure_ascii=False)
+    size = len(encoded) if encoded.isascii() else len(encoded.encode("utf-8"))
+    return encoded, size - _separators(value)
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only form of a decoded JSON value.
+
+    Objects become ``MappingProxyType`` views and arrays become tuples, so
+    one cached value can be handed to every response without copying.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _thawed(value: Any) -> dict[str, Any]:
+    """``json.dumps`` default that encodes frozen objects like dictionaries."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _separators(value: Any) -> int:
+    if isinstance(value, dict):
+        items = value.values()
+        count = 2 * len(value) - 1 if value else 0
+    elif isinstance(value, list | tuple):
+        items = value
+        count = len(value) - 1 if value else 0
+    else:
+        return 0
+    for item in items:
+        if isinstance(item, dict | list | tuple):
+            count += _separators(item)
+    return count
+
+
+def _utf8_size(encoded: str) -> int:
+    return len(encoded) if encoded.isascii() else len(encoded.encode("utf-8"))
+
+
+def _joined_size(sizes: list[int]) -> int:
+    return sum(sizes) + max(0, len(sizes) - 1)
+
+
+@dataclass(slots=True)
+class SearchGroup:
+    """One chapter-keyed search result object and its encoded members."""
+
+    header: dict[str, Any]
+    header_json: str
+    header_size: int
+    refs: list[str] = field(default_factory=list)
+    ref_json: list[str] = field(default_factory=list)
+    verses: list[dict[str, Any]] = field(default_factory=list)
+    verse_json: list[str] = field(default_factory=list)
+    verse_sizes: list[int] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        return (
+            self.header_size
+            + _SEARCH_GROUP_LISTS
+            + _joined_size([_utf8_size(ref) for ref in self.ref_json])
+            + _joined_size(self.verse_sizes)
+        )
+
+
+class SearchDocument:
+    """A search response that can be returned as a dictionary or JSON text."""
+
+    __slots__ = (
+        "query",
+        "query_json",
+        "query_size",
+        "groups",
+        "matches",
+        "match_json",
+        "match_sizes",
+        "translation_view",
+    )
+
+    def __init__(self, translation_view: Mapping[str, Any] | None = None) -> None:
+        # A read-only translation object shared with the corpus; without it,
+        # to_dict() returns a private copy of the translation metadata.
+        self.translation_view = translation_view
+        self.query: dict[str, Any] = {}
+        self.query_json = "{}"
+        self.query_size = 2
+        self.groups: dict[str, SearchGroup] = {}
+        self.matches: list[dict[str, Any]] = []
+        self.match_json: list[str] = []
+        self.match_sizes: list[int] = []
+
+    def set_query(self, query: dict[str, Any]) -> None:
+        self.query = query
+        self.query_json, self.query_size = encode_fragment(query)
+
+    @property
+    def compact_size(self) -> int:
+        """Return the compact UTF-8 size of the complete response."""
+        results = 2 + _joined_size(
+            [_utf8_size(json.dumps(key)) + 1 + group.size for key, group in self.groups.items()]
+        )
+        matches = 2 + _joined_size(self.match_sizes)
+        return _SEARCH_ENVELOPE + self.query_size + results + matches
+
+    def to_dict(self) -> dict[str, Any]:
+        # Translation metadata is shared with the cached corpus; everything
+        # else in the document was created for this response.
+        query = dict(self.query)
+        shared = self.translation_view is not None
+        query["translation"] = (
+            self.translation_view if shared else deepcopy(query["translation"])
+        )
+        return {
+            "query": query,
+            "results": {
+                key: {
+                    **(group.header if shared else deepcopy(group.header)),
+                    "ref": list(group.refs),
+                    "verses": group.verses,
+                }
+                for key, group in self.groups.items()
+            },
+            "matches": self.matches,
+        }
+
+    def to_json(self) -> str:
+        return "".join(self.iter_json())
+
+    def iter_json(self) -> Iterator[str]:
+        """Yield the default-separator JSON document fragment by fragment."""
+        yield '{"query": '
+        yield self.query_json
+        yield ', "results": {'
+        for position, (key, group) in enumerate(self.groups.items()):
+            if position:
+                yield ", "
+            yield json.dumps(key, ensure_ascii=False)
+            yield ": "
+            yield group.header_json[:-1]
+            yield ', "ref": ['
+            yield ", ".join(group.ref_json)
+            yield '], "verses": ['
+            yield ", ".join(group.verse_json)
+            yield "]}"
+        yield '}, "matches": ['
+        yield ", ".join(self.match_json)
+        yield "]}"
+
+
+@dataclass(slots=True)
+class ScriptureGroup:
+    """One chapter-keyed selection plus the chapter's shared fragment cache."""
+
+    chapter: dict[str, Any]
+    fragments: dict[str, str]
+    refs: list[str]
+    verses: list[tuple[str, dict[str, Any], dict[str, str]]]
+    verse_keys: set[str]
+
+
+class ScriptureDocument:
+    """A reference selection that can be returned as a dictionary or JSON text.
+
+    Chapter headers and verses are encoded at most once per cached chapter;
+    the fragments live beside the chapter in the chapter cache. With
+    ``shared``, cached chapters hold :func:`freeze` values and :meth:`to_dict`
+    returns them without copying.
+    """
+
+    __slots__ = ("groups", "shared")
+
+    def __init__(self, shared: bool = False) -> None:
+        self.groups: dict[str, ScriptureGroup] = {}
+        self.shared = shared
+
+    def add(
+        self,
+        key: str,
+        reference: str,
+        chapter: dict[str, Any],
+        fragments: dict[str, str],
+        verse_key: str,
+    ) -> None:
+        verse = chapter["verses"][verse_key]
+        group = self.groups.get(key)
+        if group is None:
+            self.groups[key] = ScriptureGroup(
+                chapter, fragments, [reference], [(verse_key, verse, fragments)], {verse_key}
+            )
+            return
+        if verse_key not in group.verse_keys:
+            group.verse_keys.add(verse_key)
+            group.verses.append((verse_key, verse, fragments))
+        if reference not in group.refs:
+            group.refs.append(reference)
+
+    def to_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for key, group in self.groups.items():
+            header = {name: value for name, value in group.chapter.items() if name != "verses"}
+            verses = [verse for _, verse, _ in group.verses]
+            if not self.shared:
+                header, verses = deepcopy(header), deepcopy(verses)
+            result[key] = header
+            result[key]["ref"] = list(group.refs)
+            result[key]["verses"] = verses
+        return result
+
+    def to_json(self) -> str:
+        parts = ["{"]
+        for position, (key, group) in enumerate(self.groups.items()):
+            if position:
+                parts.append(", ")
+            parts.append(json.dumps(key, ensure_ascii=False))
+            parts.append(": ")
+            parts.append(self._group_json(group))
+        parts.append("}")
+        return "".join(parts)
+
+    @staticmethod
+    def _group_json(group: ScriptureGroup) -> str:
+        header = group.fragments.get("")
+        if header is None:
+            header = json.dumps(
+                {name: value for name, value in group.chapter.items() if name != "verses"},
+                ensure_ascii=False,
+                default=_thawed,
+            )
+            group.fragments[""] = header
+        if "ref" in group.chapter or header == "{}":
+            # A payload-provided "ref" keeps its original position in the
+            # dictionary form, so fall back to encoding that form directly.
+            return json.dumps(
+                ScriptureDocument._single(group), ensure_ascii=False, default=_thawed
+            )
+        verses = []
+        for verse_key, verse, fragments in group.verses:
+            encoded = fragments.get(verse_key)
+            if encoded is None:
+                encoded = json.dumps(verse, ensure_ascii=False, default=_thawed)
+                fragments[verse_key] = encoded
+            verses.append(encoded)
+        return "".join(
+            (
+                header[:-1],
+                ', "ref": [',
+                ", ".join(json.dumps(ref, ensure_ascii=False) for ref in group.refs),
+                '], "verses": [',
+                ", ".join(verses),
+                "]}",
+            )
+        )
+
+    @staticmethod
+    def _single(group: ScriptureGroup) -> dict[str, Any]:
+        document = ScriptureDocument(shared=True)  # Only encoded, never returned.
+        document.groups["group"] = group
+        return document.to_dict()["group"]
@@ -0,0 +1,300 @@
+"""An asyncio facade over the shared :class:`GetBible` caches."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+from ._rendering import ScriptureDocument
+from .exceptions import RepositoryError, TranslationNotFoundError
+from .getbible import _CacheEntry, _FetchSteps
+from .hardened import GetBible
+from .repository_client import AsyncRepositoryClient
+from .search import SearchBible
+from .source_generation import SourceGeneration
+
+_T = TypeVar("_T")
+
+
+class AsyncGetBible:
+    """Serve scripture lookups from an event loop without blocking it.
+
+    Books indexes and chapters missing from the wrapped client's memory are
+    fetched with :class:`AsyncRepositoryClient`, and concurrent requests for
+    the same resource await one shared task instead of a keyed thread lock.
+    The response is assembled on the loop from the chapter entries those
+    steps returned, without the source barrier or keyed locks that a
+    blocking call in the pool may hold across a network round trip, so warm
+    lookups involve no thread handoff. Translation loads, index builds, and
+    searches are CPU- and file-lock-bound and run in a bounded thread pool.
+    """
+
+    def __init__(
+        self,
+        bible: GetBible | None = None,
+        *,
+        max_workers: int | None = None,
+        max_connections: int = 100,
+    ) -> None:
+        if bible is not None and not isinstance(bible, GetBible):
+            raise TypeError("bible must be a GetBible instance or null.")
+        self._owns_bible = bible is None
+        self.bible = bible if bible is not None else GetBible()
+        self._repository = AsyncRepositoryClient(
+            self.bible._repository,
+            max_connections=max_connections,
+        )
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="getbible-async",
+        )
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._stats = {"fetches": 0, "shared_fetches": 0, "offloaded": 0}
+
+    async def select(self, reference: str, abbreviation: str | None = "kjv") -> dict[str, Any]:
+        """Asynchronous :meth:`GetBible.select`."""
+        (document,) = await self._documents([reference], abbreviation)
+        return document.to_dict()
+
+    async def scripture(self, reference: str, abbreviation: str | None = "kjv") -> str:
+        """Asynchronous :meth:`GetBible.scripture`."""
+        (document,) = await self._documents([reference], abbreviation)
+        return document.to_json()
+
+    async def select_many(
+        self,
+        references: Iterable[str],
+        abbreviation: str | None = "kjv",
+    ) -> list[dict[str, Any]]:
+        """Asynchronous :meth:`GetBible.select_many`."""
+        references = list(references)
+        if not references:
+            return []
+        if not all(isinstance(reference, str) for reference in references):
+            return self.bible.select_many(references, abbreviation)  # Raises the same error.
+        return [document.to_dict() for document in await self._documents(references, abbreviation)]
+
+    async def search(
+        self,
+        query: str,
+        abbreviation: str | None = "kjv",
+        criteria: SearchBible | dict[str, Any] | str | None = None,
+    ) -> dict[str, Any]:
+        """Run :meth:`GetBible.search` in the worker pool."""
+        return await self._offload(self.bible.search, query, abbreviation, criteria)
+
+    async def search_json(
+        self,
+        query: str,
+        abbreviation: str | None = "kjv",
+        criteria: SearchBible | dict[str, Any] | str | None = None,
+    ) -> str:
+        """Run :meth:`GetBible.search_json` in the worker pool."""
+        return await self._offload(self.bible.search_json, query, abbreviation, criteria)
+
+    async def valid_translation(self, abbreviation: str) -> bool:
+        """Asynchronous :meth:`GetBible.valid_translation`."""
+        try:
+            code = self.bible._validated_translation_code(abbreviation)
+        except (TypeError, ValueError):
+            return False
+        return await self._translation_available(code)
+
+    def valid_reference(self, reference: str, abbreviation: str | None = "kjv") -> bool:
+        """Return :meth:`GetBible.valid_reference`; parsing performs no I/O."""
+        return self.bible.valid_reference(reference, abbreviation)
+
+    def complete(
+        self,
+        prefix: str,
+        abbreviation: str | None = "kjv",
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Return :meth:`GetBible.complete`; completion performs no I/O."""
+        return self.bible.complete(prefix, abbreviation, limit)
+
+    async def warm_translation(
+        self,
+        abbreviation: str | None = "kjv",
+        *,
+        case_sensitive: bool = False,
+        diacritics: str = "sensitive",
+    ) -> dict[str, Any]:
+        """Run :meth:`GetBible.warm_translation` in the worker pool."""
+        return await self._offload(
+            partial(
+                self.bible.warm_translation,
+                case_sensitive=case_sensitive,
+                diacritics=diacritics,
+            ),
+            abbreviation,
+        )
+
+    async def warm_translations(
+        self,
+        abbreviations: Iterable[str],
+        *,
+        variants: Iterable[Mapping[str, Any]] | None = None,
+        workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Run :meth:`GetBible.warm_translations` in the worker pool."""
+        return await self._offload(
+            partial(self.bible.warm_translations, variants=variants, workers=workers),
+            list(abbreviations),
+        )
+
+    def cache_info(self) -> dict[str, Any]:
+        """Return :meth:`GetBible.cache_info` plus event-loop fetch counters."""
+        state = self.bible.cache_info()
+        state["async"] = {
+            "inflight": len(self._inflight),
+            "max_connections": self._repository.max_connections,
+            "max_workers": self._max_workers,
+            **self._stats,
+        }
+        return state
+
+    async def aclose(self) -> None:
+        """Close pooled connections and the worker pool.
+
+        The wrapped :class:`GetBible` is closed only when this facade created it.
+        """
+        await self._repository.aclose()
+        await asyncio.to_thread(self._executor.shutdown)
+        if self._owns_bible:
+            self.bible.close()
+
+    async def __aenter__(self) -> AsyncGetBible:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def _documents(
+        self,
+        references: list[str],
+        abbreviation: str | None,
+    ) -> list[ScriptureDocument]:
+        """Assemble each reference from chapters fetched for this request."""
+        bible = self.bible
+        code = bible._validated_translation_code(abbreviation)
+        joined = ";".join(references)
+        bible._validated_references(joined, code)
+        for _ in range(2):
+            generation = (await self._generation()).generation
+            chapters = await self._prefetch_reference(joined, code)
+            current = await self._generation()
+            if current.generation == generation:
+                break
+            # Another thread may have invalidated the caches for a new source
+            # generation before this prefetch installed older resources.
+            await self._offload(bible._invalidate_worker_caches, current)
+        else:
+            return await self._offload(self._select_in_thread, references, code)
+        return [
+            bible._assemble_document(
+                code, reference.split(";"), lambda book, chapter: chapters[book, chapter]
+            )
+            for reference in references
+        ]
+
+    async def _generation(self) -> SourceGeneration:
+        """Return the source generation, invalidating this worker in the pool."""
+        coordinator = self.bible._source_coordinator
+        current = coordinator.peek()
+        if current is None:
+            # Invalidation waits for every in-flight blocking operation.
+            current = await self._offload(coordinator.synchronize)
+        return current
+
+    async def _prefetch_reference(
+        self, reference: str, code: str
+    ) -> dict[tuple[int, int], _CacheEntry]:
+        if not await self._translation_available(code):
+            raise TranslationNotFoundError(f"Translation ({code}) not found.")
+        chapters: dict[tuple[int, int], None] = {}
+        for raw_reference in reference.split(";"):
+            try:
+                book_reference = self.bible._GetBible__get.ref(raw_reference.strip(), code)
+            except ValueError:
+                continue  # Reported by the assembly.
+            chapters[book_reference.book, book_reference.chapter] = None
+        results = await asyncio.gather(
+            *(self._chapter(code, book, chapter) for book, chapter in chapters),
+            return_exceptions=True,
+        )
+        # Raise the failure of the earliest reference, as a synchronous select would.
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return dict(zip(chapters, results, strict=True))
+
+    def _select_in_thread(self, references: list[str], code: str) -> list[ScriptureDocument]:
+        # The source generation kept changing; let the blocking path resolve
+        # the references inside source_operation() instead.
+        return [self.bible._select_document(reference, code) for reference in references]
+
+    async def _translation_available(self, code: str) -> bool:
+        bible = self.bible
+        if bible._negative_translation_cached(code):
+            return False
+        if bible._fresh_books(code, record_hit=False):
+            return True
+        available = await self._single_flight(
+            f"books:{code}",
+            lambda: self._drive(bible._books_steps(code)),
+        )
+        return bible._record_translation_availability(code, available)
+
+    async def _chapter(self, code: str, book: int, chapter: int) -> _CacheEntry:
+        cache_key = f"{code}_{book}_{chapter}"
+        entry = self.bible._fresh_chapter(cache_key) or self.bible._snapshot_chapter(
+            code, book, chapter
+        )
+        if entry is not None:
+            return entry
+        return await self._single_flight(
+            f"chapter:{cache_key}",
+            lambda: self._drive(self.bible._chapter_steps(code, book, chapter)),
+        )
+
+    async def _single_flight(self, key: str, operation: Callable[[], Awaitable[_T]]) -> _T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(operation())
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._finish_flight, key))
+        else:
+            self._stats["shared_fetches"] += 1
+        # A cancelled caller must not cancel the fetch other callers await.
+        return await asyncio.shield(task)
+
+    def _finish_flight(self, key: str, task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here when every waiter was cancelled.
+
+    async def _drive(self, steps: _FetchSteps[_T]) -> _T:
+        """Drive the steps of :meth:`GetBible._run_fetch_steps` asynchronously."""
+        try:
+            request = next(steps)
+            while True:
+                self._stats["fetches"] += 1
+                try:
+                    fetched = await self._repository.fetch_if_changed(*request)
+                except RepositoryError as error:
+                    request = steps.throw(error)
+                else:
+                    request = steps.send(fetched)
+        except StopIteration as finished:
+            return finished.value
+
+    async def _offload(self, function: Callable[..., _T], *arguments: Any) -> _T:
+        self._stats["offloaded"] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *arguments))
@@ -4,36 +4,56 @@ from __future__ import annotations
 
 import hashlib
 import json
+import multiprocessing
 import os
 import re
 import threading
 import time
-from collections import OrderedDict
-from collections.abc import Iterator
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Generator, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 from ._keyed_locks import KeyedLockPool
+from ._rendering import (
+    ScriptureDocument,
+    SearchDocument,
+    SearchGroup,
+    encode_fragment,
+    freeze,
+)
 from .exceptions import (
     CacheIntegrityError,
+    GetBibleError,
+    RepositoryError,
     RepositoryResourceNotFound,
     RepositoryResponseError,
     SearchLimitError,
 )
 from .getbible_reference import BookReference, GetBibleReference
-from .repository_client import RepositoryClient
+from .repository_client import RepositoryClient, RepositoryFetch, RepositoryValidators
 from .search import (
+    RankedMatches,
     SearchBible,
+    SearchBudget,
     SearchEngine,
     SearchHit,
     SearchLimits,
     TranslationCorpus,
+    encode_index_variant,
+    validate_search_request,
 )
 from .source_generation import PurgeCallback, SourceCoordinator, SourceGeneration
-from .translation_cache import TranslationCache
+from .translation_cache import TranslationCache, TranslationSnapshot
+
+_T = TypeVar("_T")
+# Cache refresh steps yield (relative path, validators) fetch requests and
+# receive the fetched resource; see GetBible._run_fetch_steps().
+_FetchRequest = tuple[str, RepositoryValidators | None]
+_FetchSteps = Generator[_FetchRequest, RepositoryFetch, _T]
 
 
 @dataclass
@@ -41,6 +61,16 @@ class _CacheEntry:
     data: dict[str, Any]
     loaded_at: float
     sha: str | None = None
+    # Encoded JSON fragments of ``data``, filled lazily by scripture().
+    fragments: dict[str, str] = field(default_factory=dict)
+    # HTTP validators of the resources ``data`` was loaded and checked from.
+    validators: dict[str, RepositoryValidators] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class _SearchResultEntry:
+    ranked: RankedMatches
+    loaded_at: float
 
 
 @dataclass(slots=True)
@@ -73,6 +103,9 @@ class GetBible:
         | set(map(str, range(1, 84)))
     )
     _TRANSLATION_PATTERN = re.compile(r"[a-z0-9][a-z0-9_-]{0,29}")
+    # Ranked matches retained for a query once a page beyond the first is
+    # requested, so nearby pages skip matching.
+    _SEARCH_RESULT_WINDOW = 1000
 
     def __init__(
         self,
@@ -92,6 +125,16 @@ class GetBible:
         require_checksums: bool | None = None,
         source_purge_callback: PurgeCallback | None = None,
         search_limits: SearchLimits | None = None,
+        persist_search_indexes: bool = True,
+        search_result_cache_limit: int | None = 128,
+        search_result_ttl: timedelta = timedelta(hours=1),
+        payload_verification: str = "checksum",
+        payload_scrub_interval: timedelta | None = None,
+        stale_while_revalidate: bool = False,
+        payload_compression: str | None = None,
+        chapter_fetch_workers: int = 8,
+        select_from_snapshots: bool = False,
+        immutable_results: bool = False,
     ) -> None:
         reference_cache_limit = self._validated_cache_limit(
             "reference_cache_limit", reference_cache_limit
@@ -108,6 +151,19 @@ class GetBible:
         translation_cache_limit = self._validated_cache_limit(
             "translation_cache_limit", translation_cache_limit
         )
+        self._search_result_cache_limit = self._validated_cache_limit(
+            "search_result_cache_limit", search_result_cache_limit
+        )
+        if not isinstance(search_result_ttl, timedelta):
+            raise TypeError("search_result_ttl must be a timedelta.")
+        self._search_result_ttl_seconds = max(0.0, search_result_ttl.total_seconds())
+        self._chapter_fetch_workers = self._validated_cache_limit(
+            "chapter_fetch_workers", chapter_fetch_workers
+        )
+        if not self._chapter_fetch_workers:
+            raise ValueError("chapter_fetch_workers must be at least one.")
+        self._chapter_fetch_pool: ThreadPoolExecutor | None = None
+        self._chapter_fetch_pool_pid = 0
         self.__get = GetBibleReference(cache_limit=reference_cache_limit)
         self._repository = RepositoryClient(
             repo_path=repo_path,
@@ -123,6 +179,20 @@ class GetBible:
         if search_limits is not None and not isinstance(search_limits, SearchLimits):
             raise TypeError("search_limits must be a SearchLimits object or null.")
         self.search_limits = search_limits or SearchLimits()
+        if not isinstance(persist_search_indexes, bool):
+            raise TypeError("persist_search_indexes must be a boolean.")
+        self._persist_search_indexes = persist_search_indexes
+        if not isinstance(select_from_snapshots, bool):
+            raise TypeError("select_from_snapshots must be a boolean.")
+        self._select_from_snapshots = select_from_snapshots
+        if not isinstance(immutable_results, bool):
+            raise TypeError("immutable_results must be a boolean.")
+        self._immutable_results = immutable_results
+        self._snapshot_chapters = 0
+        if payload_scrub_interval is not None and not isinstance(
+            payload_scrub_interval, timedelta
+        ):
+            raise TypeError("payload_scrub_interval must be a timedelta or null.")
         self._cache_ttl_seconds = max(0.0, cache_ttl.total_seconds())
         self.__books_cache: OrderedDict[str, _CacheEntry] = OrderedDict()
         self.__chapters_cache: OrderedDict[str, _CacheEntry] = OrderedDict()
@@ -132,6 +202,7 @@ class GetBible:
             "books": _CacheStats(),
             "chapters": _CacheStats(),
             "search_corpora": _CacheStats(),
+            "search_results": _CacheStats(),
         }
         self._translation_cache = TranslationCache(
             repository=self._repository,
@@ -141,8 +212,17 @@ class GetBible:
             memory_limit=translation_cache_limit,
             refresh_jitter=cache_ttl_jitter,
             require_checksums=self._require_checksums,
+            payload_verification=payload_verification,
+            payload_scrub_seconds=(
+                None
+                if payload_scrub_interval is None
+                else max(0.0, payload_scrub_interval.total_seconds())
+            ),
+            stale_while_revalidate=stale_while_revalidate,
+            payload_compression=payload_compression,
         )
         self._search_corpora: OrderedDict[str, TranslationCorpus] = OrderedDict()
+        self._search_results: OrderedDict[Hashable, _SearchResultEntry] = OrderedDict()
         self._source_coordinator = SourceCoordinator(
             cache_root=self._translation_cache.cache_dir,
             source=self._repository.repo_path,
@@ -155,24 +235,37 @@ class GetBible:
 
     def select(self, reference: str, abbreviation: str | None = 'kjv') -> dict[str, Any]:
         """Return Bible verses using the established grouped result contract."""
-        with self.source_operation():
-            abbreviation = self._validated_translation_code(abbreviation)
-            self.__check_translation(abbreviation)
-            result: dict[str, Any] = {}
-            for raw_reference in reference.split(';'):
-                ref = raw_reference.strip()
-                if not ref:
-                    raise ValueError("Invalid empty reference.")
-                try:
-                    book_reference = self.__get.ref(ref, abbreviation)
-                except ValueError as error:
-                    raise ValueError(f"Invalid reference '{ref}'.") from error
-                self.__set_verse(abbreviation, book_reference, result)
-            return result
+        return self._select_document(reference, abbreviation).to_dict()
 
     def scripture(self, reference: str, abbreviation: str | None = 'kjv') -> str:
         """Return :meth:`select` output encoded as JSON."""
-        return json.dumps(self.select(reference, abbreviation), ensure_ascii=False)
+        return self._select_document(reference, abbreviation).to_json()
+
+    def select_many(
+        self,
+        references: Iterable[str],
+        abbreviation: str | None = 'kjv',
+    ) -> list[dict[str, Any]]:
+        """Return one :meth:`select` result per reference.
+
+        Every reference is parsed before any chapter is fetched, so the
+        distinct chapters missing from memory are requested concurrently
+        instead of one round trip after another.
+        """
+        references = list(references)
+        if not references:
+            return []
+        with self.source_operation():
+            code = self._validated_translation_code(abbreviation)
+            self.__check_translation(code)
+            self._prefetch_chapters(
+                code,
+                (item for reference in references for item in reference.split(';')),
+            )
+            return [
+                self._select_document(reference, code, prefetch=False).to_dict()
+                for reference in references
+            ]
 
     def search(
         self,
@@ -186,41 +279,66 @@ class GetBible:
         :meth:`select`. ``query`` and ``matches`` add search-specific metadata
         without changing the established scripture objects.
         """
+        return self._search_document(query, abbreviation, criteria).to_dict()
+
+    def search_json(
+        self,
+        query: str,
+        abbreviation: str | None = "kjv",
+        criteria: SearchBible | dict[str, Any] | str | None = None,
+    ) -> str:
+        """Return :meth:`search` output encoded as JSON."""
+        return self._search_document(query, abbreviation, criteria).to_json()
+
+    def iter_search(
+        self,
+        query: str,
+        abbreviation: str | None = "kjv",
+        criteria: SearchBible | dict[str, Any] | str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield canonical-order search hits lazily, starting at ``offset``.
+
+        Each item combines the :meth:`search` ``matches`` metadata with the
+        book and chapter names and the verse object under ``scripture``.
+        ``limit`` and the response-volume budget do not apply; consumers stop
+        reading when they have enough. Criteria, the translation, and its index
+        are resolved before this method returns, and the stream keeps reading
+        that corpus even if the source generation later changes. The search
+        deadline covers the whole stream, excluding the time the consumer
+        holds each hit. Relevance and BM25 sorting need every match and are
+        rejected.
+        """
         with self.source_operation():
             code = self._validated_translation_code(abbreviation)
             parsed_criteria = SearchBible.from_value(criteria)
+            validate_search_request(query, parsed_criteria, self.search_limits)
             try:
                 corpus = self._search_corpus(code)
             except RepositoryResourceNotFound as error:
                 raise FileNotFoundError(f"Translation ({code}) not found.") from error
-            engine = SearchEngine(
+            hits = SearchEngine(
                 corpus,
                 lambda book: self.__get.book_number(book, code),
                 self.search_limits,
-            )
-            hits, total = engine.search(query, parsed_criteria)
-            return self._search_response(
-                query,
-                code,
-                parsed_criteria,
-                corpus,
-                hits,
-                total,
-                engine.execution_info,
-                self.search_limits.max_response_bytes,
-            )
+            ).iter_search(query, parsed_criteria)
+        return self._stream_hits(hits)
 
-    def search_json(
-        self,
-        query: str,
-        abbreviation: str | None = "kjv",
-        criteria: SearchBible | dict[str, Any] | str | None = None,
-    ) -> str:
-        """Return :meth:`search` output encoded as JSON."""
-        return json.dumps(
-            self.search(query, abbreviation, criteria),
-            ensure_ascii=False,
-        )
+    @staticmethod
+    def _stream_hits(hits: Iterator[SearchHit]) -> Iterator[dict[str, Any]]:
+        for hit in hits:
+            record = hit.record
+            yield {
+                "reference": record.reference,
+                "book_nr": record.book_nr,
+                "book_name": record.book_name,
+                "chapter": record.chapter,
+                "chapter_name": record.chapter_name,
+                "verse": record.verse["verse"],
+                "score": hit.score,
+                "occurrences": hit.occurrences,
+                "terms": list(hit.terms),
+                "scripture": record.verse,
+            }
 
     def warm_translation(
         self,
@@ -249,6 +367,103 @@ class GetBible:
             corpus.index(criteria.case_sensitive, criteria.diacritics)
             return {"abbreviation": code, **corpus.cache_info()}
 
+    def warm_translations(
+        self,
+        abbreviations: Iterable[str],
+        *,
+        variants: Iterable[Mapping[str, Any]] | None = None,
+        workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Load several translations and build their indexes in parallel.
+
+        Corpora load in this process. Index variants that are neither loaded
+        nor persisted are tokenized in a pool of ``workers`` processes and
+        installed as each build finishes. ``variants`` holds
+        ``case_sensitive``/``diacritics`` mappings and defaults to the default
+        index. Every translation reports when it became ready. More
+        translations than ``search_corpus_limit`` retains are rejected, since
+        the first corpora would be evicted before their indexes are installed.
+        """
+        codes = list(dict.fromkeys(
+            self._validated_translation_code(abbreviation) for abbreviation in abbreviations
+        ))
+        self._check_warm_capacity(codes)
+        keys = list(dict.fromkeys(
+            (criteria.case_sensitive, criteria.diacritics)
+            for criteria in (
+                SearchBible.from_value(dict(variant)) for variant in (variants or ({},))
+            )
+        ))
+        workers = self._validated_cache_limit("workers", workers)
+        if workers == 0:
+            raise ValueError("workers must be at least one.")
+
+        started = time.monotonic()
+        reports: dict[str, dict[str, Any]] = {}
+        with self.source_operation():
+            corpora: dict[str, TranslationCorpus] = {}
+            builds: list[tuple[str, tuple[bool, str], tuple[Any, ...]]] = []
+            for code in codes:
+                try:
+                    corpora[code] = self._search_corpus(code)
+                except RepositoryResourceNotFound as error:
+                    raise FileNotFoundError(f"Translation ({code}) not found.") from error
+                reports[code] = {
+                    "load_seconds": round(time.monotonic() - started, 6),
+                    "built_indexes": 0,
+                }
+                for key in keys:
+                    arguments = corpora[code].index_build(*key)
+                    if arguments is not None:
+                        builds.append((code, key, arguments))
+            pending = Counter(code for code, _, _ in builds)
+            for code in codes:
+                if not pending[code]:
+                    reports[code]["ready_seconds"] = reports[code]["load_seconds"]
+
+            def install(code: str, key: tuple[bool, str], content: bytes) -> None:
+                corpora[code].install_index(*key, content)
+                reports[code]["built_indexes"] += 1
+                pending[code] -= 1
+                if not pending[code]:
+                    reports[code]["ready_seconds"] = round(time.monotonic() - started, 6)
+
+            processes = min(workers or os.cpu_count() or 1, len(builds))
+            if processes <= 1:
+                for code, key, arguments in builds:
+                    install(code, key, encode_index_variant(*arguments))
+            else:
+                # Spawned interpreters inherit no locks or sessions from this process.
+                pool = ProcessPoolExecutor(
+                    max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+                )
+                try:
+                    futures = {
+                        pool.submit(encode_index_variant, *arguments): (code, key)
+                        for code, key, arguments in builds
+                    }
+                    for future in as_completed(futures):
+                        install(*futures[future], future.result())
+                finally:
+                    pool.shutdown(cancel_futures=True)
+            translations = {
+                code: {"abbreviation": code, **reports[code], **corpora[code].cache_info()}
+                for code in codes
+            }
+        return {
+            "workers": max(1, processes),
+            "seconds": round(time.monotonic() - started, 6),
+            "translations": translations,
+        }
+
+    def _check_warm_capacity(self, codes: Iterable[str]) -> None:
+        count = len(set(codes))
+        limit = self._search_corpus_limit
+        if limit is not None and count > limit:
+            raise ValueError(
+                f"Cannot warm {count} translations with search_corpus_limit={limit}."
+            )
+
     def cache_info(self) -> dict[str, Any]:
         """Return bounded-cache state and counters without exposing payloads."""
         with self.source_operation(), self._cache_guard:
@@ -262,17 +477,25 @@ class GetBible:
             chapters = self._cache_summary(
                 len(self.__chapters_cache), self._chapter_cache_limit, "chapters"
             )
+            chapters["from_snapshots"] = self._snapshot_chapters
             search_corpora = self._cache_summary(
                 len(self._search_corpora),
                 self._search_corpus_limit,
                 "search_corpora",
             )
+            search_results = self._cache_summary(
+                len(self._search_results),
+                self._search_result_cache_limit,
+                "search_results",
+            )
         search_corpora["translations"] = corpora
+        search_results["ttl_seconds"] = self._search_result_ttl_seconds
         return {
             "references": self.__get.cache_info(),
             "books": books,
             "chapters": chapters,
             "search_corpora": search_corpora,
+            "search_results": search_results,
             "translation_cache": self._translation_cache.cache_info(),
             "active_resource_locks": self._resource_locks.size,
             "source": self._source_coordinator.info(),
@@ -294,6 +517,10 @@ class GetBible:
 
     def close(self) -> None:
         """Close repository HTTP sessions during application shutdown."""
+        with self._cache_guard:
+            pool, self._chapter_fetch_pool = self._chapter_fetch_pool, None
+        if pool is not None and self._chapter_fetch_pool_pid == os.getpid():
+            pool.shutdown()
         self._repository.close()
 
     def __enter__(self) -> GetBible:
@@ -306,6 +533,53 @@ class GetBible:
         """Return whether ``reference`` is structurally resolvable."""
         return self.__get.valid(reference, abbreviation)
 
+    def complete(
+        self,
+        prefix: str,
+        abbreviation: str | None = 'kjv',
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Return ranked book candidates for a partially typed reference.
+
+        Candidates come from the bundled alias tables, so completion performs
+        no I/O. While a fresh translation is loaded for search, candidates
+        are limited to the books, chapters, and verses it contains, use its
+        book names, and report its last chapter and verse numbers.
+        """
+        if not isinstance(limit, int) or isinstance(limit, bool):
+            raise TypeError("limit must be an integer.")
+        if limit < 1:
+            raise ValueError("limit must be at least one.")
+        code = self._validated_translation_code(abbreviation)
+        loaded = self._loaded_corpus(code)
+        completions: list[dict[str, Any]] = []
+        for candidate in self.__get.complete(prefix, code):
+            name, chapters, verses = candidate.name, None, None
+            if loaded is not None:
+                bounds = loaded[1].bounds(candidate.book, candidate.chapter)
+                if bounds is None:
+                    continue
+                name, chapters, verses = bounds
+                if candidate.verse is not None and candidate.verse > verses:
+                    continue
+            reference = name
+            if candidate.chapter is not None:
+                reference += f" {candidate.chapter}"
+            if candidate.verse is not None:
+                reference += f":{candidate.verse}"
+            completions.append({
+                "book": candidate.book,
+                "name": name,
+                "chapter": candidate.chapter,
+                "verse": candidate.verse,
+                "reference": reference,
+                "chapters": chapters,
+                "verses": verses,
+            })
+            if len(completions) == limit:
+                break
+        return completions
+
     def valid_translation(self, abbreviation: str) -> bool:
         """Return whether a translation is available in the repository."""
         try:
@@ -315,28 +589,9 @@ class GetBible:
 
         key = f"books:{code}"
         with self.source_operation(), self._resource_locks.hold(key):
-            with self._cache_guard:
-                entry = self.__books_cache.get(code)
-            if entry is not None and self._is_fresh(entry):
-                with self._cache_guard:
-                    self.__books_cache.move_to_end(code)
-                    self._cache_stats["books"].hits += 1
+            if self._fresh_books(code):
                 return True
-            with self._cache_guard:
-                self._cache_stats["books"].misses += 1
-            try:
-                books = self._repository.fetch_json(f"{code}/books.json")
-            except RepositoryResourceNotFound:
-                return False
-            with self._cache_guard:
-                self._put_bounded(
-                    self.__books_cache,
-                    code,
-                    _CacheEntry(books, time.monotonic()),
-                    self._books_cache_limit,
-                    "books",
-                )
-            return True
+            return self._run_fetch_steps(self._books_steps(code))
 
     def valid_limit(self, limit: str) -> bool:
         """Validate the legacy compact search-limit notation."""
@@ -353,6 +608,96 @@ class GetBible:
             and target in self.TARGET_OPTIONS
         )
 
+    def _select_document(
+        self,
+        reference: str,
+        abbreviation: str | None,
+        prefetch: bool = True,
+    ) -> ScriptureDocument:
+        """Assemble one reference's verses.
+
+        ``prefetch=False`` skips fetching its chapters concurrently, for a
+        batch whose chapters were all prefetched together.
+        """
+        with self.source_operation():
+            abbreviation = self._validated_translation_code(abbreviation)
+            self.__check_translation(abbreviation)
+            references = reference.split(';')
+            if prefetch:
+                self._prefetch_chapters(abbreviation, references)
+            return self._assemble_document(
+                abbreviation,
+                references,
+                lambda book, chapter: self._chapter_entry(abbreviation, book, chapter),
+            )
+
+    def _assemble_document(
+        self,
+        abbreviation: str,
+        references: Iterable[str],
+        chapter_entry: Callable[[int, int], _CacheEntry],
+    ) -> ScriptureDocument:
+        """Group the verses of several references into one document.
+
+        ``chapter_entry`` supplies each ``(book, chapter)``. The blocking path
+        fetches it under the keyed chapter lock; :class:`~getbible.AsyncGetBible`
+        passes the entries its own fetches returned, so assembly takes no lock.
+        """
+        document = ScriptureDocument(shared=self._immutable_results)
+        for raw_reference in references:
+            ref = raw_reference.strip()
+            if not ref:
+                raise ValueError("Invalid empty reference.")
+            try:
+                book_reference = self.__get.ref(ref, abbreviation)
+            except ValueError as error:
+                raise ValueError(f"Invalid reference '{ref}'.") from error
+            self.__set_verse(
+                abbreviation,
+                book_reference,
+                chapter_entry(book_reference.book, book_reference.chapter),
+                document,
+            )
+        return document
+
+    def _search_document(
+        self,
+        query: str,
+        abbreviation: str | None,
+        criteria: SearchBible | dict[str, Any] | str | None,
+    ) -> SearchDocument:
+        with self.source_operation():
+            code = self._validated_translation_code(abbreviation)
+            parsed_criteria = SearchBible.from_value(criteria)
+            _, normalized_query, *_ = validate_search_request(
+                query, parsed_criteria, self.search_limits
+            )
+            try:
+                corpus = self._search_corpus(code)
+            except RepositoryResourceNotFound as error:
+                raise FileNotFoundError(f"Translation ({code}) not found.") from error
+            engine = SearchEngine(
+                corpus,
+                lambda book: self.__get.book_number(book, code),
+                self.search_limits,
+            )
+            ranked, execution_info = self._ranked_search(
+                engine, code, corpus, query, normalized_query, parsed_criteria
+            )
+            document = self._search_response(
+                query,
+                code,
+                parsed_criteria,
+                corpus,
+                engine.page(ranked, parsed_criteria),
+                ranked.total,
+                execution_info,
+                self.search_limits.max_response_bytes,
+            )
+            if self._immutable_results:
+                document.translation_view = corpus.translation_view
+            return document
+
     def _validated_translation_code(self, abbreviation: str | None) -> str:
         if not isinstance(abbreviation, str):
             raise TypeError("Translation abbreviation must be a string.")
@@ -371,7 +716,8 @@ class GetBible:
         if corpus is not None and corpus.sha == snapshot.sha:
             corpus.refresh_state(snapshot)
             with self._cache_guard:
-                self._search_corpora.move_to_end(abbreviation)
+                if abbreviation in self._search_corpora:
+                    self._search_corpora.move_to_end(abbreviation)
                 self._cache_stats["search_corpora"].hits += 1
             return corpus
 
@@ -381,10 +727,14 @@ class GetBible:
             if corpus is not None and corpus.sha == snapshot.sha:
                 corpus.refresh_state(snapshot)
                 with self._cache_guard:
-                    self._search_corpora.move_to_end(abbreviation)
+                    if abbreviation in self._search_corpora:
+                        self._search_corpora.move_to_end(abbreviation)
                     self._cache_stats["search_corpora"].hits += 1
                 return corpus
-            corpus = TranslationCorpus(snapshot)
+            corpus = TranslationCorpus(
+                snapshot,
+                self._translation_cache if self._persist_search_indexes else None,
+            )
             with self._cache_guard:
                 self._cache_stats["search_corpora"].misses += 1
                 self._put_bounded(
@@ -394,8 +744,61 @@ class GetBible:
                     self._search_corpus_limit,
                     "search_corpora",
                 )
+                # Rankings of a replaced translation can never be hit again.
+                for key in [key for key in self._search_results if key[0] == abbreviation]:
+                    del self._search_results[key]
             return corpus
 
+    def _ranked_search(
+        self,
+        engine: SearchEngine,
+        code: str,
+        corpus: TranslationCorpus,
+        query: str,
+        normalized_query: str,
+        criteria: SearchBible,
+    ) -> tuple[RankedMatches, dict[str, int | float | bool]]:
+        """Serve a ranking from the result cache or execute and remember it."""
+        key = (code, corpus.sha, normalized_query, criteria.with_pagination(1, 0))
+        now = time.monotonic()
+        with self._cache_guard:
+            entry = self._search_results.get(key)
+            if (
+                entry is not None
+                and now - entry.loaded_at < self._search_result_ttl_seconds
+                and entry.ranked.covers(criteria)
+            ):
+                self._search_results.move_to_end(key)
+                self._cache_stats["search_results"].hits += 1
+            else:
+                entry = None
+                self._cache_stats["search_results"].misses += 1
+        if entry is not None:
+            budget = SearchBudget(self.search_limits)
+            budget.reserve(entry.ranked.work_units + criteria.limit * 8)
+            return entry.ranked, {
+                "work_units": budget.work_units,
+                "deadline_seconds": float(self.search_limits.deadline_seconds),
+                "elapsed_seconds": budget.elapsed_seconds,
+                "expensive": criteria.expensive,
+            }
+
+        depth = criteria.offset + criteria.limit
+        if self._search_result_cache_limit != 0 and criteria.offset:
+            # First pages rank only their own depth; a later page ranks a
+            # window so the pages around it are served from this ranking.
+            depth = max(depth, self._SEARCH_RESULT_WINDOW)
+        ranked = engine.rank(query, criteria, depth)
+        with self._cache_guard:
+            self._put_bounded(
+                self._search_results,
+                key,
+                _SearchResultEntry(ranked, now),
+                self._search_result_cache_limit,
+                "search_results",
+            )
+        return ranked, engine.execution_info
+
     @staticmethod
     def _search_response(
         query: str,
@@ -406,10 +809,9 @@ class GetBible:
         total: int,
         execution_info: dict[str, int | float | bool],
         max_response_bytes: int,
-    ) -> dict[str, Any]:
-        results: dict[str, Any] = {}
-        matches: list[dict[str, Any]] = []
-        accumulated_bytes = GetBible._json_bytes(corpus.translation_metadata)
+    ) -> SearchDocument:
+        document = SearchDocument()
+        _, accumulated_bytes = encode_fragment(corpus.translation_metadata)
         if accumulated_bytes > max_response_bytes:
             raise SearchLimitError(
                 "Search translation metadata exceeds the configured response-volume budget."
@@ -417,21 +819,19 @@ class GetBible:
         for hit in hits:
             record = hit.record
             cache_key = f"{abbreviation}_{record.book_nr}_{record.chapter}"
-            if cache_key not in results:
-                results[cache_key] = deepcopy(corpus.chapter_metadata)
-                results[cache_key].update(
-                    {
-                        "book_nr": record.book_nr,
-                        "book_name": record.book_name,
-                        "chapter": record.chapter,
-                        "name": record.chapter_name,
-                        "ref": [],
-                        "verses": [],
-                    }
-                )
-                accumulated_bytes += GetBible._json_bytes(results[cache_key])
-            results[cache_key]["ref"].append(record.reference)
-            verse = deepcopy(record.verse)
+            group = document.groups.get(cache_key)
+            if group is None:
+                header = {
+                    **corpus.chapter_metadata,
+                    "book_nr": record.book_nr,
+                    "book_name": record.book_name,
+                    "chapter": record.chapter,
+                    "name": record.chapter_name,
+                }
+                group = SearchGroup(header, *encode_fragment(header))
+                document.groups[cache_key] = group
+                accumulated_bytes += group.size
+            verse_json, verse_bytes, reference_json = corpus.verse_fragment(record)
             match = {
                 "reference": record.reference,
                 "book_nr": record.book_nr,
@@ -441,22 +841,30 @@ class GetBible:
                 "occurrences": hit.occurrences,
                 "terms": list(hit.terms),
             }
-            accumulated_bytes += GetBible._json_bytes(verse)
-            accumulated_bytes += GetBible._json_bytes(match)
+            match_json, match_bytes = encode_fragment(match)
+            accumulated_bytes += verse_bytes + match_bytes
             if accumulated_bytes > max_response_bytes:
                 raise SearchLimitError(
                     "Search results exceed the configured response-volume budget."
                 )
-            results[cache_key]["verses"].append(verse)
-            matches.append(match)
+            group.refs.append(record.reference)
+            group.ref_json.append(reference_json)
+            # Paged records are materialized per request, so their verse
+            # dictionaries are already private to this response.
+            group.verses.append(record.verse)
+            group.verse_json.append(verse_json)
+            group.verse_sizes.append(verse_bytes)
+            document.matches.append(match)
+            document.match_json.append(match_json)
+            document.match_sizes.append(match_bytes)
 
         returned = len(hits)
         checked_at, stale = corpus.cache_state()
-        response = {
-            "query": {
+        document.set_query(
+            {
                 "text": query,
                 "criteria": criteria.to_dict(),
-                "translation": deepcopy(corpus.translation_metadata),
+                "translation": corpus.translation_metadata,
                 "sha": corpus.sha,
                 "total": total,
                 "offset": criteria.offset,
@@ -472,141 +880,350 @@ class GetBible:
                     "deadline_seconds": execution_info["deadline_seconds"],
                     "expensive": execution_info["expensive"],
                 },
-            },
-            "results": results,
-            "matches": matches,
-        }
-        response_bytes = len(
-            json.dumps(
-                response,
-                ensure_ascii=False,
-                separators=(",", ":"),
-            ).encode("utf-8")
+            }
         )
+        response_bytes = document.compact_size
         if response_bytes > max_response_bytes:
             raise SearchLimitError(
                 f"Search response requires {response_bytes} bytes; the configured maximum "
                 f"is {max_response_bytes}."
             )
-        return response
-
-    @staticmethod
-    def _json_bytes(value: Any) -> int:
-        return len(
-            json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-        )
+        return document
 
     def __set_verse(
         self,
         abbreviation: str,
         book_ref: BookReference,
-        result: dict[str, Any],
+        entry: _CacheEntry,
+        document: ScriptureDocument,
     ) -> None:
         cache_key = f"{abbreviation}_{book_ref.book}_{book_ref.chapter}"
-        chapter_data = self._chapter(abbreviation, book_ref.book, book_ref.chapter)
-
         for verse in book_ref.verses:
-            verse_info = chapter_data["verses"].get(str(verse))
-            if not verse_info:
+            if not entry.data["verses"].get(str(verse)):
                 raise ValueError(
                     f"Verse {verse} not found in book {book_ref.book}, "
                     f"chapter {book_ref.chapter}."
                 )
+            document.add(cache_key, book_ref.reference, entry.data, entry.fragments, str(verse))
 
-            if cache_key in result:
-                existing_verses = {str(item["verse"]) for item in result[cache_key]["verses"]}
-                if str(verse) not in existing_verses:
-                    result[cache_key]["verses"].append(deepcopy(verse_info))
-                if book_ref.reference not in result[cache_key]["ref"]:
-                    result[cache_key]["ref"].append(book_ref.reference)
-                continue
-
-            result[cache_key] = {
-                key: deepcopy(value)
-                for key, value in chapter_data.items()
-                if key != "verses"
-            }
-            result[cache_key]["ref"] = [book_ref.reference]
-            result[cache_key]["verses"] = [deepcopy(verse_info)]
-
-    def _chapter(self, abbreviation: str, book: int, chapter: int) -> dict[str, Any]:
+    def _chapter_entry(self, abbreviation: str, book: int, chapter: int) -> _CacheEntry:
         cache_key = f"{abbreviation}_{book}_{chapter}"
         with self._resource_locks.hold(f"chapter:{cache_key}"):
-            with self._cache_guard:
-                entry = self.__chapters_cache.get(cache_key)
-            if entry is not None and self._is_fresh(entry):
-                with self._cache_guard:
-                    self.__chapters_cache.move_to_end(cache_key)
-                    self._cache_stats["chapters"].hits += 1
-                return entry.data
+            entry = self._fresh_chapter(cache_key) or self._snapshot_chapter(
+                abbreviation, book, chapter
+            )
+            if entry is not None:
+                return entry
+            return self._run_fetch_steps(self._chapter_steps(abbreviation, book, chapter))
 
-            with self._cache_guard:
-                self._cache_stats["chapters"].misses += 1
+    def _run_fetch_steps(
+        self,
+        steps: _FetchSteps[_T],
+        prefetched: Mapping[_FetchRequest, Future[RepositoryFetch]] | None = None,
+    ) -> _T:
+        """Drive repository fetch steps with the blocking repository client.
+
+        Cache refreshes are generators that yield ``(relative_path,
+        validators)`` requests and receive :class:`RepositoryFetch` results,
+        so :class:`~getbible.AsyncGetBible` drives the same steps with an
+        asynchronous client. Repository errors are raised inside the steps.
+        Requests found in ``prefetched`` are answered by those futures.
+        """
+        try:
+            request = next(steps)
+            while True:
+                pending = prefetched.get(request) if prefetched else None
+                try:
+                    if pending is not None:
+                        fetched = pending.result()
+                    else:
+                        fetched = self._repository.fetch_if_changed(*request)
+                except RepositoryError as error:
+                    request = steps.throw(error)
+                else:
+                    request = steps.send(fetched)
+        except StopIteration as finished:
+            return finished.value
+
+    def _prefetch_chapters(self, abbreviation: str, references: Iterable[str]) -> None:
+        """Fetch the distinct chapters several references need concurrently.
 
+        A cold chapter's checksum and body, and a stale chapter's conditional
+        checksum, are all requested at once through a pool of at most
+        ``chapter_fetch_workers`` threads. The responses are then validated
+        and cached in reference order. Failures are left to the ordered
+        assembly, which reports them exactly as a sequential select would.
+        """
+        chapters: dict[tuple[int, int], _CacheEntry | None] = {}
+        for raw_reference in references:
+            try:
+                book_reference = self.__get.ref(raw_reference.strip(), abbreviation)
+            except ValueError:
+                continue  # Reported by the ordered assembly.
+            chapters[book_reference.book, book_reference.chapter] = None
+        with self._cache_guard:
+            for book, chapter in list(chapters):
+                entry = self.__chapters_cache.get(f"{abbreviation}_{book}_{chapter}")
+                if entry is not None and self._is_fresh(entry):
+                    del chapters[book, chapter]
+                else:
+                    chapters[book, chapter] = entry
+        for book, chapter in list(chapters):
+            if self._snapshot_chapter(abbreviation, book, chapter) is not None:
+                del chapters[book, chapter]
+        limit = self._chapter_cache_limit
+        if (
+            len(chapters) < 2
+            or self._chapter_fetch_workers == 1
+            or (limit is not None and limit < len(chapters))
+        ):
+            return
+
+        requests: list[_FetchRequest] = []
+        for (book, chapter), entry in chapters.items():
             checksum_path = f"{abbreviation}/{book}/{chapter}.sha"
-            remote_sha = self._published_checksum(
-                checksum_path,
-                f"chapter {abbreviation} {book}:{chapter}",
+            if entry is None or not entry.sha:
+                requests.append((checksum_path, None))
+                requests.append((f"{abbreviation}/{book}/{chapter}.json", None))
+            else:
+                requests.append((checksum_path, entry.validators.get(checksum_path)))
+        pool = self._chapter_fetch_executor()
+        prefetched = {
+            request: pool.submit(self._repository.fetch_if_changed, *request)
+            for request in requests
+        }
+        for book, chapter in chapters:
+            cache_key = f"{abbreviation}_{book}_{chapter}"
+            try:
+                with self._resource_locks.hold(f"chapter:{cache_key}"):
+                    if self._fresh_chapter(cache_key, record_hit=False) is None:
+                        self._run_fetch_steps(
+                            self._chapter_steps(abbreviation, book, chapter), prefetched
+                        )
+            except (GetBibleError, OSError, ValueError):
+                continue
+
+    def _chapter_fetch_executor(self) -> ThreadPoolExecutor:
+        """Return this process's chapter fetch pool.
+
+        Worker threads are reused so their repository sessions keep pooled
+        connections; a forked worker creates its own pool.
+        """
+        with self._cache_guard:
+            if self._chapter_fetch_pool is None or self._chapter_fetch_pool_pid != os.getpid():
+                self._chapter_fetch_pool = ThreadPoolExecutor(
+                    max_workers=self._chapter_fetch_workers,
+                    thread_name_prefix="getbible-chapters",
+                )
+                self._chapter_fetch_pool_pid = os.getpid()
+            return self._chapter_fetch_pool
+
+    def _fresh_books(self, code: str, *, record_hit: bool = True) -> bool:
+        """Return whether a fresh books index is cached."""
+        with self._cache_guard:
+            entry = self.__books_cache.get(code)
+            if entry is None or not self._is_fresh(entry):
+                return False
+            if record_hit:
+                self.__books_cache.move_to_end(code)
+                self._cache_stats["books"].hits += 1
+            return True
+
+    def _books_steps(self, code: str) -> _FetchSteps[bool]:
+        with self._cache_guard:
+            self._cache_stats["books"].misses += 1
+        relative_path = f"{code}/books.json"
+        try:
+            fetched = yield relative_path, None
+        except RepositoryResourceNotFound:
+            return False
+        books = self._repository.decode_json(fetched.content or b"", relative_path)
+        with self._cache_guard:
+            self._put_bounded(
+                self.__books_cache,
+                code,
+                _CacheEntry(books, time.monotonic()),
+                self._books_cache_limit,
+                "books",
             )
-            if entry is not None and entry.sha and remote_sha == entry.sha:
-                entry.loaded_at = time.monotonic()
-                with self._cache_guard:
-                    self.__chapters_cache.move_to_end(cache_key)
-                return entry.data
+        return True
+
+    def _fresh_chapter(self, cache_key: str, *, record_hit: bool = True) -> _CacheEntry | None:
+        """Return a fresh cached chapter."""
+        with self._cache_guard:
+            entry = self.__chapters_cache.get(cache_key)
+            if entry is None or not self._is_fresh(entry):
+                return None
+            if record_hit:
+                self.__chapters_cache.move_to_end(cache_key)
+                self._cache_stats["chapters"].hits += 1
+            return entry
+
+    def _snapshot_chapter(self, abbreviation: str, book: int, chapter: int) -> _CacheEntry | None:
+        """Cache a chapter from a fresh, loaded full translation, without I/O.
+
+        Only used with ``select_from_snapshots``. The chapter expires with the
+        snapshot it came from; afterwards it is fetched individually again
+        unless a search has refreshed the snapshot meanwhile.
+        """
+        if not self._select_from_snapshots:
+            return None
+        loaded = self._loaded_corpus(abbreviation)
+        if loaded is None:
+            return None
+        snapshot, corpus = loaded
+        data = corpus.chapter(book, chapter)
+        if data is None:
+            return None
+        age = max(0.0, time.time() - snapshot.checked_at)
+        entry = _CacheEntry(self._retained_chapter(data), time.monotonic() - age)
+        with self._cache_guard:
+            self._snapshot_chapters += 1
+            self._put_bounded(
+                self.__chapters_cache,
+                f"{abbreviation}_{book}_{chapter}",
+                entry,
+                self._chapter_cache_limit,
+                "chapters",
+            )
+        return entry
+
+    def _loaded_corpus(
+        self, abbreviation: str
+    ) -> tuple[TranslationSnapshot, TranslationCorpus] | None:
+        """Return a fresh in-memory translation and its search corpus, without I/O."""
+        snapshot = self._translation_cache.peek(abbreviation)
+        if snapshot is None:
+            return None
+        with self._cache_guard:
+            corpus = self._search_corpora.get(abbreviation)
+        if corpus is None or corpus.sha != snapshot.sha:
+            return None
+        return snapshot, corpus
+
+    def _chapter_steps(
+        self,
+        abbreviation: str,
+        book: int,
+        chapter: int,
+    ) -> _FetchSteps[_CacheEntry]:
+        cache_key = f"{abbreviation}_{book}_{chapter}"
+        with self._cache_guard:
+            entry = self.__chapters_cache.get(cache_key)
+            self._cache_stats["chapters"].misses += 1
 
-            relative_path = f"{abbreviation}/{book}/{chapter}.json"
+        validators: dict[str, RepositoryValidators] = {}
+        checksum_path = f"{abbreviation}/{book}/{chapter}.sha"
+        remote_sha = yield from self._published_checksum(
+            checksum_path,
+            f"chapter {abbreviation} {book}:{chapter}",
+            entry,
+            validators,
+        )
+        relative_path = f"{abbreviation}/{book}/{chapter}.json"
+        raw = None
+        if entry is not None and entry.sha and not remote_sha:
             try:
-                raw = self._repository.fetch_bytes(relative_path)
+                fetched = yield relative_path, entry.validators.get(relative_path)
             except RepositoryResourceNotFound as error:
                 raise FileNotFoundError(
                     f"Chapter:{chapter} in book:{book} for {abbreviation} not found."
                 ) from error
-            if self._require_checksums and not remote_sha:
-                raise RepositoryResponseError(
-                    f"Chapter {abbreviation} {book}:{chapter} has no required checksum."
-                )
+            if fetched.validators is not None:
+                validators[relative_path] = fetched.validators
+            raw = fetched.content
+        if entry is not None and entry.sha and (
+            remote_sha == entry.sha or (not remote_sha and raw is None)
+        ):
+            entry.loaded_at = time.monotonic()
+            entry.validators.update(validators)
+            with self._cache_guard:
+                self.__chapters_cache.move_to_end(cache_key)
+            return entry
+
+        if raw is None:
             try:
-                chapter_data = json.loads(raw)
-            except (UnicodeDecodeError, json.JSONDecodeError) as error:
-                raise CacheIntegrityError(
-                    f"Invalid chapter JSON for {abbreviation} {book}:{chapter}."
+                fetched = yield relative_path, None
+            except RepositoryResourceNotFound as error:
+                raise FileNotFoundError(
+                    f"Chapter:{chapter} in book:{book} for {abbreviation} not found."
                 ) from error
-            actual_sha = hashlib.sha1(raw, usedforsecurity=False).hexdigest()
-            if remote_sha and actual_sha != remote_sha:
-                raise CacheIntegrityError(
-                    f"Checksum mismatch for chapter {abbreviation} {book}:{chapter}: "
-                    f"expected {remote_sha}, received {actual_sha}."
-                )
-            TranslationCache.validate_chapter_payload(
-                chapter_data,
-                abbreviation,
-                book,
-                chapter,
+            if fetched.validators is not None:
+                validators[relative_path] = fetched.validators
+            raw = fetched.content or b""
+        if self._require_checksums and not remote_sha:
+            raise RepositoryResponseError(
+                f"Chapter {abbreviation} {book}:{chapter} has no required checksum."
             )
+        try:
+            chapter_data = json.loads(raw)
+        except (UnicodeDecodeError, json.JSONDecodeError) as error:
+            raise CacheIntegrityError(
+                f"Invalid chapter JSON for {abbreviation} {book}:{chapter}."
+            ) from error
+        actual_sha = hashlib.sha1(raw, usedforsecurity=False).hexdigest()
+        if remote_sha and actual_sha != remote_sha:
+            raise CacheIntegrityError(
+                f"Checksum mismatch for chapter {abbreviation} {book}:{chapter}: "
+                f"expected {remote_sha}, received {actual_sha}."
+            )
+        TranslationCache.validate_chapter_payload(
+            chapter_data,
+            abbreviation,
+            book,
+            chapter,
+        )
 
-            chapter_data["verses"] = {
-                str(verse["verse"]): verse for verse in chapter_data["verses"]
-            }
-            loaded = _CacheEntry(
-                data=chapter_data,
-                loaded_at=time.monotonic(),
-                sha=actual_sha,
+        chapter_data["verses"] = {
+            str(verse["verse"]): verse for verse in chapter_data["verses"]
+        }
+        loaded = _CacheEntry(
+            data=self._retained_chapter(chapter_data),
+            loaded_at=time.monotonic(),
+            sha=actual_sha,
+            validators=validators,
+        )
+        with self._cache_guard:
+            self._put_bounded(
+                self.__chapters_cache,
+                cache_key,
+                loaded,
+                self._chapter_cache_limit,
+                "chapters",
             )
-            with self._cache_guard:
-                self._put_bounded(
-                    self.__chapters_cache,
-                    cache_key,
-                    loaded,
-                    self._chapter_cache_limit,
-                    "chapters",
-                )
-            return chapter_data
+        return loaded
 
-    def _published_checksum(self, relative_path: str, label: str) -> str:
+    def _retained_chapter(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return chapter data as cached; read-only with ``immutable_results``."""
+        if not self._immutable_results:
+            return data
+        return {
+            name: (
+                {key: freeze(verse) for key, verse in value.items()}
+                if name == "verses"
+                else freeze(value)
+            )
+            for name, value in data.items()
+        }
+
+    def _published_checksum(
+        self,
+        relative_path: str,
+        label: str,
+        previous: _CacheEntry | None = None,
+        validators: dict[str, RepositoryValidators] | None = None,
+    ) -> _FetchSteps[str]:
+        """Return a published checksum, reusing ``previous.sha`` on a 304 reply."""
+        known = previous.validators.get(relative_path) if previous and previous.sha else None
         try:
-            checksum = self._repository.fetch_text(relative_path).strip().lower()
+            fetched = yield relative_path, known
         except RepositoryResourceNotFound:
             return ""
+        if fetched.validators is not None and validators is not None:
+            validators[relative_path] = fetched.validators
+        if fetched.unchanged and previous is not None and previous.sha:
+            return previous.sha
+        checksum = (fetched.content or b"").decode("utf-8", "replace").strip().lower()
         if not TranslationCache._valid_sha(checksum):
             raise RepositoryResponseError(f"{label.capitalize()} publishes an invalid checksum.")
         return checksum
@@ -616,6 +1233,7 @@ class GetBible:
             self.__books_cache.clear()
             self.__chapters_cache.clear()
             self._search_corpora.clear()
+            self._search_results.clear()
         self._translation_cache.set_source_generation(generation.generation)
         self._on_source_generation_changed(generation)
 
@@ -628,8 +1246,8 @@ class GetBible:
 
     def _put_bounded(
         self,
-        cache: OrderedDict[str, Any],
-        key: str,
+        cache: OrderedDict[Any, Any],
+        key: Hashable,
         value: Any,
         limit: int | None,
         category: str,
@@ -0,0 +1,205 @@
+import json
+import os
+import re
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+from functools import cache
+from types import MappingProxyType
+
+_SPACE_REMOVAL_REGEX = re.compile(r'(\d)\s+(\w)', re.UNICODE)
+
+
+def normalize_book_alias(name: str) -> str:
+    """
+    Normalize a book name for alias lookup.
+
+    Periods and spaces between numbers and words are removed, whitespace is
+    collapsed, and the NFC form is case-folded.
+
+    :param name: The book name to normalize.
+    :return: The normalized alias.
+    """
+    normalized = unicodedata.normalize("NFC", name).replace('.', '')
+    normalized = _SPACE_REMOVAL_REGEX.sub(r'\1\2', normalized)
+    normalized = " ".join(normalized.split())
+    return normalized.casefold()
+
+
+def load_book_aliases(file_path: str) -> dict[str, int]:
+    """
+    Load one translation's alias file as a normalized alias to book number table.
+
+    Alias files map book numbers to lists of names. A later duplicate alias
+    replaces an earlier one, and entries keyed by anything other than a book
+    number are ignored.
+
+    :param file_path: The path of the alias file.
+    :return: A dictionary from normalized alias to book number.
+    :raises OSError: If there is an error opening the file.
+    :raises ValueError: If there is an error decoding the JSON data.
+    """
+    return _book_aliases(_read_alias_file(file_path))
+
+
+def _read_alias_file(file_path: str) -> dict[str, list[str]]:
+    try:
+        with open(file_path, encoding='utf-8') as file:
+            data = json.load(file)
+    except OSError as error:
+        raise OSError(f"Error loading file {file_path}: {error}") from error
+    except json.JSONDecodeError as error:
+        raise ValueError(
+            f"Error decoding JSON from file {file_path}: {error}"
+        ) from error
+    return data
+
+
+def _book_aliases(data: Mapping[str, list[str]]) -> dict[str, int]:
+    return {
+        normalize_book_alias(name): int(book_number)
+        for book_number, names in data.items()
+        if book_number.isdigit()
+        for name in names
+    }
+
+
+def _book_names(data: Mapping[str, list[str]]) -> dict[int, str]:
+    # The first listed name of each book is its full display name.
+    return {
+        int(book_number): names[0]
+        for book_number, names in data.items()
+        if book_number.isdigit() and names
+    }
+
+
+class BookAliasIndex:
+    """
+    Bundled alias tables shared read-only by every book resolver in a process.
+
+    Each translation's table is loaded the first time a lookup needs it, and
+    the merged index of every alias is built on the first fallback lookup.
+    Prefix completion uses a sorted copy of a table's aliases, built on the
+    first completion in that translation.
+    Published tables are read-only mappings that are never modified again.
+    Loading is idempotent, so concurrent first lookups may both parse a file
+    but always publish equal tables, and no lock is inherited across forks.
+    """
+
+    def __init__(self, data_path: str) -> None:
+        """
+        Initialize the index over one directory of alias files.
+
+        :param data_path: The directory containing ``{translation}.json`` files.
+        """
+        self.data_path = data_path
+        self.codes = tuple(
+            filename.split('.')[0]
+            for filename in sorted(os.listdir(data_path))
+            if filename.endswith('.json')
+        )
+        self.__known = frozenset(self.codes)
+        self.__tables: dict[str, Mapping[str, int]] = {}
+        self.__names: dict[str, Mapping[int, str]] = {}
+        self.__sorted: dict[str, tuple[tuple[str, ...], tuple[int, ...]]] = {}
+        self.__candidates: Mapping[str, tuple[tuple[str, int], ...]] | None = None
+
+    def table(self, translation_code: str) -> Mapping[str, int] | None:
+        """
+        Return a translation's alias table, loading it on first use.
+
+        :param translation_code: The code for the translation.
+        :return: The normalized alias table, or None for an unknown translation.
+        :raises IOError: If there is an error loading the file.
+        """
+        table = self.__tables.get(translation_code)
+        if table is None:
+            if translation_code not in self.__known:
+                return None
+            try:
+                data = _read_alias_file(
+                    os.path.join(self.data_path, f"{translation_code}.json")
+                )
+            except OSError as error:
+                raise OSError(
+                    f"Error loading translation {translation_code}: {error}"
+                ) from error
+            # Names are published first, so a visible table implies its names.
+            self.__names[translation_code] = MappingProxyType(_book_names(data))
+            table = MappingProxyType(_book_aliases(data))
+            self.__tables[translation_code] = table
+        return table
+
+    def names(self, translation_code: str) -> Mapping[int, str] | None:
+        """
+        Return a translation's display name for each book number.
+
+        :param translation_code: The code for the translation.
+        :return: The first listed name of each book, or None for an unknown translation.
+        """
+        if self.table(translation_code) is None:
+            return None
+        return self.__names[translation_code]
+
+    def starting_with(
+        self, translation_code: str, prefix: str
+    ) -> Iterator[tuple[str, int]]:
+        """
+        Yield a translation's aliases that start with a normalized prefix.
+
+        :param translation_code: The code for the translation.
+        :param prefix: A normalized alias prefix, see :func:`normalize_book_alias`.
+        :return: ``(alias, book_number)`` pairs in alias order.
+        """
+        entries = self.__sorted.get(translation_code)
+        if entries is None:
+            table = self.table(translation_code)
+            if table is None:
+                return
+            ordered = sorted(table.items())
+            entries = (
+                tuple(alias for alias, _ in ordered),
+                tuple(number for _, number in ordered),
+            )
+            self.__sorted[translation_code] = entries
+        aliases, numbers = entries
+        for position in range(bisect_left(aliases, prefix), len(aliases)):
+            if not aliases[position].startswith(prefix):
+                return
+            yield aliases[position], numbers[position]
+
+    def __contains__(self, translation_code: object) -> bool:
+        return translation_code in self.__known
+
+    def loaded(self) -> frozenset[str]:
+        """
+        Return the codes of the translations whose tables are loaded.
+        """
+        return frozenset(self.__tables)
+
+    def candidates(self) -> Mapping[str, tuple[tuple[str, int], ...]]:
+        """
+        Return the merged index of every translation's aliases.
+
+        Each normalized alias maps to its ``(translation_code, book_number)``
+        candidates in translation code order.
+        """
+        candidates = self.__candidates
+        if candidates is None:
+            merged: dict[str, list[tuple[str, int]]] = {}
+            for code in self.codes:
+                for alias, number in self.table(code).items():
+                    merged.setdefault(alias, []).append((code, number))
+            candidates = MappingProxyType(
+                {alias: tuple(found) for alias, found in merged.items()}
+            )
+            self.__candidates = candidates
+        return candidates
+
+
+@cache
+def shared_book_aliases() -> BookAliasIndex:
+    """
+    Return the process-wide index of the bundled alias files.
+    """
+    return BookAliasIndex(os.path.join(os.path.dirname(__file__), 'data'))
@@ -1,6 +1,6 @@
-import os
+import json
 
-from .getbible_reference_trie import GetBibleReferenceTrie
+from .getbible_book_aliases import normalize_book_alias, shared_book_aliases
 
 
 class GetBibleBookNumber:
@@ -8,36 +8,17 @@ class GetBibleBookNumber:
         """
         Initialize the GetBibleBookNumber class.
 
-        Sets up the class by loading all translation tries from the data directory.
+        Every instance shares the process-wide, lazily loaded alias index, so
+        constructing a resolver reads no alias files.
         """
-        self.__tries = {}
-        self.__data_path = os.path.join(os.path.dirname(__file__), 'data')
-        self.__load_all_translations()
+        self.__aliases = shared_book_aliases()
 
-    def __load_translation(self, filename: str) -> None:
+    def __search(self, translation_code: str, alias: str) -> int | None:
         """
-        Load a translation trie from a specified file.
-
-        :param filename: The name of the file to load.
-        :raises IOError: If there is an error loading the file.
-        """
-        trie = GetBibleReferenceTrie()
-        translation_code = filename.split('.')[0]
-        try:
-            trie.load(os.path.join(self.__data_path, filename))
-        except OSError as error:
-            raise OSError(
-                f"Error loading translation {translation_code}: {error}"
-            ) from error
-        self.__tries[translation_code] = trie
-
-    def __load_all_translations(self) -> None:
+        Look up a normalized alias in one translation.
         """
-        Load all translation tries from the data directory.
-        """
-        for filename in sorted(os.listdir(self.__data_path)):
-            if filename.endswith('.json'):
-                self.__load_translation(filename)
+        table = self.__aliases.table(translation_code)
+        return table.get(alias) if table is not None else None
 
     def __valid_book_number(self, number: str) -> int | None:
         """
@@ -66,42 +47,83 @@ class GetBibleBookNumber:
         if reference.isdigit():
             return self.__valid_book_number(reference)
 
-        if not translation_code or translation_code not in self.__tries:
+        if not translation_code or translation_code not in self.__aliases:
             translation_code = 'kjv'
 
-        translation = self.__tries.get(translation_code)
-        result = translation.search(reference) if translation else None
-        if result and result.isdigit():
-            return int(result)
+        alias = normalize_book_alias(reference)
+        result = self.__search(translation_code, alias)
+        if result:
+            return result
 
         # If 'kjv' is not the original choice, try it next
         if translation_code != 'kjv':
-            translation = self.__tries.get('kjv')
-            result = translation.search(reference) if translation else None
-            if result and result.isdigit():
-                return int(result)
+            result = self.__search('kjv', alias)
+            if result:
+                return result
 
-        # Fallback to other translations
+        # Fallback to other translations through one probe of the merged index
+        candidates = self.__aliases.candidates().get(alias, ())
         if fallback_translations is None:
-            fallback_translations = [code for code in self.__tries if code != translation_code]
+            return next(
+                (number for code, number in candidates if code != translation_code), None
+            )
 
+        numbers = dict(candidates)
         for code in fallback_translations:
-            translation = self.__tries.get(code)
-            result = translation.search(reference) if translation else None
-            if result and result.isdigit():
-                return int(result)
+            if code in numbers:
+                return numbers[code]
 
         return None
 
+    def complete(self, prefix: str,
+                 translation_code: str | None = None) -> list[tuple[int, str]]:
+        """
+        Get the books with an alias that starts with a partial book name.
+
+        Aliases of the requested translation are scanned first and those of
+        'kjv' only when it has none. Books are ranked by an exact match, then
+        by their shortest matching alias, then in canonical order.
+
+        :param prefix: The partial book name to complete.
+        :param translation_code: The code for the translation to use.
+        :return: Ranked ``(book_number, name)`` pairs, where name is the
+            translation's first listed name for the book.
+        """
+        alias = normalize_book_alias(prefix)
+        if not alias:
+            return []
+        if not translation_code or translation_code not in self.__aliases:
+            translation_code = 'kjv'
+
+        for code in dict.fromkeys((translation_code, 'kjv')):
+            shortest: dict[int, int] = {}
+            for candidate, number in self.__aliases.starting_with(code, alias):
+                if len(candidate) < shortest.get(number, len(candidate) + 1):
+                    shortest[number] = len(candidate)
+            if shortest:
+                names = self.__aliases.names(code)
+                ranked = sorted(
+                    shortest,
+                    key=lambda number: (shortest[number] != len(alias), shortest[number], number),
+                )
+                return [(number, names.get(number, alias)) for number in ranked]
+        return []
+
     def dump(self, translation_code: str, filename: str) -> None:
         """
-        Dump the trie data for a specific translation to a file.
+        Dump the alias table for a specific translation to a file.
 
         :param translation_code: The code for the translation.
         :param filename: The name of the file to dump to.
         :raises ValueError: If no data is available for the specified translation.
         """
-        if translation_code in self.__tries:
-            self.__tries[translation_code].dump(filename)
-        else:
+        table = self.__aliases.table(translation_code)
+        if table is None:
             raise ValueError(f"No data available for translation: {translation_code}")
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump(
+                {alias: {'book_number': str(number)} for alias, number in table.items()},
+                file,
+                ensure_ascii=False,
+                indent=4,
+            )
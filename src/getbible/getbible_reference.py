@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import threading
 import unicodedata
 from collections import OrderedDict
@@ -10,6 +11,16 @@ from dataclasses import dataclass
 from .exceptions import ReferenceValidationError, RequestLimitError
 from .getbible_book_number import GetBibleBookNumber
 
+# Letters and digits are the only ASCII characters in categories L, M, and N.
+_ASCII_REFERENCE = re.compile(r"[A-Za-z0-9 ,:\-.']*")
+# A sanitized reference in one match: the book name, the chapter digits that
+# end it, and everything after the colon. ``\d`` is the Unicode decimal digits
+# that ``int()`` accepts.
+_REFERENCE = re.compile(r"(?P<book>.*?) *(?P<chapter>\d*)(?::(?P<verses>.*))?", re.DOTALL)
+# One comma-terminated verse part: a verse, a closed or open range, or an
+# end-only range, with spaces allowed only around the whole part.
+_VERSE_PART = re.compile(r" *(?:(\d+)(?:-(\d*))?|-(\d+)) *(,|\Z)")
+
 
 @dataclass
 class BookReference:
@@ -19,6 +30,14 @@ class BookReference:
     reference: str
 
 
+@dataclass(frozen=True)
+class ReferenceCompletion:
+    book: int
+    name: str
+    chapter: int | None = None
+    verse: int | None = None
+
+
 class GetBibleReference:
     """Resolve human scripture references into canonical book coordinates.
 
@@ -105,9 +124,45 @@ class GetBibleReference:
     def book_number(
         self, reference: str, translation_code: str | None = None
     ) -> int | None:
-        """Resolve a book name or number using the configured alias tries."""
+        """Resolve a book name or number through the flat ``BookAliasIndex`` tables."""
         return self.__get_book.number(reference, translation_code)
 
+    def complete(
+        self, prefix: str, translation_code: str | None = None
+    ) -> list[ReferenceCompletion]:
+        """Return ranked book candidates for a partially typed reference.
+
+        The book name may be incomplete; a chapter and the first verse typed
+        after it are carried over unchanged. Input the parser would reject
+        has no candidates, and nothing is cached.
+        """
+        normalized = self.__sanitize(prefix)
+        if normalized is None:
+            return []
+        book_name, chapter_text, verses_portion = _REFERENCE.fullmatch(normalized).group(
+            "book", "chapter", "verses"
+        )
+        chapter = verse = None
+        if not book_name:
+            book_name = chapter_text  # Digits alone are a partial book name.
+        elif chapter_text:
+            chapter = int(chapter_text)
+        verses_portion = (verses_portion or "").strip()
+        digits = len(verses_portion) - len(verses_portion.lstrip("0123456789"))
+        if digits:
+            verse = int(verses_portion[:digits])
+            chapter = 1 if chapter is None else chapter
+        if (
+            chapter == 0
+            or verse == 0
+            or (verse is not None and verse > self.__max_verse_number)
+        ):
+            return []
+        return [
+            ReferenceCompletion(book=number, name=name, chapter=chapter, verse=verse)
+            for number, name in self.__get_book.complete(book_name, translation_code)
+        ]
+
     def cache_info(self) -> dict[str, int | None]:
         """Return reference-cache size, limits, and counters."""
         with self.__cache_guard:
@@ -133,6 +188,8 @@ class GetBibleReference:
         ):
             return None
 
+        if normalized.isascii():
+            return normalized if _ASCII_REFERENCE.fullmatch(normalized) else None
         for character in normalized:
             category = unicodedata.category(character)
             if category[0] in {"L", "M", "N"}:
@@ -148,15 +205,18 @@ class GetBibleReference:
         normalized_reference: str,
         translation_code: str | None = None,
     ) -> BookReference | None:
-        book_chapter, verses_portion = self.__split_reference(normalized_reference)
-        book_name = self.__extract_book_name(book_chapter)
+        book_name, chapter_text, verses_portion = _REFERENCE.fullmatch(
+            normalized_reference
+        ).group("book", "chapter", "verses")
+        if not book_name:
+            book_name = chapter_text  # A book number, which is also the chapter.
         book_number = self.__get_book.number(book_name, translation_code)
         if book_number is None:
             return None
 
-        chapter_number = self.__extract_chapter(book_chapter)
+        chapter_number = int(chapter_text) if chapter_text else 1
         verses = self.__get_verses_numbers(verses_portion)
-        if chapter_number is None or verses is None:
+        if chapter_number < 1 or verses is None:
             return None
 
         return BookReference(
@@ -166,108 +226,57 @@ class GetBibleReference:
             reference=original_reference,
         )
 
-    @staticmethod
-    def __split_reference(reference: str) -> tuple[str, str]:
-        return reference.split(":", 1) if ":" in reference else (reference, "1")
-
-    @staticmethod
-    def __extract_chapter(book_chapter: str) -> int | None:
-        digits = []
-        for character in reversed(book_chapter):
-            if not character.isdigit():
-                break
-            digits.append(character)
-        if not digits:
-            return 1
-        chapter = int("".join(reversed(digits)))
-        return chapter if chapter > 0 else None
-
-    @staticmethod
-    def __extract_book_name(book_chapter: str) -> str:
-        if book_chapter.isdigit():
-            return book_chapter.strip()
-        index = len(book_chapter)
-        while index > 0 and book_chapter[index - 1].isdigit():
-            index -= 1
-        return book_chapter[:index].strip() if index < len(book_chapter) else book_chapter.strip()
-
-    def __get_verses_numbers(self, verses: str) -> list[int] | None:
+    def __get_verses_numbers(self, verses: str | None) -> list[int] | None:
         if not verses:
             return [1]
 
+        max_verses = self.__max_verses
+        max_verse_number = self.__max_verse_number
         verse_list: list[int] = []
         seen: set[int] = set()
-        for part in verses.split(","):
-            part = part.strip()
-            if not part:
+        position = 0
+        while True:
+            part = _VERSE_PART.match(verses, position)
+            if part is None:
                 return None
-            if "-" not in part:
-                if not part.isdigit():
-                    return None
-                verse = int(part)
-                if verse < 1:
-                    return None
-                if verse > self.__max_verse_number:
-                    raise RequestLimitError(
-                        f"Verse numbers cannot exceed {self.__max_verse_number}."
-                    )
-                self.__append_bounded(verse_list, seen, verse)
-                continue
-
-            if part.count("-") != 1:
-                return None
-            start_text, end_text = part.split("-", 1)
-            if start_text and end_text:
-                if not start_text.isdigit() or not end_text.isdigit():
-                    return None
+            start_text, end_text, end_only, separator = part.groups()
+            if end_text:
                 start = int(start_text)
                 end = int(end_text)
-                if start < 1 or end < 1 or start > end:
+                if start < 1 or start > end:
                     return None
-                if start > self.__max_verse_number or end > self.__max_verse_number:
+                if end > max_verse_number:
                     raise RequestLimitError(
-                        f"Verse numbers cannot exceed {self.__max_verse_number}."
+                        f"Verse numbers cannot exceed {max_verse_number}."
                     )
-                range_size = end - start + 1
-                if range_size > self.__max_verses or len(seen) + range_size > self.__max_verses:
+                if len(seen) + end - start + 1 > max_verses:
                     raise RequestLimitError(
-                        f"A reference cannot select more than {self.__max_verses} verses."
+                        f"A reference cannot select more than {max_verses} verses."
                     )
                 # The range is known to be bounded before it is materialized.
                 for verse in range(start, end + 1):
-                    self.__append_bounded(verse_list, seen, verse)
-            elif start_text.isdigit():
-                verse = int(start_text)
-                if verse < 1:
-                    return None
-                if verse > self.__max_verse_number:
-                    raise RequestLimitError(
-                        f"Verse numbers cannot exceed {self.__max_verse_number}."
-                    )
-                self.__append_bounded(verse_list, seen, verse)
-            elif end_text.isdigit():
-                verse = int(end_text)
+                    if verse not in seen:
+                        seen.add(verse)
+                        verse_list.append(verse)
+            else:
+                # A single verse, or a range open at one end.
+                verse = int(start_text if end_only is None else end_only)
                 if verse < 1:
                     return None
-                if verse > self.__max_verse_number:
+                if verse > max_verse_number:
                     raise RequestLimitError(
-                        f"Verse numbers cannot exceed {self.__max_verse_number}."
+                        f"Verse numbers cannot exceed {max_verse_number}."
                     )
-                self.__append_bounded(verse_list, seen, verse)
-            else:
-                return None
-
-        return verse_list if verse_list else None
-
-    def __append_bounded(self, values: list[int], seen: set[int], verse: int) -> None:
-        if verse in seen:
-            return
-        if len(seen) >= self.__max_verses:
-            raise RequestLimitError(
-                f"A reference cannot select more than {self.__max_verses} verses."
-            )
-        seen.add(verse)
-        values.append(verse)
+                if verse not in seen:
+                    if len(seen) >= max_verses:
+                        raise RequestLimitError(
+                            f"A reference cannot select more than {max_verses} verses."
+                        )
+                    seen.add(verse)
+                    verse_list.append(verse)
+            if not separator:
+                return verse_list
+            position = part.end()
 
     def __manage_local_cache(
         self,
@@ -6,17 +6,20 @@ import os
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import asdict, dataclass
 from datetime import timedelta
 from typing import Any
 
 from ._keyed_locks import KeyedLockPool
+from ._rendering import ScriptureDocument, SearchDocument
 from .exceptions import (
     ReferenceValidationError,
     RequestLimitError,
     TranslationNotFoundError,
 )
 from .getbible import GetBible as _BaseGetBible
+from .getbible import _CacheEntry
 from .search import SearchBible, SearchLimits, validate_search_request
 from .source_generation import PurgeCallback, SourceGeneration
 
@@ -32,6 +35,7 @@ class RequestLimits:
     max_search_offset: int = 10_000
     max_search_books: int = 83
     max_search_exclusions: int = 32
+    max_completions: int = 20
 
     def __post_init__(self) -> None:
         for name, value in asdict(self).items():
@@ -74,6 +78,16 @@ class GetBible(_BaseGetBible):
         require_checksums: bool | None = None,
         source_purge_callback: PurgeCallback | None = None,
         search_limits: SearchLimits | None = None,
+        persist_search_indexes: bool = True,
+        search_result_cache_limit: int | None = 128,
+        search_result_ttl: timedelta = timedelta(hours=1),
+        payload_verification: str = "checksum",
+        payload_scrub_interval: timedelta | None = None,
+        stale_while_revalidate: bool = False,
+        payload_compression: str | None = None,
+        chapter_fetch_workers: int = 8,
+        select_from_snapshots: bool = False,
+        immutable_results: bool = False,
     ) -> None:
         self.request_limits = request_limits or RequestLimits()
         if search_limits is None:
@@ -111,6 +125,16 @@ class GetBible(_BaseGetBible):
             require_checksums=require_checksums,
             source_purge_callback=source_purge_callback,
             search_limits=search_limits,
+            persist_search_indexes=persist_search_indexes,
+            search_result_cache_limit=search_result_cache_limit,
+            search_result_ttl=search_result_ttl,
+            payload_verification=payload_verification,
+            payload_scrub_interval=payload_scrub_interval,
+            stale_while_revalidate=stale_while_revalidate,
+            payload_compression=payload_compression,
+            chapter_fetch_workers=chapter_fetch_workers,
+            select_from_snapshots=select_from_snapshots,
+            immutable_results=immutable_results,
         )
         self._repository.max_response_bytes = self._bounded_integer(
             "max_response_bytes",
@@ -125,14 +149,55 @@ class GetBible(_BaseGetBible):
         self._negative_translation_misses = 0
         self._negative_translation_evictions = 0
 
-    def select(self, reference: str, abbreviation: str | None = "kjv") -> dict[str, Any]:
-        """Return verses after enforcing reference and total-work limits."""
+    def _select_document(
+        self,
+        reference: str,
+        abbreviation: str | None,
+        prefetch: bool = True,
+    ) -> ScriptureDocument:
+        """Select verses after enforcing reference and total-work limits."""
         code = self._validated_translation_code(abbreviation)
         self._validated_references(reference, code)
         if not self.valid_translation(code):
             raise TranslationNotFoundError(f"Translation ({code}) not found.")
         try:
-            return super().select(reference, code)
+            return super()._select_document(reference, code, prefetch)
+        except ReferenceValidationError:
+            raise
+        except ValueError as error:
+            raise ReferenceValidationError(str(error)) from error
+
+    def _assemble_document(
+        self,
+        abbreviation: str,
+        references: Iterable[str],
+        chapter_entry: Callable[[int, int], _CacheEntry],
+    ) -> ScriptureDocument:
+        """Assemble verses, reporting malformed references as validation errors."""
+        try:
+            return super()._assemble_document(abbreviation, references, chapter_entry)
+        except ReferenceValidationError:
+            raise
+        except ValueError as error:
+            raise ReferenceValidationError(str(error)) from error
+
+    def select_many(
+        self,
+        references: Iterable[str],
+        abbreviation: str | None = "kjv",
+    ) -> list[dict[str, Any]]:
+        """Select several references after applying the request limits to the batch."""
+        references = list(references)
+        if not references:
+            return []
+        if not all(isinstance(reference, str) for reference in references):
+            raise ReferenceValidationError("Scripture reference must be a string.")
+        code = self._validated_translation_code(abbreviation)
+        self._validated_references(";".join(references), code)
+        if not self.valid_translation(code):
+            raise TranslationNotFoundError(f"Translation ({code}) not found.")
+        try:
+            return super().select_many(references, code)
         except ReferenceValidationError:
             raise
         except ValueError as error:
@@ -144,6 +209,30 @@ class GetBible(_BaseGetBible):
             return False
         return super().valid_reference(reference, abbreviation)
 
+    def complete(
+        self,
+        prefix: str,
+        abbreviation: str | None = "kjv",
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Complete one bounded reference prefix with a bounded number of candidates."""
+        if not isinstance(prefix, str):
+            raise ReferenceValidationError("Scripture reference must be a string.")
+        if len(prefix) > self.request_limits.max_input_length:
+            raise RequestLimitError(
+                f"Reference input cannot exceed {self.request_limits.max_input_length} characters."
+            )
+        if (
+            isinstance(limit, int)
+            and not isinstance(limit, bool)
+            and limit > self.request_limits.max_completions
+        ):
+            raise RequestLimitError(
+                "A completion request cannot return more than "
+                f"{self.request_limits.max_completions} candidates."
+            )
+        return super().complete(prefix, abbreviation, limit)
+
     def valid_translation(self, abbreviation: str) -> bool:
         """Validate a translation with a bounded negative-result TTL cache."""
         try:
@@ -156,27 +245,46 @@ class GetBible(_BaseGetBible):
         with self._translation_validation_locks.hold(code):
             if self._negative_translation_cached(code):
                 return False
-            available = super().valid_translation(code)
-            if available:
-                with self._missing_translations_guard:
-                    self._missing_translations.pop(code, None)
-                return True
+            return self._record_translation_availability(
+                code, super().valid_translation(code)
+            )
+
+    def _record_translation_availability(self, code: str, available: bool) -> bool:
+        """Update the negative translation cache with one availability check."""
+        if available:
+            with self._missing_translations_guard:
+                self._missing_translations.pop(code, None)
+        else:
             self._remember_missing_translation(code)
-            return False
+        return available
 
-    def search(
+    def _search_document(
+        self,
+        query: str,
+        abbreviation: str | None,
+        criteria: SearchBible | dict[str, Any] | str | None,
+    ) -> SearchDocument:
+        """Search only after cheap input and criteria checks have passed."""
+        parsed = SearchBible.from_value(criteria)
+        stripped_query, *_ = validate_search_request(query, parsed, self.search_limits)
+        code = self._validated_translation_code(abbreviation)
+        if not self.valid_translation(code):
+            raise TranslationNotFoundError(f"Translation ({code}) not found.")
+        return super()._search_document(stripped_query, code, parsed)
+
+    def iter_search(
         self,
         query: str,
         abbreviation: str | None = "kjv",
         criteria: SearchBible | dict[str, Any] | str | None = None,
-    ) -> dict[str, Any]:
-        """Search only after cheap input and criteria checks have passed."""
+    ) -> Iterator[dict[str, Any]]:
+        """Stream search hits only after cheap input and criteria checks have passed."""
         parsed = SearchBible.from_value(criteria)
         stripped_query, *_ = validate_search_request(query, parsed, self.search_limits)
         code = self._validated_translation_code(abbreviation)
         if not self.valid_translation(code):
             raise TranslationNotFoundError(f"Translation ({code}) not found.")
-        return super().search(stripped_query, code, parsed)
+        return super().iter_search(stripped_query, code, parsed)
 
     def warm_translation(
         self,
@@ -195,6 +303,21 @@ class GetBible(_BaseGetBible):
             diacritics=diacritics,
         )
 
+    def warm_translations(
+        self,
+        abbreviations: Iterable[str],
+        *,
+        variants: Iterable[Mapping[str, Any]] | None = None,
+        workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Validate every translation before loading any of them."""
+        codes = [self._validated_translation_code(abbreviation) for abbreviation in abbreviations]
+        self._check_warm_capacity(codes)
+        for code in codes:
+            if not self.valid_translation(code):
+                raise TranslationNotFoundError(f"Translation ({code}) not found.")
+        return super().warm_translations(codes, variants=variants, workers=workers)
+
     def cache_info(self) -> dict[str, Any]:
         """Return base telemetry plus request and negative-cache limits."""
         state = super().cache_info()
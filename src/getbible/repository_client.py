@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import re
 import threading
+from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Any
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
 from .exceptions import (
@@ -21,13 +25,81 @@ from .exceptions import (
     RepositoryTimeoutError,
 )
 
+try:  # pragma: no cover - optional dependency of AsyncRepositoryClient.
+    import httpx
+except ImportError:  # pragma: no cover - remote async access is unavailable.
+    httpx = None
+
+_HEADERS = {
+    "User-Agent": "getbible-librarian/1.2",
+    "Accept": "application/json, text/plain;q=0.9, */*;q=0.1",
+}
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_BACKOFF_SECONDS = 120.0
+
+
+@dataclass(frozen=True, slots=True)
+class RepositoryValidators:
+    """HTTP cache validators last returned for one repository resource."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    MAX_LENGTH = 1024
+
+    @classmethod
+    def from_value(cls, value: object) -> RepositoryValidators | None:
+        """Return validators from a stored mapping, or ``None`` if unusable."""
+        if not isinstance(value, dict):
+            return None
+        fields = (value.get("etag"), value.get("last_modified"))
+        if any(
+            item is not None
+            and (
+                not isinstance(item, str)
+                or not item
+                or len(item) > cls.MAX_LENGTH
+                or not item.isprintable()
+            )
+            for item in fields
+        ):
+            return None
+        validators = cls(*fields)
+        return validators if validators.headers() else None
+
+    def headers(self) -> dict[str, str]:
+        """Return the conditional request headers for these validators."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> dict[str, str | None]:
+        """Return a JSON-friendly representation."""
+        return {"etag": self.etag, "last_modified": self.last_modified}
+
+
+@dataclass(frozen=True, slots=True)
+class RepositoryFetch:
+    """A conditionally fetched resource; ``content`` is ``None`` when unchanged."""
+
+    content: bytes | None
+    validators: RepositoryValidators | None = None
+
+    @property
+    def unchanged(self) -> bool:
+        return self.content is None
+
 
 class RepositoryClient:
     """Read bytes, text, and JSON from a repository with finite resource use.
 
     A thread-local :class:`requests.Session` keeps connection pooling efficient
     without sharing mutable ``Session`` state between application threads.
-    Remote and local responses are size-bounded before their content is returned.
+    Remote and local responses are size-bounded before their content is returned;
+    compressed transfers are bounded after decompression.
     """
 
     DEFAULT_MAX_RESPONSE_BYTES = 128 * 1024 * 1024
@@ -76,9 +148,26 @@ class RepositoryClient:
         """Return a repository resource as bytes within the configured size cap."""
         clean_relative = self._validated_relative_path(relative_path)
         if self.is_url:
-            return self._fetch_remote(clean_relative)
+            # Unconditional requests always carry content.
+            return self._fetch_remote(clean_relative).content or b""
         return self._fetch_local(clean_relative)
 
+    def fetch_if_changed(
+        self,
+        relative_path: str,
+        validators: RepositoryValidators | None = None,
+    ) -> RepositoryFetch:
+        """Return a resource unless ``validators`` show the stored copy is current.
+
+        Remote resources are requested with ``If-None-Match`` and
+        ``If-Modified-Since``; a ``304 Not Modified`` reply returns no content.
+        Local resources are always read and carry no validators.
+        """
+        clean_relative = self._validated_relative_path(relative_path)
+        if self.is_url:
+            return self._fetch_remote(clean_relative, validators)
+        return RepositoryFetch(self._fetch_local(clean_relative))
+
     def fetch_text(self, relative_path: str) -> str:
         """Return a UTF-8 repository resource as text."""
         try:
@@ -90,7 +179,10 @@ class RepositoryClient:
 
     def fetch_json(self, relative_path: str) -> dict[str, Any]:
         """Return a repository resource decoded as a JSON object."""
-        raw = self.fetch_bytes(relative_path)
+        return self.decode_json(self.fetch_bytes(relative_path), relative_path)
+
+    def decode_json(self, raw: bytes, relative_path: str) -> dict[str, Any]:
+        """Decode fetched resource bytes as a JSON object."""
         try:
             value = json.loads(raw)
         except (UnicodeDecodeError, json.JSONDecodeError) as error:
@@ -125,14 +217,35 @@ class RepositoryClient:
             if hasattr(self._thread_local, name):
                 delattr(self._thread_local, name)
 
-    def _fetch_remote(self, relative_path: str) -> bytes:
+    def _fetch_remote(
+        self,
+        relative_path: str,
+        validators: RepositoryValidators | None = None,
+    ) -> RepositoryFetch:
         url = self.location(relative_path)
         response: requests.Response | None = None
         try:
-            response = self._session().get(url, timeout=self.timeout, stream=True)
+            response = self._session().get(
+                url,
+                timeout=self.timeout,
+                stream=True,
+                headers=validators.headers() if validators is not None else None,
+            )
             if response.status_code == 404:
                 raise RepositoryResourceNotFound(f"Repository resource not found: {url}")
+            if response.status_code == 304:
+                if validators is None:
+                    raise RepositoryResponseError(f"Unexpected 304 response: {url}")
+                return RepositoryFetch(
+                    None,
+                    RepositoryValidators(
+                        response.headers.get("ETag", validators.etag),
+                        response.headers.get("Last-Modified", validators.last_modified),
+                    ),
+                )
             response.raise_for_status()
+            # Content-Length counts transferred bytes; iter_content() yields
+            # decoded bytes, so compressed bodies are bounded after decoding.
             declared_size = response.headers.get("Content-Length")
             if declared_size is not None:
                 try:
@@ -155,7 +268,15 @@ class RepositoryClient:
                         f"Repository response exceeds {self.max_response_bytes} bytes: {url}"
                     )
                 chunks.append(chunk)
-            return b"".join(chunks)
+            return RepositoryFetch(
+                b"".join(chunks),
+                RepositoryValidators.from_value(
+                    {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                    }
+                ),
+            )
         except requests.Timeout as error:
             raise RepositoryTimeoutError(f"Repository request timed out: {url}") from error
         except RepositoryError:
@@ -201,7 +322,7 @@ class RepositoryClient:
             read=self.retries,
             status=self.retries,
             backoff_factor=self.backoff_factor,
-            status_forcelist=(429, 500, 502, 503, 504),
+            status_forcelist=_RETRY_STATUSES,
             allowed_methods=frozenset({"GET"}),
             raise_on_status=False,
             respect_retry_after_header=True,
@@ -210,8 +331,10 @@ class RepositoryClient:
         session = requests.Session()
         session.headers.update(
             {
-                "User-Agent": "getbible-librarian/1.2",
-                "Accept": "application/json, text/plain;q=0.9, */*;q=0.1",
+                **_HEADERS,
+                # gzip and deflate, plus br and zstd when urllib3 has their
+                # optional decoders installed.
+                "Accept-Encoding": ACCEPT_ENCODING,
             }
         )
         session.mount("http://", adapter)
@@ -273,3 +396,155 @@ class RepositoryClient:
         if not minimum <= numeric <= maximum:
             raise ValueError(f"{name} must be between {minimum} and {maximum}.")
         return numeric
+
+
+class _RetryableResponse(RepositoryError):
+    def __init__(self, url: str, status: int, retry_after: float | None) -> None:
+        super().__init__(f"Unable to fetch {url}: HTTP {status}")
+        self.retry_after = retry_after
+
+
+class AsyncRepositoryClient:
+    """Fetch repository resources without blocking an asyncio event loop.
+
+    Paths, size limits, timeouts, and retry settings come from a blocking
+    :class:`RepositoryClient`. Remote repositories share one pooled
+    ``httpx.AsyncClient`` per event loop and require the optional ``httpx``
+    dependency; local repositories are read in a worker thread.
+    """
+
+    def __init__(self, client: RepositoryClient, max_connections: int = 100) -> None:
+        if not isinstance(client, RepositoryClient):
+            raise TypeError("client must be a RepositoryClient.")
+        self.max_connections = RepositoryClient._bounded_integer(
+            "max_connections", max_connections, minimum=1, maximum=10_000
+        )
+        if client.is_url and httpx is None:
+            raise ImportError(
+                'Asynchronous access to remote repositories requires httpx; '
+                'install "getbible[async]".'
+            )
+        self.client = client
+        # Pooled connections belong to the loop that opened them.
+        self._sessions: dict[asyncio.AbstractEventLoop, Any] = {}
+
+    async def fetch_if_changed(
+        self,
+        relative_path: str,
+        validators: RepositoryValidators | None = None,
+    ) -> RepositoryFetch:
+        """Asynchronous :meth:`RepositoryClient.fetch_if_changed`."""
+        clean_relative = self.client._validated_relative_path(relative_path)
+        if not self.client.is_url:
+            return await asyncio.to_thread(self.client.fetch_if_changed, clean_relative, validators)
+
+        url = self.client.location(clean_relative)
+        attempts = self.client.retries + 1
+        for attempt in range(attempts):
+            try:
+                return await self._fetch_remote(url, validators)
+            except (httpx.TransportError, _RetryableResponse) as error:
+                if attempt + 1 == attempts:
+                    if isinstance(error, _RetryableResponse):
+                        raise RepositoryError(str(error)) from error
+                    if isinstance(error, httpx.TimeoutException):
+                        raise RepositoryTimeoutError(
+                            f"Repository request timed out: {url}"
+                        ) from error
+                    raise RepositoryError(f"Unable to fetch {url}: {error}") from error
+                delay = self.client.backoff_factor * (2**attempt)
+                if isinstance(error, _RetryableResponse) and error.retry_after is not None:
+                    delay = error.retry_after
+                await asyncio.sleep(min(delay, _MAX_BACKOFF_SECONDS))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client of every event loop that opened one."""
+        await self._close_sessions(list(self._sessions))
+
+    async def _fetch_remote(
+        self,
+        url: str,
+        validators: RepositoryValidators | None,
+    ) -> RepositoryFetch:
+        headers = validators.headers() if validators is not None else None
+        async with (await self._session()).stream("GET", url, headers=headers) as response:
+            status = response.status_code
+            if status == 404:
+                raise RepositoryResourceNotFound(f"Repository resource not found: {url}")
+            if status == 304:
+                if validators is None:
+                    raise RepositoryResponseError(f"Unexpected 304 response: {url}")
+                return RepositoryFetch(
+                    None,
+                    RepositoryValidators(
+                        response.headers.get("ETag", validators.etag),
+                        response.headers.get("Last-Modified", validators.last_modified),
+                    ),
+                )
+            if status in _RETRY_STATUSES:
+                retry_after = response.headers.get("Retry-After", "")
+                raise _RetryableResponse(
+                    url,
+                    status,
+                    float(retry_after) if retry_after.isdigit() else None,
+                )
+            if status >= 400:
+                raise RepositoryError(f"Unable to fetch {url}: HTTP {status}")
+
+            limit = self.client.max_response_bytes
+            declared_size = response.headers.get("Content-Length", "")
+            if declared_size.isdigit() and int(declared_size) > limit:
+                raise RepositoryResponseTooLarge(
+                    f"Repository response exceeds {limit} bytes: {url}"
+                )
+            chunks: list[bytes] = []
+            size = 0
+            async for chunk in response.aiter_bytes(64 * 1024):
+                size += len(chunk)
+                if size > limit:
+                    raise RepositoryResponseTooLarge(
+                        f"Repository response exceeds {limit} bytes: {url}"
+                    )
+                chunks.append(chunk)
+            return RepositoryFetch(
+                b"".join(chunks),
+                RepositoryValidators.from_value(
+                    {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                    }
+                ),
+            )
+
+    async def _session(self) -> Any:
+        loop = asyncio.get_running_loop()
+        http = self._sessions.get(loop)
+        if http is None:
+            connect, read = self.client.timeout
+            http = self._sessions[loop] = httpx.AsyncClient(
+                headers=_HEADERS,
+                timeout=httpx.Timeout(read, connect=connect),
+                limits=httpx.Limits(max_connections=self.max_connections),
+                follow_redirects=True,
+            )
+            await self._close_sessions(
+                [other for other in list(self._sessions) if other.is_closed()]
+            )
+        return http
+
+    async def _close_sessions(self, loops: list[asyncio.AbstractEventLoop]) -> None:
+        current = asyncio.get_running_loop()
+        for loop in loops:
+            http = self._sessions.pop(loop, None)
+            if http is None:
+                continue
+            if loop is current:
+                await http.aclose()
+            elif not loop.is_closed():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(http.aclose(), loop))
+            else:
+                # A closed loop can no longer run its transports' close
+                # callbacks; dropping the client lets its sockets be collected.
+                with suppress(RuntimeError):
+                    await http.aclose()
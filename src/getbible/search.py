@@ -2,33 +2,62 @@
 
 from __future__ import annotations
 
+import heapq
+import json
+import logging
+import math
 import threading
 import time
 import unicodedata
-from array import array
-from collections import Counter
-from collections.abc import Callable, Mapping, Sequence
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Container, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field, replace
-from itertools import groupby
-from typing import Any, ClassVar
+from itertools import groupby, repeat
+from operator import add, itemgetter, mul
+from pathlib import Path
+from typing import Any, ClassVar, TypeVar
 
 import regex
+from filelock import FileLock, Timeout
 
+from ._rendering import encode_fragment, freeze
 from .exceptions import (
-    CacheIntegrityError,
     SearchDeadlineExceeded,
     SearchLimitError,
     SearchValidationError,
 )
-from .translation_cache import TranslationSnapshot
+from .search_index import (
+    INDEX_FORMAT_VERSION,
+    TRIGRAM_LENGTH,
+    SearchIndex,
+    encode_index,
+    open_index,
+)
+from .translation_cache import TranslationCache, TranslationSnapshot
+from .verse_store import (
+    VERSE_STORE_FORMAT_VERSION,
+    VerseRecord,
+    VerseStore,
+    encode_verse_store,
+    open_verse_store,
+)
+
+LOGGER = logging.getLogger(__name__)
+_Artifact = TypeVar("_Artifact", VerseStore, SearchIndex)
 
 _WORD_CHARACTER_CLASS = r"\p{L}\p{M}\p{N}"
 _TOKEN = regex.compile(rf"[{_WORD_CHARACTER_CLASS}]+(?:['’][{_WORD_CHARACTER_CLASS}]+)*")
+_WORD_RUN = regex.compile(rf"[{_WORD_CHARACTER_CLASS}]+")
 _VALID_WORDS = frozenset({"all", "any", "phrase"})
 _VALID_MATCH = frozenset({"whole_word", "substring"})
 _VALID_SCOPE = frozenset({"bible", "old_testament", "new_testament", "deuterocanon"})
 _VALID_DIACRITICS = frozenset({"sensitive", "insensitive"})
-_VALID_SORT = frozenset({"canonical", "relevance"})
+_VALID_SORT = frozenset({"canonical", "relevance", "bm25"})
+_SCORE_DIGITS = 6
+# Phrase keys pack a verse ordinal above a 32-bit token offset.
+_OFFSET_BITS = 32
+_OFFSET_MASK = (1 << _OFFSET_BITS) - 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -90,6 +119,7 @@ class SearchBudget:
         self.started_at = time.monotonic()
         self.deadline = self.started_at + float(limits.deadline_seconds)
         self.work_units = 0
+        self._paused_at: float | None = None
 
     def reserve(self, units: int) -> None:
         if not isinstance(units, int) or isinstance(units, bool) or units < 0:
@@ -103,6 +133,22 @@ class SearchBudget:
         self.work_units = max(self.work_units, units)
         self.check_deadline()
 
+    def pause(self) -> None:
+        """Stop the deadline clock while a streaming consumer holds a hit."""
+        if self._paused_at is None:
+            self._paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        """Restart the deadline clock when a streaming consumer asks for more.
+
+        The time the caller held a hit is not search work and extends the
+        deadline, but every step of a stream shares the one configured
+        deadline, so a stream cannot search for longer than a single request.
+        """
+        if self._paused_at is not None:
+            self.deadline += time.monotonic() - self._paused_at
+            self._paused_at = None
+
     def checkpoint(self, iteration: int = 0) -> None:
         if iteration % self.limits.deadline_check_interval == 0:
             self.check_deadline()
@@ -222,7 +268,7 @@ class SearchBible:
             self.match == "substring"
             or self.words in {"any", "phrase"}
             or self.proximity is not None
-            or self.sort == "relevance"
+            or self.sort != "canonical"
             or bool(self.exclude)
             or self.diacritics == "insensitive"
             or self.offset > 1_000
@@ -282,40 +328,35 @@ class SearchBible:
 SearchCriteria = SearchBible
 
 
-@dataclass(frozen=True, slots=True)
-class VerseRecord:
-    ordinal: int
-    book_nr: int
-    book_name: str
-    chapter: int
-    chapter_name: str
-    verse: dict[str, Any]
-
-    @property
-    def text(self) -> str:
-        return str(self.verse["text"])
-
-    @property
-    def reference(self) -> str:
-        return str(self.verse["name"])
-
-
 @dataclass(frozen=True, slots=True)
 class SearchHit:
     record: VerseRecord
-    score: int
+    score: float
     occurrences: int
     terms: tuple[str, ...]
 
 
-@dataclass(slots=True)
-class SearchIndex:
-    """Compact token postings and normalized verse text for one text mode."""
+@dataclass(frozen=True, slots=True)
+class RankedMatches:
+    """Ranked ``(ordinal, score, occurrences, terms)`` matches for one query.
 
-    texts: tuple[str, ...]
-    postings: dict[str, array]
-    document_frequency: dict[str, int]
-    build_work_units: int
+    ``matches`` holds at least the ranked prefix requested from
+    :meth:`SearchEngine.rank`, or every match when ``complete`` is true.
+    ``work_units`` excludes the page-size charge so any page served from the
+    same ranking reports the cost a fresh execution would have reserved.
+    """
+
+    matches: tuple[tuple[int, float, int, tuple[str, ...]], ...]
+    total: int
+    work_units: int
+
+    @property
+    def complete(self) -> bool:
+        return len(self.matches) == self.total
+
+    def covers(self, criteria: SearchBible) -> bool:
+        """Return whether the requested page can be sliced from this ranking."""
+        return self.complete or criteria.offset + criteria.limit <= len(self.matches)
 
 
 class TranslationCorpus:
@@ -324,30 +365,41 @@ class TranslationCorpus:
     _CHAPTER_METADATA = (
         "translation", "abbreviation", "lang", "language", "direction", "encoding"
     )
+    VERSE_FRAGMENT_CACHE_LIMIT: ClassVar[int] = 4096
 
-    def __init__(self, snapshot: TranslationSnapshot) -> None:
+    def __init__(
+        self,
+        snapshot: TranslationSnapshot,
+        artifacts: TranslationCache | None = None,
+    ) -> None:
         self.sha = snapshot.sha
+        self.artifacts = artifacts
         self.checked_at = snapshot.checked_at
         self.stale = snapshot.stale
         self.translation_metadata = {
             key: value for key, value in snapshot.data.items() if key != "books"
         }
+        # Read-only form returned by clients that share cached results.
+        self.translation_view = freeze(self.translation_metadata)
         self.chapter_metadata = {
             key: snapshot.data[key]
             for key in self._CHAPTER_METADATA
             if key in snapshot.data
         }
-        self.records = self._build_records(snapshot.data)
+        self.records = self._load_records(snapshot.data)
         # Charge index construction from immutable corpus characteristics so
         # the budget can reject it before normalization and tokenization begin.
-        self.index_build_work_units = len(self.records) + sum(
-            len(record.text) * 2 for record in self.records
-        )
-        self.available_books = frozenset(record.book_nr for record in self.records)
-        self.book_names = self._build_book_names(self.records)
+        self.index_build_work_units = len(self.records) + self.records.text_characters * 2
+        self.available_books = frozenset(self.records.book_names)
+        self.book_names = {
+            normalize_book_name(name): number
+            for number, name in self.records.book_names.items()
+        }
         self._variants: dict[tuple[bool, str], SearchIndex] = {}
         self._variant_lock = threading.Lock()
         self._state_lock = threading.Lock()
+        self._verse_fragments: OrderedDict[int, tuple[str, int, str]] = OrderedDict()
+        self._fragment_lock = threading.Lock()
 
     def refresh_state(self, snapshot: TranslationSnapshot) -> None:
         """Adopt freshness metadata without rebuilding unchanged verse indexes."""
@@ -374,14 +426,78 @@ class TranslationCorpus:
                 }
                 for case_sensitive, diacritics in sorted(self._variants)
             ]
+            mapped = sum(1 for index in self._variants.values() if index.mapped)
+            trigrams = sum(1 for index in self._variants.values() if index.has_trigrams)
         return {
             "sha": self.sha,
             "checked_at": checked_at,
             "stale": stale,
             "verses": len(self.records),
+            "mapped_verses": self.records.mapped,
             "indexes": variants,
+            "mapped_indexes": mapped,
+            "trigram_indexes": trigrams,
+        }
+
+    def chapter(self, book: int, chapter: int) -> dict[str, Any] | None:
+        """Return one chapter in the repository's chapter JSON shape.
+
+        ``None`` means the translation has no such chapter. Verses are keyed
+        by their number like a cached repository chapter.
+        """
+        ordinals = self.records.chapter_ordinals(book, chapter)
+        records = [self.records[ordinal] for ordinal in ordinals]
+        if not records:
+            return None
+        return {
+            **self.chapter_metadata,
+            "book_nr": book,
+            "book_name": records[0].book_name,
+            "chapter": chapter,
+            "name": records[0].chapter_name,
+            "verses": {str(record.verse["verse"]): record.verse for record in records},
         }
 
+    def bounds(self, book: int, chapter: int | None = None) -> tuple[str, int, int | None] | None:
+        """Return a book's name, last chapter, and the last verse of ``chapter``.
+
+        ``None`` means the translation has no such book or chapter. The last
+        verse is ``None`` when no chapter is given.
+        """
+        ordinals = self.records.book_ranges.get(book)
+        if not ordinals:
+            return None
+        last_verse = None
+        if chapter is not None:
+            chapter_ordinals = self.records.chapter_ordinals(book, chapter)
+            if not chapter_ordinals:
+                return None
+            last_verse = self.records.verse_numbers[chapter_ordinals[-1]]
+        return (
+            self.records.book_names[book],
+            self.records.chapters[ordinals[-1]],
+            last_verse,
+        )
+
+    def verse_fragment(self, record: VerseRecord) -> tuple[str, int, str]:
+        """Return a verse's encoded JSON, compact size, and encoded reference.
+
+        Verses are immutable for a corpus SHA, so popular verses are encoded
+        once and reused by every response that returns them.
+        """
+        with self._fragment_lock:
+            fragment = self._verse_fragments.get(record.ordinal)
+            if fragment is not None:
+                self._verse_fragments.move_to_end(record.ordinal)
+                return fragment
+        verse_json, verse_bytes = encode_fragment(record.verse)
+        fragment = (verse_json, verse_bytes, json.dumps(record.reference, ensure_ascii=False))
+        with self._fragment_lock:
+            self._verse_fragments[record.ordinal] = fragment
+            while len(self._verse_fragments) > self.VERSE_FRAGMENT_CACHE_LIMIT:
+                self._verse_fragments.popitem(last=False)
+        return fragment
+
     def index(
         self,
         case_sensitive: bool,
@@ -394,29 +510,150 @@ class TranslationCorpus:
             with self._variant_lock:
                 index = self._variants.get(key)
                 if index is None:
-                    texts = tuple(
-                        normalize_text(record.text, case_sensitive, diacritics)
-                        for record in self.records
-                    )
-                    postings: dict[str, array] = {}
-                    document_frequency: dict[str, int] = {}
-                    for ordinal, text in enumerate(texts):
-                        if budget is not None:
-                            budget.checkpoint(ordinal)
-                        tokens = _TOKEN.findall(text)
-                        for token in tokens:
-                            postings.setdefault(token, array("I")).append(ordinal)
-                        for token in set(tokens):
-                            document_frequency[token] = document_frequency.get(token, 0) + 1
-                    index = SearchIndex(
-                        texts=texts,
-                        postings=postings,
-                        document_frequency=document_frequency,
-                        build_work_units=self.index_build_work_units,
+                    index = self._load_index(
+                        case_sensitive,
+                        diacritics,
+                        lambda identity: encode_index_variant(
+                            self.records.texts(),
+                            case_sensitive,
+                            diacritics,
+                            identity,
+                            budget.checkpoint if budget is not None else None,
+                        ),
                     )
                     self._variants[key] = index
         return index
 
+    def index_build(
+        self, case_sensitive: bool, diacritics: str
+    ) -> tuple[list[str], bool, str, dict[str, Any]] | None:
+        """Adopt a loaded or persisted index variant, or describe the build it needs.
+
+        ``None`` means the variant is ready. Otherwise the picklable arguments
+        of :func:`encode_index_variant` are returned so the variant can be built
+        in another process and adopted with :meth:`install_index`.
+        """
+        key = (case_sensitive, diacritics)
+        with self._variant_lock:
+            if key in self._variants:
+                return None
+            identity = self._index_identity(case_sensitive, diacritics)
+            path = self._index_path(case_sensitive, diacritics)
+            if path is not None:
+                index = open_index(path, identity, self.index_build_work_units)
+                if index is not None:
+                    self._variants[key] = index
+                    return None
+        return list(self.records.texts()), case_sensitive, diacritics, identity
+
+    def install_index(self, case_sensitive: bool, diacritics: str, content: bytes) -> SearchIndex:
+        """Adopt serialized index bytes, persisting them like a local build."""
+        key = (case_sensitive, diacritics)
+        with self._variant_lock:
+            index = self._variants.get(key)
+            if index is None:
+                index = self._load_index(case_sensitive, diacritics, lambda identity: content)
+                self._variants[key] = index
+        return index
+
+    def _index_path(self, case_sensitive: bool, diacritics: str) -> Path | None:
+        if self.artifacts is None:
+            return None
+        variant = _index_variant_name(case_sensitive, diacritics)
+        return self.artifacts.artifact_path(
+            self.sha, f"search-v{INDEX_FORMAT_VERSION}-{variant}.idx"
+        )
+
+    def _load_records(self, data: Mapping[str, Any]) -> VerseStore:
+        """Map the persisted verse store, writing it first when absent.
+
+        A mapped store is shared through the page cache by every worker
+        process instead of each one holding its own copy of the verses.
+        """
+        identity = {"sha": self.sha}
+        path = (
+            None
+            if self.artifacts is None
+            else self.artifacts.artifact_path(
+                self.sha, f"verses-v{VERSE_STORE_FORMAT_VERSION}.store"
+            )
+        )
+        return self._mapped_artifact(
+            path,
+            lambda: open_verse_store(path, identity) if path is not None else None,
+            lambda: encode_verse_store(data, identity),
+            lambda content: VerseStore(content, identity),
+        )
+
+    def _load_index(
+        self,
+        case_sensitive: bool,
+        diacritics: str,
+        encode: Callable[[Mapping[str, Any]], bytes],
+    ) -> SearchIndex:
+        """Map a persisted index variant, building and persisting it when absent."""
+        identity = self._index_identity(case_sensitive, diacritics)
+        path = self._index_path(case_sensitive, diacritics)
+        return self._mapped_artifact(
+            path,
+            lambda: (
+                open_index(path, identity, self.index_build_work_units)
+                if path is not None
+                else None
+            ),
+            lambda: encode(identity),
+            lambda content: SearchIndex(content, identity, self.index_build_work_units),
+        )
+
+    def _mapped_artifact(
+        self,
+        path: Path | None,
+        open_mapped: Callable[[], _Artifact | None],
+        encode: Callable[[], bytes],
+        load: Callable[[bytes], _Artifact],
+    ) -> _Artifact:
+        """Open a persisted artifact, or encode, persist, and map it once.
+
+        Without a writable cache the encoded bytes are loaded in memory.
+        """
+        if path is None or self.artifacts is None:
+            return load(encode())
+        artifact = open_mapped()
+        if artifact is not None:
+            return artifact
+        content: bytes | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Workers starting together wait for one build instead of each
+            # encoding the same translation.
+            with FileLock(f"{path}.lock", timeout=self.artifacts.lock_timeout):
+                artifact = open_mapped()
+                if artifact is not None:
+                    return artifact
+                content = encode()
+                TranslationCache._write_atomic(path, content)
+            artifact = open_mapped()
+            if artifact is not None:
+                return artifact
+        except (OSError, Timeout):
+            LOGGER.warning("Unable to persist a Librarian search artifact.", exc_info=True)
+        if content is None:
+            content = encode()
+        return load(content)
+
+    def _index_identity(self, case_sensitive: bool, diacritics: str) -> dict[str, Any]:
+        # Normalization and token classes follow the interpreter's Unicode data
+        # and the regex release, so either change invalidates persisted indexes.
+        return {
+            "sha": self.sha,
+            "validation_version": TranslationCache.VALIDATION_VERSION,
+            "unicode": unicodedata.unidata_version,
+            "regex": regex.__version__,
+            "case_sensitive": case_sensitive,
+            "diacritics": diacritics,
+            "verses": len(self.records),
+        }
+
     def resolve_books(
         self,
         requested: Sequence[int | str],
@@ -441,45 +678,6 @@ class TranslationCorpus:
             resolved.add(number)
         return frozenset(resolved)
 
-    @staticmethod
-    def _build_records(data: dict[str, Any]) -> tuple[VerseRecord, ...]:
-        records: list[VerseRecord] = []
-        ordinal = 0
-        try:
-            books = sorted(data["books"], key=lambda item: int(item["nr"]))
-            for book in books:
-                book_nr = int(book["nr"])
-                book_name = str(book["name"])
-                chapters = sorted(book["chapters"], key=lambda item: int(item["chapter"]))
-                for chapter in chapters:
-                    chapter_nr = int(chapter["chapter"])
-                    chapter_name = str(chapter["name"])
-                    verses = sorted(chapter["verses"], key=lambda item: int(item["verse"]))
-                    for verse in verses:
-                        if not all(key in verse for key in ("chapter", "verse", "name", "text")):
-                            raise KeyError("verse")
-                        records.append(
-                            VerseRecord(
-                                ordinal=ordinal,
-                                book_nr=book_nr,
-                                book_name=book_name,
-                                chapter=chapter_nr,
-                                chapter_name=chapter_name,
-                                verse=dict(verse),
-                            )
-                        )
-                        ordinal += 1
-        except (KeyError, TypeError, ValueError) as error:
-            raise CacheIntegrityError("Translation contains invalid book or verse data.") from error
-        return tuple(records)
-
-    @staticmethod
-    def _build_book_names(records: Sequence[VerseRecord]) -> dict[str, int]:
-        names: dict[str, int] = {}
-        for record in records:
-            names[normalize_book_name(record.book_name)] = record.book_nr
-        return names
-
 
 def validate_search_request(
     query: object,
@@ -570,6 +768,11 @@ class SearchEngine:
         query: str,
         criteria: SearchBible,
     ) -> tuple[list[SearchHit], int]:
+        ranked = self.rank(query, criteria, criteria.offset + criteria.limit)
+        return self.page(ranked, criteria), ranked.total
+
+    def rank(self, query: str, criteria: SearchBible, depth: int) -> RankedMatches:
+        """Rank matches, keeping at least the first ``depth`` of them."""
         budget = SearchBudget(self.limits)
         query, normalized_query, query_terms, excluded, excluded_terms = (
             validate_search_request(query, criteria, self.limits)
@@ -588,90 +791,219 @@ class SearchEngine:
         budget.reserve(
             self._estimate_work(
                 index,
+                normalized_query,
                 query_terms,
                 excluded_terms,
                 book_filter,
                 criteria,
+                depth,
                 budget,
             )
         )
-        if (
-            len(query_terms) == 1
-            and criteria.match == "whole_word"
-            and not excluded
-            and criteria.proximity is None
-            and criteria.sort == "canonical"
-        ):
-            result = self._single_term_search(
-                index, query_terms[0], book_filter, criteria, budget
+        single_term = _single_term(criteria, query_terms, excluded)
+        whole_corpus = book_filter == self.corpus.available_books
+        if single_term and criteria.sort == "canonical":
+            matches, total = self._single_term_search(
+                index, query_terms[0], book_filter, depth, budget
+            )
+        elif single_term and criteria.words != "phrase":
+            # Ranked phrases keep matching the word inside apostrophe-joined
+            # tokens, as the phrase matcher always has.
+            matches, total = self._single_term_top(
+                index, query_terms[0], book_filter, depth, budget, criteria.sort
             )
-            self._finish_execution(budget, criteria)
-            return result
+        else:
+            matcher = _Matcher(criteria, normalized_query, query_terms, excluded, budget)
+            eligible = None
+            if not whole_corpus:
+                eligible = self.corpus.records.ordinals_for_books(book_filter)
+            matched = matcher.search(index, eligible)
+            total = len(matched)
+            if criteria.sort != "canonical":
+                matches = _top_matches(
+                    ((ordinal, *match) for ordinal, match in matched.items()), depth
+                )
+            else:
+                matches = tuple(
+                    (ordinal, score, occurrences, terms)
+                    for ordinal, (score, occurrences, terms) in sorted(matched.items())[:depth]
+                )
+        self._finish_execution(budget, criteria)
+        return RankedMatches(matches, total, budget.work_units - criteria.limit * 8)
+
+    def iter_search(self, query: str, criteria: SearchBible) -> Iterator[SearchHit]:
+        """Return canonical-order hits from ``criteria.offset`` as a lazy stream.
 
+        Validation, index loading, and the work reservation happen before this
+        method returns. Matching then advances through merged postings only as
+        far as the consumer reads, and ``criteria.limit`` is not applied.
+        """
+        if criteria.sort != "canonical":
+            raise SearchValidationError("Streaming search only supports canonical order.")
+        budget = SearchBudget(self.limits)
+        query, normalized_query, query_terms, excluded, excluded_terms = (
+            validate_search_request(query, criteria, self.limits)
+        )
+        book_filter = self._book_filter(criteria)
+        budget.reserve(self.corpus.index_build_work_units + len(self.corpus.records))
+        index = self.corpus.index(criteria.case_sensitive, criteria.diacritics, budget)
+        budget.reserve(
+            self._estimate_work(
+                index,
+                normalized_query,
+                query_terms,
+                excluded_terms,
+                book_filter,
+                criteria,
+                criteria.offset + criteria.limit,
+                budget,
+            )
+            - criteria.limit * 8
+        )
         matcher = _Matcher(criteria, normalized_query, query_terms, excluded, budget)
-        eligible = None
-        if book_filter != self.corpus.available_books:
-            selected_ordinals: set[int] = set()
-            for ordinal, record in enumerate(self.corpus.records):
-                budget.checkpoint(ordinal)
-                if record.book_nr in book_filter:
-                    selected_ordinals.add(record.ordinal)
-            eligible = frozenset(selected_ordinals)
-        matched = matcher.search(index, eligible)
-        hits = [
+        budget.pause()  # Until the consumer reads the first hit.
+        return self._stream(
+            matcher.stream(index, self._eligible(book_filter)), criteria.offset, budget
+        )
+
+    def _eligible(self, book_filter: frozenset[int]) -> Callable[[int], bool] | None:
+        if book_filter == self.corpus.available_books:
+            return None
+        book_numbers = self.corpus.records.book_numbers
+
+        def eligible(ordinal: int) -> bool:
+            return book_numbers[ordinal] in book_filter
+
+        return eligible
+
+    def _stream(
+        self,
+        matches: Iterator[tuple[int, int, int, tuple[str, ...]]],
+        offset: int,
+        budget: SearchBudget,
+    ) -> Iterator[SearchHit]:
+        budget.resume()
+        for position, (ordinal, score, occurrences, terms) in enumerate(matches):
+            if position < offset:
+                continue
+            budget.pause()
+            yield SearchHit(self.corpus.records[ordinal], score, occurrences, terms)
+            budget.resume()
+
+    def page(self, ranked: RankedMatches, criteria: SearchBible) -> list[SearchHit]:
+        """Materialize records for one requested page of a ranking."""
+        return [
             SearchHit(self.corpus.records[ordinal], score, occurrences, terms)
-            for ordinal, (score, occurrences, terms) in sorted(matched.items())
+            for ordinal, score, occurrences, terms in ranked.matches[
+                criteria.offset:criteria.offset + criteria.limit
+            ]
         ]
 
-        if criteria.sort == "relevance":
-            hits.sort(key=lambda hit: (-hit.score, hit.record.ordinal))
-        total = len(hits)
-        result = hits[criteria.offset:criteria.offset + criteria.limit], total
-        self._finish_execution(budget, criteria)
-        return result
-
     def _single_term_search(
         self,
         index: SearchIndex,
         term: str,
         book_filter: frozenset[int],
-        criteria: SearchBible,
+        depth: int,
         budget: SearchBudget,
-    ) -> tuple[list[SearchHit], int]:
-        selected: list[SearchHit] = []
+    ) -> tuple[tuple[tuple[int, int, int, tuple[str, ...]], ...], int]:
+        selected: list[tuple[int, int, int, tuple[str, ...]]] = []
         whole_corpus = book_filter == self.corpus.available_books
         total = index.document_frequency.get(term, 0) if whole_corpus else 0
         matched_position = 0
-        page_end = criteria.offset + criteria.limit
+        terms = (term,)
+        book_numbers = self.corpus.records.book_numbers
         for ordinal, occurrences_group in groupby(index.postings.get(term, ())):
             budget.checkpoint(matched_position)
             occurrences = sum(1 for _ in occurrences_group)
-            record = self.corpus.records[ordinal]
-            if record.book_nr not in book_filter:
+            if book_numbers[ordinal] not in book_filter:
                 continue
-            if criteria.offset <= matched_position < page_end:
-                selected.append(
-                    SearchHit(
-                        record=record,
-                        score=occurrences,
-                        occurrences=occurrences,
-                        terms=(term,),
-                    )
-                )
+            if matched_position < depth:
+                selected.append((ordinal, occurrences, occurrences, terms))
             matched_position += 1
-            if whole_corpus and matched_position >= page_end:
+            if whole_corpus and matched_position >= depth:
                 break
         if not whole_corpus:
             total = matched_position
-        return selected, total
+        return tuple(selected), total
+
+    def _single_term_top(
+        self,
+        index: SearchIndex,
+        term: str,
+        book_filter: frozenset[int],
+        depth: int,
+        budget: SearchBudget,
+        sort: str,
+    ) -> tuple[tuple[tuple[int, float, int, tuple[str, ...]], ...], int]:
+        """Rank one whole-word term without sorting every match.
+
+        Postings arrive in canonical order, so a later verse only displaces the
+        weakest kept match with a strictly higher score. Across the whole
+        corpus the total is the document frequency, and blocks whose score
+        bound cannot beat that match are skipped unread. Book filters read
+        only the posting ranges of the selected books.
+        """
+        postings = index.postings.get(term, ())
+        scorer = _BM25(index) if sort == "bm25" else None
+        idf = scorer.idf(index.document_frequency.get(term, 0)) if scorer else 0.0
+        heap: list[tuple[float, int, int, tuple[str, ...]]] = []
+        terms = (term,)
+
+        def scan(start: int, end: int, position: int) -> int:
+            """Offer each verse in ``postings[start:end]`` and return the verses read."""
+            verses = 0
+            while start < end:
+                budget.checkpoint(position + verses)
+                ordinal = postings[start]
+                following = bisect_right(postings, ordinal, start + 1, end)
+                occurrences = following - start
+                start = following
+                verses += 1
+                score: float = (
+                    occurrences if scorer is None else scorer.weight(idf, occurrences, ordinal)
+                )
+                if len(heap) >= depth and score <= heap[0][0]:
+                    continue
+                if scorer is not None:
+                    score = round(score, _SCORE_DIGITS)
+                _offer(heap, depth, (ordinal, score, occurrences, terms))
+            return verses
+
+        position = 0
+        if book_filter == self.corpus.available_books:
+            start = 0
+            for end, highest, shortest in index.score_blocks(term):
+                budget.checkpoint(position)
+                bound = highest if scorer is None else scorer.bound(idf, highest, shortest)
+                if depth > 0 and (len(heap) < depth or bound > heap[0][0]):
+                    position += scan(start, end, position)
+                start = end
+            return _ranked(heap), index.document_frequency.get(term, 0)
+
+        total = 0
+        book_ranges = self.corpus.records.book_ranges
+        for book in sorted(book_filter):
+            verses = book_ranges[book]
+            start = bisect_left(postings, verses.start)
+            end = bisect_left(postings, verses.stop, start)
+            if depth > 0:
+                counted = scan(start, end, position)
+            else:
+                counted = sum(1 for _ in groupby(postings[start:end]))
+            total += counted
+            position += counted
+        return _ranked(heap), total
 
     def _estimate_work(
         self,
         index: SearchIndex,
+        normalized_query: str,
         query_terms: tuple[str, ...],
         excluded_terms: tuple[str, ...],
         book_filter: frozenset[int],
         criteria: SearchBible,
+        depth: int,
         budget: SearchBudget,
     ) -> int:
         terms = (*query_terms, *excluded_terms)
@@ -680,23 +1012,46 @@ class SearchEngine:
             units += len(self.corpus.records)
 
         if criteria.match == "substring":
-            for position, (token, ordinals) in enumerate(index.postings.items()):
+            # The vocabulary trigram map is charged whether or not it is built.
+            units += index.vocabulary_characters
+            for position, term in enumerate(terms):
                 budget.checkpoint(position)
-                for term in terms:
-                    units += 1 + min(len(token), len(term))
-                    if term in token:
-                        units += len(ordinals)
+                lookup = index.find_substring(term)
+                units += lookup.work_units
+                units += sum(len(index.postings[token]) for token in lookup.tokens)
             if criteria.words == "phrase":
-                units += sum(len(text) for text in index.texts)
+                # Only verses holding the anchor's tokens are tested, but never
+                # more text than a scan of the whole translation.
+                anchor = _phrase_anchor(normalized_query)
+                verified = index.text_characters
+                if anchor is not None:
+                    lookup = index.find_substring(anchor)
+                    verse_characters = -(-index.text_characters // max(1, len(index.texts)))
+                    units += lookup.work_units
+                    verified = min(
+                        verified,
+                        verse_characters
+                        * sum(len(index.postings[token]) for token in lookup.tokens),
+                    )
+                units += verified
         else:
             units += sum(len(index.postings.get(term, ())) for term in terms)
             if criteria.words == "phrase":
+                # Verses holding an apostrophe-joined token are checked on their text.
                 units += sum(len(index.postings.get(term, ())) for term in query_terms)
+                units += len(index.joined_ordinals())
 
         if criteria.proximity is not None:
-            units += len(self.corpus.records) * max(1, len(query_terms))
-        if criteria.sort == "relevance":
-            units += len(self.corpus.records) * max(1, len(self.corpus.records).bit_length())
+            # Matched verses merge the query terms' positions rather than
+            # re-tokenizing their text.
+            units += 2 * sum(len(index.postings.get(term, ())) for term in query_terms)
+        if criteria.sort != "canonical":
+            # Candidates pass through a heap holding the ranked depth of matches.
+            if criteria.match == "whole_word":
+                candidates = sum(index.document_frequency.get(term, 0) for term in query_terms)
+            else:
+                candidates = len(self.corpus.records)
+            units += min(candidates, len(self.corpus.records)) * max(1, depth.bit_length())
         units += criteria.limit * 8
         return units
 
@@ -725,6 +1080,34 @@ class SearchEngine:
         return frozenset(scoped)
 
 
+class _BM25:
+    """Okapi BM25 term weights over one index's precomputed verse lengths."""
+
+    K1 = 1.2
+    B = 0.75
+
+    __slots__ = ("_lengths", "_average", "_verses")
+
+    def __init__(self, index: SearchIndex) -> None:
+        self._lengths = index.verse_lengths
+        self._average = index.average_length or 1.0
+        self._verses = len(index.verse_lengths)
+
+    def idf(self, document_frequency: int) -> float:
+        return math.log(
+            1 + (self._verses - document_frequency + 0.5) / (document_frequency + 0.5)
+        )
+
+    def weight(self, idf: float, occurrences: int, ordinal: int) -> float:
+        norm = self.K1 * (1 - self.B + self.B * self._lengths[ordinal] / self._average)
+        return idf * occurrences * (self.K1 + 1) / (occurrences + norm)
+
+    def bound(self, idf: float, occurrences: int, length: int) -> float:
+        """Return the largest weight for up to ``occurrences`` in verses of ``length`` or more."""
+        norm = self.K1 * (1 - self.B + self.B * length / self._average)
+        return idf * occurrences * (self.K1 + 1) / (occurrences + norm)
+
+
 class _Matcher:
     def __init__(
         self,
@@ -750,7 +1133,7 @@ class _Matcher:
         self,
         index: SearchIndex,
         eligible: frozenset[int] | None,
-    ) -> dict[int, tuple[int, int, tuple[str, ...]]]:
+    ) -> dict[int, tuple[float, int, tuple[str, ...]]]:
         if self.criteria.words == "phrase":
             matches = self._phrase_matches(index, eligible)
         else:
@@ -762,48 +1145,159 @@ class _Matcher:
             matches.pop(ordinal, None)
 
         if self.criteria.proximity is not None:
-            nearby: dict[int, tuple[int, int, tuple[str, ...]]] = {}
+            events = self._verse_events(index, matches)
+            nearby: dict[int, tuple[float, int, tuple[str, ...]]] = {}
             for position, (ordinal, match) in enumerate(matches.items()):
                 self.budget.checkpoint(position)
-                if self._within_proximity(index.texts[ordinal]):
+                if self._window_fits(sorted(events.get(ordinal, ()))):
                     nearby[ordinal] = match
             matches = nearby
         return matches
 
-    def _phrase_matches(
+    def stream(
         self,
         index: SearchIndex,
-        eligible: frozenset[int] | None,
-    ) -> dict[int, tuple[int, int, tuple[str, ...]]]:
-        if self.criteria.match == "substring":
-            candidates = eligible if eligible is not None else range(len(index.texts))
+        eligible: Callable[[int], bool] | None,
+    ) -> Iterator[tuple[int, int, int, tuple[str, ...]]]:
+        """Yield the same matches as :meth:`search`, lazily and in canonical order."""
+        if self.criteria.words == "phrase" and not _single_term(
+            self.criteria, self.terms, self.excluded
+        ):
+            candidates = self._phrase_stream(index, eligible)
         else:
-            posting_sets = [set(index.postings.get(term, ())) for term in self.terms]
-            if not posting_sets or any(not values for values in posting_sets):
-                return {}
-            candidates = set.intersection(*posting_sets)
-            if eligible is not None:
-                candidates.intersection_update(eligible)
+            candidates = self._word_stream(index, eligible)
+        excluded = _unique(
+            heapq.merge(
+                *(
+                    (ordinal for ordinal, _ in self._term_stream(index, term))
+                    for term in self.excluded_tokens
+                )
+            )
+        )
+        next_excluded = next(excluded, None)
+        for position, match in enumerate(candidates):
+            self.budget.checkpoint(position)
+            ordinal = match[0]
+            while next_excluded is not None and next_excluded < ordinal:
+                next_excluded = next(excluded, None)
+            if next_excluded == ordinal:
+                continue
+            if self.criteria.proximity is not None and not self._window_fits(
+                sorted(
+                    (offset, term)
+                    for term in dict.fromkeys(self.terms)
+                    for offset in index.token_positions(term, ordinal)
+                )
+            ):
+                continue
+            yield match
 
-        matches: dict[int, tuple[int, int, tuple[str, ...]]] = {}
+    def _phrase_stream(
+        self,
+        index: SearchIndex,
+        eligible: Callable[[int], bool] | None,
+    ) -> Iterator[tuple[int, int, int, tuple[str, ...]]]:
+        if self.criteria.match == "substring":
+            candidates = self._phrase_candidates(index) or iter(range(len(index.texts)))
+        else:
+            distinct = tuple(dict.fromkeys(self.terms))
+            candidates = _intersection(
+                [
+                    (ordinal for ordinal, _ in self._term_stream(index, term))
+                    for term in distinct
+                ]
+            )
         for position, ordinal in enumerate(candidates):
             self.budget.checkpoint(position)
-            text = index.texts[ordinal]
+            if eligible is not None and not eligible(ordinal):
+                continue
             occurrences = (
-                text.count(self.query)
+                index.texts[ordinal].count(self.query)
                 if self.criteria.match == "substring"
-                else len(self.phrase_pattern.findall(text))
+                else self._phrase_occurrences(index, ordinal)
             )
+            if occurrences:
+                yield ordinal, occurrences * max(1, len(self.terms)), occurrences, self.terms
+
+    def _word_stream(
+        self,
+        index: SearchIndex,
+        eligible: Callable[[int], bool] | None,
+    ) -> Iterator[tuple[int, int, int, tuple[str, ...]]]:
+        streams = [
+            _tagged(self._term_stream(index, term), position)
+            for position, term in enumerate(self.terms)
+        ]
+        required = len(self.terms) if self.criteria.words == "all" else 1
+        for ordinal, group in groupby(heapq.merge(*streams), key=itemgetter(0)):
+            counts = [0] * len(self.terms)
+            for _, position, count in group:
+                counts[position] = count
+            if sum(1 for count in counts if count) < required:
+                continue
+            if eligible is not None and not eligible(ordinal):
+                continue
+            terms = tuple(
+                term for term, count in zip(self.terms, counts, strict=True) if count > 0
+            )
+            occurrences = sum(counts)
+            yield ordinal, occurrences, occurrences, terms
+
+    def _term_stream(self, index: SearchIndex, term: str) -> Iterator[tuple[int, int]]:
+        """Yield ``(ordinal, occurrences)`` for one term in ascending ordinal order."""
+        if self.criteria.match == "whole_word":
+            postings: Iterator[int] = iter(index.postings.get(term, ()))
+        else:
+            postings = heapq.merge(
+                *(index.postings[token] for token in index.find_substring(term).tokens)
+            )
+        for ordinal, occurrences in groupby(postings):
+            yield ordinal, sum(1 for _ in occurrences)
+
+    def _phrase_matches(
+        self,
+        index: SearchIndex,
+        eligible: frozenset[int] | None,
+    ) -> dict[int, tuple[float, int, tuple[str, ...]]]:
+        if self.criteria.match == "substring":
+            anchored = self._phrase_candidates(index)
+            if anchored is None:
+                candidates = eligible if eligible is not None else range(len(index.texts))
+            elif eligible is None:
+                candidates = anchored
+            else:
+                candidates = (ordinal for ordinal in anchored if ordinal in eligible)
+            counts: Iterable[tuple[int, int]] = (
+                (ordinal, index.texts[ordinal].count(self.query)) for ordinal in candidates
+            )
+        else:
+            counts = self._phrase_counts(index, eligible).items()
+
+        matches: dict[int, tuple[float, int, tuple[str, ...]]] = {}
+        for position, (ordinal, occurrences) in enumerate(counts):
+            self.budget.checkpoint(position)
             if occurrences:
                 score = occurrences * max(1, len(self.terms))
                 matches[ordinal] = (score, occurrences, self.terms)
+        if self.criteria.sort == "bm25":
+            # The phrase is scored as one term occurring in every matched verse.
+            scorer = _BM25(index)
+            idf = scorer.idf(len(matches))
+            matches = {
+                ordinal: (
+                    round(scorer.weight(idf, occurrences, ordinal), _SCORE_DIGITS),
+                    occurrences,
+                    terms,
+                )
+                for ordinal, (_, occurrences, terms) in matches.items()
+            }
         return matches
 
     def _word_matches(
         self,
         index: SearchIndex,
         eligible: frozenset[int] | None,
-    ) -> dict[int, tuple[int, int, tuple[str, ...]]]:
+    ) -> dict[int, tuple[float, int, tuple[str, ...]]]:
         per_term = [self._posting_counts(index, term) for term in self.terms]
         ordinal_sets = [set(counts) for counts in per_term]
         if self.criteria.words == "all":
@@ -815,7 +1309,9 @@ class _Matcher:
         if eligible is not None:
             candidates.intersection_update(eligible)
 
-        matches: dict[int, tuple[int, int, tuple[str, ...]]] = {}
+        scorer = _BM25(index) if self.criteria.sort == "bm25" else None
+        weights = [scorer.idf(len(values)) if scorer else 0.0 for values in per_term]
+        matches: dict[int, tuple[float, int, tuple[str, ...]]] = {}
         for position, ordinal in enumerate(candidates):
             self.budget.checkpoint(position)
             counts = tuple(values.get(ordinal, 0) for values in per_term)
@@ -825,19 +1321,42 @@ class _Matcher:
                 if count > 0
             )
             occurrences = sum(counts)
-            matches[ordinal] = (occurrences, occurrences, terms)
+            score: float = occurrences
+            if scorer is not None:
+                score = 0.0
+                for idf, count in zip(weights, counts, strict=True):
+                    if count:
+                        score += scorer.weight(idf, count, ordinal)
+                score = round(score, _SCORE_DIGITS)
+            matches[ordinal] = (score, occurrences, terms)
         return matches
 
     def _posting_counts(self, index: SearchIndex, term: str) -> Counter[int]:
         if self.criteria.match == "whole_word":
             return Counter(index.postings.get(term, ()))
         counts: Counter[int] = Counter()
-        for position, (token, ordinals) in enumerate(index.postings.items()):
+        for position, token in enumerate(index.find_substring(term).tokens):
             self.budget.checkpoint(position)
-            if term in token:
-                counts.update(ordinals)
+            counts.update(index.postings[token])
         return counts
 
+    def _phrase_candidates(self, index: SearchIndex) -> Iterator[int] | None:
+        """Yield ascending verse ordinals that can contain the substring phrase.
+
+        Any run of word characters in the phrase lies inside one token of a
+        matching verse, so the verses holding a vocabulary token that contains
+        the longest run are a complete candidate set. ``None`` means no run is
+        long enough for a trigram lookup and every verse must be tested.
+        """
+        anchor = _phrase_anchor(self.query)
+        if anchor is None:
+            return None
+        return _unique(
+            heapq.merge(
+                *(index.postings[token] for token in index.find_substring(anchor).tokens)
+            )
+        )
+
     def _excluded_ordinals(self, index: SearchIndex) -> set[int]:
         excluded: set[int] = set()
         for position, term in enumerate(self.excluded_tokens):
@@ -845,30 +1364,131 @@ class _Matcher:
             excluded.update(self._posting_counts(index, term))
         return excluded
 
-    def _within_proximity(self, text: str) -> bool:
+    def _phrase_occurrences(self, index: SearchIndex, ordinal: int) -> int:
+        """Count non-overlapping runs of the phrase terms at consecutive token offsets."""
+        if ordinal in index.joined_ordinals():
+            return len(self.phrase_pattern.findall(index.texts[ordinal]))
+        first, *following = (index.token_positions(term, ordinal) for term in self.terms)
+        later = [frozenset(offsets) for offsets in following]
+        occurrences = 0
+        next_start = 0
+        for position, start in enumerate(first):
+            self.budget.checkpoint(position)
+            if start < next_start:
+                continue
+            if all(
+                start + distance in offsets
+                for distance, offsets in enumerate(later, start=1)
+            ):
+                occurrences += 1
+                next_start = start + len(self.terms)
+        return occurrences
+
+    def _phrase_counts(
+        self,
+        index: SearchIndex,
+        eligible: frozenset[int] | None,
+    ) -> dict[int, int]:
+        """Count non-overlapping phrase runs per verse in one pass over each term.
+
+        Every ``(ordinal, offset)`` pair of a term is keyed by the verse and the
+        offset at which the phrase would start there, so the starts shared by
+        all terms are the phrase runs. The rarest term is keyed first. A
+        phrase may end inside an apostrophe-joined token such as ``lord's``,
+        so verses holding one are counted on their text instead.
+        """
+        if any(term not in index.postings for term in self.terms):
+            return {}
+        joined = index.joined_ordinals()
+        counts: dict[int, int] = {}
+        for position, ordinal in enumerate(sorted(joined)):
+            self.budget.checkpoint(position)
+            if (eligible is not None and ordinal not in eligible) or not all(
+                index.token_positions(term, ordinal) for term in self.terms
+            ):
+                continue
+            occurrences = len(self.phrase_pattern.findall(index.texts[ordinal]))
+            if occurrences:
+                counts[ordinal] = occurrences
+        low, high = (min(eligible), max(eligible)) if eligible else (0, len(index.texts))
+        length = len(self.terms)
+        starts: set[int] | None = None
+        order = sorted(range(length), key=lambda at: len(index.postings[self.terms[at]]))
+        for step, distance in enumerate(order):
+            self.budget.checkpoint(step)
+            term = self.terms[distance]
+            postings = index.postings[term]
+            # Scopes are book ranges, so most of them are one contiguous span.
+            first = bisect_left(postings, low)
+            last = bisect_right(postings, high, first)
+            # Shifting by ``length - 1 - distance`` keeps every key non-negative.
+            keys = map(
+                add,
+                map(mul, postings[first:last], repeat(1 << _OFFSET_BITS)),
+                map(add, index.positions[term][first:last], repeat(length - 1 - distance)),
+            )
+            starts = set(keys) if starts is None else starts.intersection(keys)
+            if not starts:
+                return counts
+
+        current = -1
+        next_start = 0
+        for position, key in enumerate(sorted(starts or ())):
+            self.budget.checkpoint(position)
+            ordinal = key >> _OFFSET_BITS
+            if ordinal in joined or (eligible is not None and ordinal not in eligible):
+                continue
+            start = key & _OFFSET_MASK
+            if ordinal != current:
+                current = ordinal
+                next_start = 0
+            if start < next_start:
+                continue
+            counts[ordinal] = counts.get(ordinal, 0) + 1
+            next_start = start + length
+        return counts
+
+    def _verse_events(
+        self,
+        index: SearchIndex,
+        ordinals: Container[int],
+    ) -> dict[int, list[tuple[int, str]]]:
+        """Collect ``(offset, term)`` pairs of the query terms for the given verses."""
+        events: dict[int, list[tuple[int, str]]] = {}
+        for step, term in enumerate(dict.fromkeys(self.terms)):
+            self.budget.checkpoint(step)
+            for ordinal, offset in zip(
+                index.postings.get(term, ()), index.positions.get(term, ()), strict=True
+            ):
+                if ordinal in ordinals:
+                    events.setdefault(ordinal, []).append((offset, term))
+        return events
+
+    def _window_fits(self, events: Sequence[tuple[int, str]]) -> bool:
+        """Return whether one token window holds every query term within the gap.
+
+        ``events`` are the verse's ``(offset, term)`` pairs in offset order.
+        """
         wanted: dict[str, int] = {}
         for term in self.terms:
             wanted[term] = wanted.get(term, 0) + 1
-        positions = [match.group() for match in _TOKEN.finditer(text)]
         counts: dict[str, int] = {}
         left = 0
         satisfied = 0
         required = len(wanted)
-        for right, token in enumerate(positions):
+        for right, (offset, token) in enumerate(events):
             self.budget.checkpoint(right)
-            if token in wanted:
-                counts[token] = counts.get(token, 0) + 1
-                if counts[token] == wanted[token]:
-                    satisfied += 1
-            while satisfied == required and left <= right:
-                window_size = right - left + 1
+            counts[token] = counts.get(token, 0) + 1
+            if counts[token] == wanted[token]:
+                satisfied += 1
+            while satisfied == required:
+                window_size = offset - events[left][0] + 1
                 if window_size - len(self.terms) <= int(self.criteria.proximity):
                     return True
-                left_token = positions[left]
-                if left_token in wanted:
-                    if counts[left_token] == wanted[left_token]:
-                        satisfied -= 1
-                    counts[left_token] -= 1
+                left_token = events[left][1]
+                if counts[left_token] == wanted[left_token]:
+                    satisfied -= 1
+                counts[left_token] -= 1
                 left += 1
         return False
 
@@ -880,6 +1500,99 @@ class _Matcher:
         )
 
 
+def _single_term(
+    criteria: SearchBible,
+    terms: Sequence[str],
+    excluded: Sequence[str],
+) -> bool:
+    """Return whether one whole-word term can be counted from its postings alone.
+
+    Canonical rankings and streams treat a one-word phrase the same way, so
+    both count only its exact tokens.
+    """
+    return (
+        len(terms) == 1
+        and criteria.match == "whole_word"
+        and not excluded
+        and criteria.proximity is None
+    )
+
+
+def _offer(
+    heap: list[tuple[float, int, int, tuple[str, ...]]],
+    depth: int,
+    match: tuple[int, float, int, tuple[str, ...]],
+) -> None:
+    """Keep the best ``depth`` matches as ``(score, -ordinal, ...)`` min-heap entries.
+
+    The heap root is the weakest kept match: the lowest score, and among equal
+    scores the latest verse, matching the canonical tie-breaker.
+    """
+    ordinal, score, occurrences, terms = match
+    entry = (score, -ordinal, occurrences, terms)
+    if len(heap) < depth:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+
+def _ranked(
+    heap: list[tuple[float, int, int, tuple[str, ...]]],
+) -> tuple[tuple[int, float, int, tuple[str, ...]], ...]:
+    return tuple(
+        (-negative_ordinal, score, occurrences, terms)
+        for score, negative_ordinal, occurrences, terms in sorted(heap, reverse=True)
+    )
+
+
+def _top_matches(
+    matches: Iterable[tuple[int, float, int, tuple[str, ...]]],
+    depth: int,
+) -> tuple[tuple[int, float, int, tuple[str, ...]], ...]:
+    """Return the score-ordered first ``depth`` of unordered matches."""
+    heap: list[tuple[float, int, int, tuple[str, ...]]] = []
+    if depth > 0:
+        for match in matches:
+            _offer(heap, depth, match)
+    return _ranked(heap)
+
+
+def _phrase_anchor(query: str) -> str | None:
+    """Return the longest word-character run usable for a trigram lookup."""
+    runs = _WORD_RUN.findall(query)
+    anchor = max(runs, key=len, default="")
+    return anchor if len(anchor) >= TRIGRAM_LENGTH else None
+
+
+def _tagged(
+    stream: Iterator[tuple[int, int]],
+    position: int,
+) -> Iterator[tuple[int, int, int]]:
+    for ordinal, count in stream:
+        yield ordinal, position, count
+
+
+def _unique(ordinals: Iterator[int]) -> Iterator[int]:
+    for ordinal, _ in groupby(ordinals):
+        yield ordinal
+
+
+def _intersection(streams: list[Iterator[int]]) -> Iterator[int]:
+    """Yield ordinals present in every ascending stream."""
+    if not streams:
+        return
+    current = [next(stream, None) for stream in streams]
+    while None not in current:
+        highest = max(current)  # type: ignore[type-var]
+        if all(value == highest for value in current):
+            yield highest
+            current = [next(stream, None) for stream in streams]
+            continue
+        for position, stream in enumerate(streams):
+            while current[position] is not None and current[position] < highest:
+                current[position] = next(stream, None)
+
+
 def normalize_text(text: str, case_sensitive: bool, diacritics: str) -> str:
     value = unicodedata.normalize("NFC", text)
     value = " ".join(value.split())
@@ -893,5 +1606,31 @@ def normalize_text(text: str, case_sensitive: bool, diacritics: str) -> str:
     return value if case_sensitive else value.casefold()
 
 
+def encode_index_variant(
+    texts: Iterable[str],
+    case_sensitive: bool,
+    diacritics: str,
+    identity: Mapping[str, Any],
+    checkpoint: Callable[[int], None] | None = None,
+) -> bytes:
+    """Normalize verse texts and serialize one search index variant.
+
+    The function only takes picklable arguments, so a process pool can build
+    variants in parallel.
+    """
+    return encode_index(
+        [normalize_text(text, case_sensitive, diacritics) for text in texts],
+        _TOKEN.findall,
+        identity,
+        checkpoint,
+    )
+
+
+def _index_variant_name(case_sensitive: bool, diacritics: str) -> str:
+    case = "case" if case_sensitive else "fold"
+    unicode_version = unicodedata.unidata_version.replace(".", "_")
+    return f"u{unicode_version}-{case}-{diacritics}"
+
+
 def normalize_book_name(name: str) -> str:
     return "".join(normalize_text(name, False, "insensitive").replace(".", "").split())
@@ -0,0 +1,429 @@
+"""Binary, memory-mappable postings indexes for search corpora."""
+
+from __future__ import annotations
+
+import mmap
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import groupby
+from pathlib import Path
+from typing import Any
+
+from ._binary_columns import column, decode_columns, encode_columns, map_file
+from .exceptions import CacheIntegrityError
+
+INDEX_FORMAT_VERSION = 4
+_MAGIC = b"GBINDEX\x00"
+# Documents summarized by one block-max relevance bound.
+SCORE_BLOCK_DOCUMENTS = 64
+TRIGRAM_LENGTH = 3
+
+
+class _TextColumn(Sequence[str]):
+    """Lazily decoded normalized verse texts stored in one UTF-8 buffer."""
+
+    __slots__ = ("_offsets", "_text")
+
+    def __init__(self, offsets: memoryview, text: memoryview) -> None:
+        self._offsets = offsets
+        self._text = text
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, ordinal: int) -> str:  # type: ignore[override]
+        if ordinal < 0:
+            ordinal += len(self)
+        if not 0 <= ordinal < len(self):
+            raise IndexError("verse ordinal out of range")
+        start = self._offsets[ordinal]
+        return str(self._text[start:self._offsets[ordinal + 1]], "utf-8")
+
+
+class _PostingsMap(Mapping[str, memoryview]):
+    """Token-to-ordinal postings backed by one unsigned-integer column."""
+
+    __slots__ = ("_tokens", "_offsets", "_values")
+
+    def __init__(
+        self,
+        tokens: dict[str, int],
+        offsets: memoryview,
+        values: memoryview,
+    ) -> None:
+        self._tokens = tokens
+        self._offsets = offsets
+        self._values = values
+
+    def __getitem__(self, token: str) -> memoryview:
+        position = self._tokens[token]
+        return self._values[self._offsets[position]:self._offsets[position + 1]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, token: object) -> bool:
+        return token in self._tokens
+
+
+class _FrequencyMap(Mapping[str, int]):
+    """Per-token document frequencies aligned with the index vocabulary."""
+
+    __slots__ = ("_tokens", "_values")
+
+    def __init__(self, tokens: dict[str, int], values: memoryview) -> None:
+        self._tokens = tokens
+        self._values = values
+
+    def __getitem__(self, token: str) -> int:
+        return self._values[self._tokens[token]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, token: object) -> bool:
+        return token in self._tokens
+
+
+@dataclass(frozen=True, slots=True)
+class SubstringLookup:
+    """Vocabulary tokens containing a substring and the work spent finding them."""
+
+    tokens: tuple[str, ...]
+    work_units: int
+
+
+class SearchIndex:
+    """Compact token postings and normalized verse text for one text mode.
+
+    Every column is a read-only view over one immutable buffer. The buffer is
+    either a memory-mapped cache file, which the operating system shares
+    between worker processes through its page cache, or bytes built in-process
+    when no writable cache is available.
+    """
+
+    __slots__ = (
+        "texts",
+        "postings",
+        "positions",
+        "document_frequency",
+        "verse_lengths",
+        "average_length",
+        "build_work_units",
+        "text_characters",
+        "vocabulary_characters",
+        "mapped",
+        "_tokens",
+        "_posting_offsets",
+        "_block_offsets",
+        "_block_ends",
+        "_block_max",
+        "_block_shortest",
+        "_vocabulary",
+        "_trigrams",
+        "_trigram_lock",
+        "_joined",
+        "_joined_lock",
+        "_buffer",
+    )
+
+    def __init__(
+        self,
+        buffer: bytes | mmap.mmap,
+        identity: Mapping[str, Any],
+        build_work_units: int,
+    ) -> None:
+        header, body = decode_columns(buffer, _MAGIC, "Search index")
+        for key, expected in identity.items():
+            if header.get(key) != expected:
+                raise CacheIntegrityError(f"Search index {key!r} does not match its corpus.")
+        if header.get("format") != INDEX_FORMAT_VERSION:
+            raise CacheIntegrityError("Search index uses an unsupported format version.")
+
+        vocabulary = header.get("vocabulary")
+        verses = header.get("verses")
+        text_characters = header.get("characters")
+        tokens_total = header.get("tokens")
+        text_offsets = column(body, header, "text_offsets", "Q")
+        text = column(body, header, "text", "B")
+        posting_offsets = column(body, header, "posting_offsets", "Q")
+        postings = column(body, header, "postings", "I")
+        positions = column(body, header, "positions", "I")
+        frequencies = column(body, header, "document_frequency", "I")
+        lengths = column(body, header, "verse_lengths", "I")
+        block_offsets = column(body, header, "block_offsets", "Q")
+        block_ends = column(body, header, "block_ends", "Q")
+        block_max = column(body, header, "block_max", "I")
+        block_shortest = column(body, header, "block_shortest", "I")
+        if (
+            not isinstance(vocabulary, list)
+            or not isinstance(verses, int)
+            or not isinstance(text_characters, int)
+            or not isinstance(tokens_total, int)
+            or len(text_offsets) != verses + 1
+            or len(lengths) != verses
+            or text_offsets[verses] != len(text)
+            or len(posting_offsets) != len(vocabulary) + 1
+            or posting_offsets[len(vocabulary)] != len(postings)
+            or len(positions) != len(postings)
+            or len(frequencies) != len(vocabulary)
+            or len(block_offsets) != len(vocabulary) + 1
+            or block_offsets[len(vocabulary)] != len(block_ends)
+            or len(block_max) != len(block_ends)
+            or len(block_shortest) != len(block_ends)
+        ):
+            raise CacheIntegrityError("Search index sections are inconsistent.")
+
+        tokens = {token: position for position, token in enumerate(vocabulary)}
+        self.texts: Sequence[str] = _TextColumn(text_offsets, text)
+        self.postings: Mapping[str, Sequence[int]] = _PostingsMap(
+            tokens, posting_offsets, postings
+        )
+        # Token offsets within each verse, aligned entry for entry with postings.
+        self.positions: Mapping[str, Sequence[int]] = _PostingsMap(
+            tokens, posting_offsets, positions
+        )
+        self.document_frequency: Mapping[str, int] = _FrequencyMap(tokens, frequencies)
+        self.verse_lengths: Sequence[int] = lengths
+        self.average_length = tokens_total / verses if verses else 0.0
+        self.build_work_units = build_work_units
+        self.text_characters = text_characters
+        self.mapped = isinstance(buffer, mmap.mmap)
+        self._tokens = tokens
+        self._posting_offsets = posting_offsets
+        self._block_offsets = block_offsets
+        self._block_ends = block_ends
+        self._block_max = block_max
+        self._block_shortest = block_shortest
+        self._vocabulary = tuple(vocabulary)
+        self._trigrams: dict[str, array] | None = None
+        self._trigram_lock = threading.Lock()
+        self._joined: frozenset[int] | None = None
+        self._joined_lock = threading.Lock()
+        self.vocabulary_characters = sum(len(token) for token in vocabulary)
+        self._buffer = buffer
+
+    def score_blocks(self, token: str) -> Iterator[tuple[int, int, int]]:
+        """Yield ``(end, max_occurrences, min_length)`` for blocks of a token's postings.
+
+        Each block covers up to :data:`SCORE_BLOCK_DOCUMENTS` verses. ``end`` is
+        the exclusive position in ``postings[token]`` where the block stops;
+        ``max_occurrences`` and ``min_length`` bound the occurrences and the
+        token length of every verse inside it.
+        """
+        position = self._tokens.get(token)
+        if position is None:
+            return
+        base = self._posting_offsets[position]
+        for block in range(self._block_offsets[position], self._block_offsets[position + 1]):
+            yield (
+                self._block_ends[block] - base,
+                self._block_max[block],
+                self._block_shortest[block],
+            )
+
+    @property
+    def size(self) -> int:
+        """Return the serialized index size in bytes."""
+        return len(self._buffer)
+
+    def token_positions(self, token: str, ordinal: int) -> Sequence[int]:
+        """Return the ascending token offsets of ``token`` inside one verse."""
+        if token not in self._tokens:
+            return ()
+        postings = self.postings[token]
+        first = bisect_left(postings, ordinal)
+        return self.positions[token][first:bisect_right(postings, ordinal, first)]
+
+    def joined_ordinals(self) -> frozenset[int]:
+        """Return the verses holding an apostrophe-joined token such as ``lord's``.
+
+        The set is built from the vocabulary on first use and kept for the
+        life of the index.
+        """
+        joined = self._joined
+        if joined is None:
+            with self._joined_lock:
+                joined = self._joined
+                if joined is None:
+                    joined = frozenset(
+                        ordinal
+                        for token in self._vocabulary
+                        if "'" in token or "’" in token
+                        for ordinal in self.postings[token]
+                    )
+                    self._joined = joined
+        return joined
+
+    @property
+    def has_trigrams(self) -> bool:
+        return self._trigrams is not None
+
+    def find_substring(self, term: str) -> SubstringLookup:
+        """Return the vocabulary tokens that contain ``term``.
+
+        Terms of at least :data:`TRIGRAM_LENGTH` characters intersect the
+        vocabulary positions of their trigrams and verify only the survivors.
+        The trigram map is built from the vocabulary on first use and kept for
+        the life of the index. Shorter terms scan the vocabulary.
+        """
+        vocabulary = self._vocabulary
+        if len(term) < TRIGRAM_LENGTH:
+            return SubstringLookup(
+                tuple(token for token in vocabulary if term in token),
+                sum(1 + min(len(token), len(term)) for token in vocabulary),
+            )
+        trigrams = self._trigram_map()
+        lists = sorted(
+            (
+                trigrams.get(term[start:start + TRIGRAM_LENGTH], ())
+                for start in range(len(term) - TRIGRAM_LENGTH + 1)
+            ),
+            key=len,
+        )
+        work_units = len(term) + sum(len(positions) for positions in lists)
+        candidates = set(lists[0])
+        for positions in lists[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(positions)
+        work_units += len(candidates) * len(term)
+        return SubstringLookup(
+            tuple(
+                vocabulary[position]
+                for position in sorted(candidates)
+                if term in vocabulary[position]
+            ),
+            work_units,
+        )
+
+    def _trigram_map(self) -> dict[str, array]:
+        trigrams = self._trigrams
+        if trigrams is None:
+            with self._trigram_lock:
+                trigrams = self._trigrams
+                if trigrams is None:
+                    trigrams = {}
+                    for position, token in enumerate(self._vocabulary):
+                        for trigram in {
+                            token[start:start + TRIGRAM_LENGTH]
+                            for start in range(len(token) - TRIGRAM_LENGTH + 1)
+                        }:
+                            trigrams.setdefault(trigram, array("I")).append(position)
+                    self._trigrams = trigrams
+        return trigrams
+
+
+def encode_index(
+    texts: Sequence[str],
+    tokenize: Callable[[str], list[str]],
+    identity: Mapping[str, Any],
+    checkpoint: Callable[[int], None] | None = None,
+) -> bytes:
+    """Tokenize normalized verse texts into the binary index representation."""
+    postings: dict[str, array] = {}
+    positions: dict[str, array] = {}
+    document_frequency: dict[str, int] = {}
+    text_offsets = array("Q", [0])
+    text_parts: list[bytes] = []
+    text_bytes = 0
+    text_characters = 0
+    lengths = array("I")
+    for ordinal, text in enumerate(texts):
+        if checkpoint is not None:
+            checkpoint(ordinal)
+        encoded = text.encode("utf-8")
+        text_parts.append(encoded)
+        text_bytes += len(encoded)
+        text_offsets.append(text_bytes)
+        text_characters += len(text)
+        tokens = tokenize(text)
+        lengths.append(len(tokens))
+        for offset, token in enumerate(tokens):
+            postings.setdefault(token, array("I")).append(ordinal)
+            positions.setdefault(token, array("I")).append(offset)
+        for token in set(tokens):
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+
+    vocabulary = sorted(postings)
+    posting_offsets = array("Q", [0])
+    ordinals = array("I")
+    offsets = array("I")
+    frequencies = array("I")
+    block_offsets = array("Q", [0])
+    block_ends = array("Q")
+    block_max = array("I")
+    block_shortest = array("I")
+    for token in vocabulary:
+        token_postings = postings[token]
+        start = len(ordinals)
+        ordinals.extend(token_postings)
+        offsets.extend(positions[token])
+        posting_offsets.append(len(ordinals))
+        frequencies.append(document_frequency[token])
+        highest = 0
+        shortest = 0
+        for position, (ordinal, occurrences) in enumerate(groupby(token_postings)):
+            if position and not position % SCORE_BLOCK_DOCUMENTS:
+                block_ends.append(start)
+                block_max.append(highest)
+                block_shortest.append(shortest)
+                highest = 0
+                shortest = 0
+            count = sum(1 for _ in occurrences)
+            start += count
+            highest = max(highest, count)
+            shortest = min(shortest, lengths[ordinal]) if shortest else lengths[ordinal]
+        block_ends.append(start)
+        block_max.append(highest)
+        block_shortest.append(shortest)
+        block_offsets.append(len(block_ends))
+
+    return encode_columns(
+        _MAGIC,
+        {
+            **identity,
+            "format": INDEX_FORMAT_VERSION,
+            "verses": len(texts),
+            "characters": text_characters,
+            "tokens": sum(lengths),
+            "vocabulary": vocabulary,
+        },
+        (
+            ("text_offsets", text_offsets.tobytes()),
+            ("text", b"".join(text_parts)),
+            ("posting_offsets", posting_offsets.tobytes()),
+            ("postings", ordinals.tobytes()),
+            ("positions", offsets.tobytes()),
+            ("document_frequency", frequencies.tobytes()),
+            ("verse_lengths", lengths.tobytes()),
+            ("block_offsets", block_offsets.tobytes()),
+            ("block_ends", block_ends.tobytes()),
+            ("block_max", block_max.tobytes()),
+            ("block_shortest", block_shortest.tobytes()),
+        ),
+    )
+
+
+def open_index(
+    path: Path,
+    identity: Mapping[str, Any],
+    build_work_units: int,
+) -> SearchIndex | None:
+    """Map a persisted index read-only, or return ``None`` when it is unusable."""
+    mapped = map_file(path)
+    if mapped is None:
+        return None
+    try:
+        return SearchIndex(mapped, identity, build_work_units)
+    except CacheIntegrityError:
+        return None
@@ -141,12 +141,21 @@ class SourceCoordinator:
                 del self._thread_local.operation_state
                 del self._thread_local.operation_depth
 
-    def synchronize(self) -> SourceGeneration:
-        """Invalidate this worker when another worker committed a generation."""
+    def peek(self) -> SourceGeneration | None:
+        """Return the committed generation when this worker already observes it.
+
+        Only the manifest is read and no barrier is taken. ``None`` means
+        :meth:`synchronize` must invalidate this worker first.
+        """
         current = self._read_manifest()
         with self._state_guard:
             observed = self._observed
-        if current.generation == observed.generation:
+        return current if current.generation == observed.generation else None
+
+    def synchronize(self) -> SourceGeneration:
+        """Invalidate this worker when another worker committed a generation."""
+        current = self.peek()
+        if current is not None:
             return current
 
         with self._barrier.write(), self._file_barrier(shared=True):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 import hashlib
 import json
 import logging
@@ -10,6 +11,7 @@ import os
 import tempfile
 import threading
 import time
+import zlib
 from collections import OrderedDict
 from contextlib import suppress
 from dataclasses import dataclass
@@ -18,6 +20,7 @@ from typing import Any
 
 from filelock import FileLock
 
+from ._binary_columns import column, decode_columns, encode_columns
 from ._keyed_locks import KeyedLockPool
 from .exceptions import (
     CacheIntegrityError,
@@ -25,9 +28,10 @@ from .exceptions import (
     RepositoryResourceNotFound,
     RepositoryResponseError,
 )
-from .repository_client import RepositoryClient
+from .repository_client import RepositoryClient, RepositoryValidators
 
 LOGGER = logging.getLogger(__name__)
+_VALIDATED_MAGIC = b"GBVALID\x00"
 
 
 @dataclass(frozen=True, slots=True)
@@ -47,6 +51,12 @@ class _CacheMetadata:
     payload: str
     books_sha: str
     source_generation: int
+    # Payload (size, mtime_ns, inode) and time of its last full SHA-1 check.
+    payload_stat: tuple[int, int, int] | None = None
+    verified_at: float | None = None
+    # HTTP validators of the ``.sha``, ``books.json``, and payload resources
+    # that describe this metadata, keyed by repository-relative path.
+    validators: tuple[tuple[str, RepositoryValidators], ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -90,6 +100,10 @@ class TranslationCache:
         memory_limit: int | None = 4,
         refresh_jitter: float = 0.1,
         require_checksums: bool = False,
+        payload_verification: str = "checksum",
+        payload_scrub_seconds: float | None = None,
+        stale_while_revalidate: bool = False,
+        payload_compression: str | None = None,
     ) -> None:
         self.repository = repository
         self.refresh_seconds = max(0.0, refresh_seconds)
@@ -107,17 +121,47 @@ class TranslationCache:
         if not 0 <= refresh_jitter < 1:
             raise ValueError("refresh_jitter must be between 0 (inclusive) and 1.")
         self.refresh_jitter = float(refresh_jitter)
+        if payload_verification not in ("checksum", "stat"):
+            raise ValueError("payload_verification must be 'checksum' or 'stat'.")
+        self.payload_verification = payload_verification
+        if payload_scrub_seconds is not None and (
+            not isinstance(payload_scrub_seconds, (int, float))
+            or isinstance(payload_scrub_seconds, bool)
+            or not math.isfinite(payload_scrub_seconds)
+            or payload_scrub_seconds < 0
+        ):
+            raise ValueError("payload_scrub_seconds must be a non-negative number or null.")
+        self.payload_scrub_seconds = payload_scrub_seconds
+        if not isinstance(stale_while_revalidate, bool):
+            raise TypeError("stale_while_revalidate must be a boolean.")
+        if stale_while_revalidate and strict_freshness:
+            raise ValueError("stale_while_revalidate cannot be combined with strict_freshness.")
+        self.stale_while_revalidate = stale_while_revalidate
+        if payload_compression not in (None, "gzip"):
+            raise ValueError("payload_compression must be 'gzip' or null.")
+        self.payload_compression = payload_compression
         self._memory: OrderedDict[str, TranslationSnapshot] = OrderedDict()
         self._source_generation = 0
         self._locks = KeyedLockPool()
         self._guard = threading.RLock()
-        self._stats = {
+        # Abbreviation -> process ID of the in-flight background refresh, so a
+        # forked child does not wait on a thread that only exists in its parent.
+        self._revalidating: dict[str, int] = {}
+        self._stats: dict[str, int | float] = {
             "memory_hits": 0,
             "disk_hits": 0,
             "source_checks": 0,
             "downloads": 0,
             "stale_fallbacks": 0,
             "evictions": 0,
+            "validated_loads": 0,
+            "payload_hashes": 0,
+            "not_modified": 0,
+            "stale_served": 0,
+            "background_refreshes": 0,
+            "background_refresh_failures": 0,
+            "background_refresh_seconds": 0.0,
+            "background_refresh_max_seconds": 0.0,
         }
 
     def load(self, abbreviation: str) -> TranslationSnapshot:
@@ -130,7 +174,21 @@ class TranslationCache:
         if memory is not None and self._is_fresh(abbreviation, memory, now):
             self._increment("memory_hits")
             return memory
+        if memory is not None and self.stale_while_revalidate:
+            self._revalidate(abbreviation)
+            self._increment("stale_served")
+            return memory
+        return self._load_locked(abbreviation)
+
+    def peek(self, abbreviation: str) -> TranslationSnapshot | None:
+        """Return the in-memory snapshot only while it is fresh, without I/O."""
+        with self._guard:
+            memory = self._memory.get(abbreviation)
+        if memory is None or memory.stale or not self._is_fresh(abbreviation, memory, time.time()):
+            return None
+        return memory
 
+    def _load_locked(self, abbreviation: str) -> TranslationSnapshot:
         with self._locks.hold(abbreviation):
             now = time.time()
             with self._guard:
@@ -166,7 +224,7 @@ class TranslationCache:
 
                 try:
                     self._increment("source_checks")
-                    refreshed = self._refresh(abbreviation, paths, disk, now)
+                    refreshed = self._refresh(abbreviation, paths, disk, now, metadata)
                 except RepositoryResourceNotFound:
                     if disk is None:
                         raise
@@ -194,6 +252,43 @@ class TranslationCache:
                     )
                 return self._remember(abbreviation, refreshed)
 
+    def _revalidate(self, abbreviation: str) -> None:
+        process_id = os.getpid()
+        with self._guard:
+            if self._revalidating.get(abbreviation) == process_id:
+                return
+            self._revalidating[abbreviation] = process_id
+        threading.Thread(
+            target=self._refresh_in_background,
+            args=(abbreviation, process_id),
+            name=f"getbible-revalidate-{abbreviation}",
+            daemon=True,
+        ).start()
+
+    def _refresh_in_background(self, abbreviation: str, process_id: int) -> None:
+        # Workers in other processes queue on the same file lock and then
+        # find fresh metadata, so only the first of them contacts the source.
+        started = time.perf_counter()
+        try:
+            self._load_locked(abbreviation)
+        except Exception:
+            LOGGER.warning(
+                "Background refresh of translation %s failed.",
+                abbreviation,
+                exc_info=True,
+            )
+            self._increment("background_refresh_failures")
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._guard:
+                if self._revalidating.get(abbreviation) == process_id:
+                    del self._revalidating[abbreviation]
+                self._stats["background_refreshes"] += 1
+                self._stats["background_refresh_seconds"] += elapsed
+                self._stats["background_refresh_max_seconds"] = max(
+                    self._stats["background_refresh_max_seconds"], elapsed
+                )
+
     def invalidate(self, abbreviation: str | None = None) -> None:
         """Evict one or every in-memory translation snapshot."""
         with self._guard:
@@ -223,6 +318,7 @@ class TranslationCache:
                 for code, snapshot in self._memory.items()
             }
             stats = dict(self._stats)
+            revalidating = sorted(self._revalidating)
         return {
             "size": len(translations),
             "limit": self.memory_limit,
@@ -230,6 +326,11 @@ class TranslationCache:
             "translations": translations,
             "require_checksums": self.require_checksums,
             "validation_version": self.VALIDATION_VERSION,
+            "payload_verification": self.payload_verification,
+            "payload_scrub_seconds": self.payload_scrub_seconds,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "payload_compression": self.payload_compression,
+            "revalidating": revalidating,
             **stats,
         }
 
@@ -239,11 +340,35 @@ class TranslationCache:
         paths: dict[str, Path],
         disk: TranslationSnapshot | None,
         now: float,
+        metadata: _CacheMetadata | None = None,
     ) -> TranslationSnapshot:
+        # Validators only describe the resources behind the metadata's SHA.
+        current = disk is not None and metadata is not None and metadata.sha == disk.sha
+        known = dict(metadata.validators) if current and metadata is not None else {}
+        current_payload = metadata.payload if current and metadata is not None else None
+        validators: dict[str, RepositoryValidators] = {}
+
+        def fetch(relative_path: str, conditional: bool) -> bytes | None:
+            fetched = self.repository.fetch_if_changed(
+                relative_path,
+                known.get(relative_path) if conditional else None,
+            )
+            if fetched.validators is not None:
+                validators[relative_path] = fetched.validators
+            if fetched.unchanged:
+                self._increment("not_modified")
+            return fetched.content
+
         try:
-            remote_sha = self.repository.fetch_text(f"{abbreviation}.sha").strip().lower()
+            published = fetch(f"{abbreviation}.sha", conditional=True)
         except RepositoryResourceNotFound:
             remote_sha = ""
+        else:
+            remote_sha = (
+                disk.sha
+                if published is None and disk is not None
+                else (published or b"").decode("utf-8", "replace").strip().lower()
+            )
         if self.require_checksums and not remote_sha:
             raise RepositoryResponseError(
                 f"Translation {abbreviation} does not publish a required checksum."
@@ -253,22 +378,43 @@ class TranslationCache:
                 f"Invalid checksum published for translation {abbreviation}."
             )
 
-        books_raw = self.repository.fetch_bytes(f"{abbreviation}/books.json")
+        unchanged = disk is not None and bool(remote_sha) and disk.sha == remote_sha
+        books_path = f"{abbreviation}/books.json"
+        books_raw = fetch(books_path, conditional=unchanged or not remote_sha)
+        raw = None
+        if disk is not None and not remote_sha:
+            raw = fetch(f"{abbreviation}.json", conditional=True)
+            unchanged = raw is None
+        if unchanged and disk is not None and books_raw is None:
+            # Neither the payload nor the books index changed since they were
+            # last validated together.
+            snapshot = TranslationSnapshot(disk.data, disk.sha, now)
+            self._write_metadata(
+                paths["metadata"],
+                snapshot,
+                payload=current_payload,
+                validators=validators,
+            )
+            return snapshot
+        if books_raw is None:
+            books_raw = fetch(books_path, conditional=False) or b""
         books_index = self._decode_books_index(books_raw, abbreviation)
         books_sha = hashlib.sha1(books_raw, usedforsecurity=False).hexdigest()
 
-        if disk is not None and remote_sha and disk.sha == remote_sha:
+        if unchanged and disk is not None:
             self._validate_books_match(disk.data, books_index, abbreviation)
             snapshot = TranslationSnapshot(disk.data, disk.sha, now)
             self._write_metadata(
                 paths["metadata"],
                 snapshot,
-                payload=f"{disk.sha}.json",
+                payload=current_payload,
                 books_sha=books_sha,
+                validators=validators,
             )
             return snapshot
 
-        raw = self.repository.fetch_bytes(f"{abbreviation}.json")
+        if raw is None:
+            raw = fetch(f"{abbreviation}.json", conditional=False) or b""
         self._increment("downloads")
         actual_sha = hashlib.sha1(raw, usedforsecurity=False).hexdigest()
         if remote_sha and actual_sha != remote_sha:
@@ -280,13 +426,17 @@ class TranslationCache:
         data = self._decode_translation(raw, abbreviation, books_index)
         snapshot = TranslationSnapshot(data, actual_sha, now)
         paths["objects"].mkdir(parents=True, exist_ok=True)
-        payload = paths["objects"] / f"{actual_sha}.json"
+        payload = paths["objects"] / self._payload_name(actual_sha)
         self._write_content_addressed(payload, raw, actual_sha)
+        self._write_validated(actual_sha, abbreviation, data)
         self._write_metadata(
             paths["metadata"],
             snapshot,
             payload=payload.name,
             books_sha=books_sha,
+            payload_stat=self._payload_stat(payload),
+            verified_at=now,
+            validators=validators,
         )
         return snapshot
 
@@ -298,7 +448,27 @@ class TranslationCache:
             payload = metadata["payload"]
             books_sha = metadata["books_sha"]
             source_generation = metadata["source_generation"]
-        except (FileNotFoundError, OSError, KeyError, TypeError, ValueError, json.JSONDecodeError):
+            payload_stat = metadata.get("payload_stat")
+            verified_at = metadata.get("verified_at")
+            if payload_stat is not None:
+                size, mtime_ns, inode = (int(value) for value in payload_stat)
+                payload_stat = (size, mtime_ns, inode)
+            if verified_at is not None:
+                verified_at = float(verified_at)
+            validators = tuple(
+                (str(relative_path), parsed)
+                for relative_path, value in sorted((metadata.get("validators") or {}).items())
+                if (parsed := RepositoryValidators.from_value(value)) is not None
+            )
+        except (
+            AttributeError,
+            FileNotFoundError,
+            OSError,
+            KeyError,
+            TypeError,
+            ValueError,
+            json.JSONDecodeError,
+        ):
             return None
         if (
             metadata.get("validation_version") != self.VALIDATION_VERSION
@@ -308,7 +478,7 @@ class TranslationCache:
             or not self._valid_sha(books_sha)
             or not math.isfinite(checked_at)
             or checked_at < 0
-            or payload != f"{expected_sha}.json"
+            or payload not in (f"{expected_sha}.json", f"{expected_sha}.json.gz")
             or not isinstance(source_generation, int)
             or isinstance(source_generation, bool)
             or source_generation < 0
@@ -320,6 +490,9 @@ class TranslationCache:
             payload,
             books_sha,
             source_generation,
+            payload_stat,
+            verified_at,
+            validators,
         )
 
     def _read_disk(
@@ -339,22 +512,153 @@ class TranslationCache:
             else 0.0
         )
         payload = paths["objects"] / metadata.payload
-        try:
-            raw = payload.read_bytes()
-        except OSError:
+        payload_stat = self._payload_stat(payload)
+        if payload_stat is None:
             return None
+        raw: bytes | None = None
+        if not self._payload_trusted(metadata, payload_stat):
+            raw = self._read_payload(payload, expected_sha)
+            if raw is None:
+                return None
+            if self.payload_verification == "stat":
+                self._record_payload_check(paths["metadata"], payload_stat)
 
-        actual_sha = hashlib.sha1(raw, usedforsecurity=False).hexdigest()
-        if actual_sha != expected_sha:
-            LOGGER.warning("Ignoring a corrupt Librarian translation cache entry.")
-            return None
+        abbreviation = paths["metadata"].name.removesuffix(".metadata.json")
+        data = self._read_validated(expected_sha, abbreviation)
+        if data is not None:
+            self._increment("validated_loads")
+            return TranslationSnapshot(data, expected_sha, checked_at)
+        if raw is None:
+            raw = self._read_payload(payload, expected_sha)
+            if raw is None:
+                return None
         try:
-            abbreviation = paths["metadata"].name.removesuffix(".metadata.json")
             data = self._decode_translation(raw, abbreviation)
         except (CacheIntegrityError, RepositoryResponseError):
             LOGGER.warning("Ignoring an invalid Librarian translation cache entry.")
             return None
-        return TranslationSnapshot(data, actual_sha, checked_at)
+        self._write_validated(expected_sha, abbreviation, data)
+        return TranslationSnapshot(data, expected_sha, checked_at)
+
+    def _payload_trusted(
+        self,
+        metadata: _CacheMetadata,
+        payload_stat: tuple[int, int, int],
+    ) -> bool:
+        """Return whether ``stat`` verification may skip hashing the payload.
+
+        The payload must still have the size, modification time, and inode
+        recorded when it was last hashed, and no periodic scrub may be due.
+        """
+        if self.payload_verification != "stat" or metadata.payload_stat != payload_stat:
+            return False
+        if self.payload_scrub_seconds is None:
+            return True
+        return (
+            metadata.verified_at is not None
+            and time.time() - metadata.verified_at < self.payload_scrub_seconds
+        )
+
+    def _read_payload(self, payload: Path, expected_sha: str) -> bytes | None:
+        """Read a content-addressed payload, or ``None`` when it is missing or corrupt."""
+        try:
+            raw = self._canonical_payload(payload, self.repository.max_response_bytes)
+        except (OSError, EOFError, zlib.error, CacheIntegrityError):
+            LOGGER.warning("Ignoring an unreadable Librarian translation cache entry.")
+            return None
+        self._increment("payload_hashes")
+        if hashlib.sha1(raw, usedforsecurity=False).hexdigest() != expected_sha:
+            LOGGER.warning("Ignoring a corrupt Librarian translation cache entry.")
+            return None
+        return raw
+
+    def _record_payload_check(self, path: Path, payload_stat: tuple[int, int, int]) -> None:
+        """Store the stat signature of a payload whose SHA-1 was just confirmed."""
+        try:
+            metadata = json.loads(path.read_text(encoding="utf-8"))
+            metadata["payload_stat"] = list(payload_stat)
+            metadata["verified_at"] = time.time()
+            self._write_atomic(path, json.dumps(metadata, sort_keys=True).encode("utf-8"))
+        except (OSError, TypeError, ValueError):
+            LOGGER.warning("Unable to record a Librarian payload check.", exc_info=True)
+
+    def _payload_name(self, sha: str) -> str:
+        return f"{sha}.json.gz" if self.payload_compression == "gzip" else f"{sha}.json"
+
+    @staticmethod
+    def _canonical_payload(payload: Path, limit: int) -> bytes:
+        """Return a payload's canonical JSON bytes, decompressing ``.gz`` files.
+
+        Compressed payloads are decompressed in chunks and rejected once they
+        exceed ``limit`` bytes, the same bound applied to the original download.
+        """
+        if payload.suffix != ".gz":
+            return payload.read_bytes()
+        chunks: list[bytes] = []
+        size = 0
+        with gzip.open(payload, "rb") as handle:
+            while chunk := handle.read(1024 * 1024):
+                size += len(chunk)
+                if size > limit:
+                    raise CacheIntegrityError(
+                        f"Cached payload expands beyond {limit} bytes: {payload.name}"
+                    )
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _payload_stat(payload: Path) -> tuple[int, int, int] | None:
+        try:
+            status = payload.stat()
+        except OSError:
+            return None
+        return status.st_size, status.st_mtime_ns, status.st_ino
+
+    def _read_validated(self, sha: str, abbreviation: str) -> dict[str, Any] | None:
+        """Return translation data recorded after an earlier full validation.
+
+        The sidecar holds the decoded payload as compact JSON, so a load is
+        one digest check and one parse without per-field validation or
+        payload decompression.
+        """
+        try:
+            content = self.artifact_path(sha, self._validated_name()).read_bytes()
+            header, body = decode_columns(content, _VALIDATED_MAGIC, "Validated translation")
+            identity = self._validated_identity(sha, abbreviation)
+            if any(header.get(key) != expected for key, expected in identity.items()):
+                return None
+            data = json.loads(bytes(column(body, header, "data", "B")))
+        except (OSError, CacheIntegrityError, TypeError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("abbreviation") != abbreviation:
+            return None
+        return data
+
+    def _write_validated(self, sha: str, abbreviation: str, data: dict[str, Any]) -> None:
+        """Record a fully validated payload so later disk loads can skip validation."""
+        path = self.artifact_path(sha, self._validated_name())
+        try:
+            encoded = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            content = encode_columns(
+                _VALIDATED_MAGIC,
+                self._validated_identity(sha, abbreviation),
+                (("data", encoded.encode("utf-8")),),
+            )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(path, content)
+        except (OSError, ValueError):
+            LOGGER.warning("Unable to persist a validated Librarian translation.", exc_info=True)
+
+    def _validated_name(self) -> str:
+        return f"validated-v{self.VALIDATION_VERSION}.bin"
+
+    def _validated_identity(self, sha: str, abbreviation: str) -> dict[str, Any]:
+        return {
+            "sha": sha,
+            "abbreviation": abbreviation,
+            "validation_version": self.VALIDATION_VERSION,
+            "encoding": "json",
+        }
 
     @classmethod
     def _decode_translation(
@@ -733,11 +1037,26 @@ class TranslationCache:
             raise CacheIntegrityError(f"Translation contains an invalid {label}.")
         return result
 
-    def _paths(self, abbreviation: str) -> dict[str, Path]:
+    def artifact_path(self, sha: str, name: str) -> Path:
+        """Return the content-addressed path of data derived from one payload.
+
+        Derived artifacts live beside the immutable payload they were built
+        from, so they share its namespace, lifetime, and rotation rules.
+        """
+        if not self._valid_sha(sha):
+            raise ValueError("Artifact paths require a valid translation SHA.")
+        if RepositoryClient._SAFE_SEGMENT.fullmatch(name) is None:
+            raise ValueError("Artifact names must be safe file-name segments.")
+        return self._namespace_directory() / "objects" / f"{sha.lower()}.{name}"
+
+    def _namespace_directory(self) -> Path:
         namespace = hashlib.sha256(
             f"{self.repository.repo_path}|{self.repository.version}".encode()
         ).hexdigest()[:16]
-        directory = self.cache_dir / namespace / self.repository.version
+        return self.cache_dir / namespace / self.repository.version
+
+    def _paths(self, abbreviation: str) -> dict[str, Path]:
+        directory = self._namespace_directory()
         return {
             "directory": directory,
             "objects": directory / "objects",
@@ -763,10 +1082,15 @@ class TranslationCache:
         *,
         payload: str | None = None,
         books_sha: str | None = None,
+        payload_stat: tuple[int, int, int] | None = None,
+        verified_at: float | None = None,
+        validators: dict[str, RepositoryValidators] | None = None,
     ) -> None:
         existing = self._read_metadata({"metadata": path})
         payload = payload or (existing.payload if existing is not None else f"{snapshot.sha}.json")
         books_sha = books_sha or (existing.books_sha if existing is not None else "")
+        if payload_stat is None and existing is not None and existing.payload == payload:
+            payload_stat, verified_at = existing.payload_stat, existing.verified_at
         if not self._valid_sha(books_sha):
             raise CacheIntegrityError(
                 "Cannot commit translation metadata without a books checksum."
@@ -781,23 +1105,32 @@ class TranslationCache:
                 "source_generation": self._source_generation,
                 "source": self.repository.repo_path,
                 "version": self.repository.version,
+                "payload_stat": list(payload_stat) if payload_stat is not None else None,
+                "verified_at": verified_at,
+                "validators": {
+                    relative_path: value.to_dict()
+                    for relative_path, value in sorted((validators or {}).items())
+                },
             },
             sort_keys=True,
         ).encode("utf-8")
         self._write_atomic(path, metadata)
 
-    @staticmethod
-    def _write_content_addressed(path: Path, content: bytes, expected_sha: str) -> None:
+    def _write_content_addressed(self, path: Path, content: bytes, expected_sha: str) -> None:
         if path.exists():
             try:
                 existing_sha = hashlib.sha1(
-                    path.read_bytes(), usedforsecurity=False
+                    self._canonical_payload(path, self.repository.max_response_bytes),
+                    usedforsecurity=False,
                 ).hexdigest()
-            except OSError:
+            except (OSError, EOFError, zlib.error, CacheIntegrityError):
                 existing_sha = ""
             if existing_sha == expected_sha:
                 return
-        TranslationCache._write_atomic(path, content)
+        if path.suffix == ".gz":
+            # A fixed header timestamp keeps equal payloads byte-identical.
+            content = gzip.compress(content, mtime=0)
+        self._write_atomic(path, content)
 
     @staticmethod
     def _write_atomic(path: Path, content: bytes) -> None:
@@ -0,0 +1,327 @@
+"""Compact columnar verse storage for search corpora."""
+
+from __future__ import annotations
+
+import json
+import mmap
+from array import array
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ._binary_columns import column, decode_columns, encode_columns, map_file
+from .exceptions import CacheIntegrityError
+
+VERSE_STORE_FORMAT_VERSION = 1
+_MAGIC = b"GBVERSE\x00"
+_VERSE_FIELDS = ("chapter", "verse", "name", "text")
+
+
+@dataclass(frozen=True, slots=True)
+class VerseRecord:
+    ordinal: int
+    book_nr: int
+    book_name: str
+    chapter: int
+    chapter_name: str
+    verse: dict[str, Any]
+
+    @property
+    def text(self) -> str:
+        return str(self.verse["text"])
+
+    @property
+    def reference(self) -> str:
+        return str(self.verse["name"])
+
+
+class _StringColumn:
+    """Variable-length UTF-8 strings addressed by one offsets column."""
+
+    __slots__ = ("_offsets", "_data")
+
+    def __init__(self, offsets: memoryview, data: memoryview, count: int) -> None:
+        if len(offsets) != count + 1 or offsets[count] != len(data):
+            raise CacheIntegrityError("Verse store string columns are inconsistent.")
+        self._offsets = offsets
+        self._data = data
+
+    def __getitem__(self, ordinal: int) -> str:
+        return str(self._data[self._offsets[ordinal]:self._offsets[ordinal + 1]], "utf-8")
+
+    def is_empty(self, ordinal: int) -> bool:
+        return self._offsets[ordinal] == self._offsets[ordinal + 1]
+
+
+class VerseStore(Sequence[VerseRecord]):
+    """Canonically ordered verses stored as parallel columns in one buffer.
+
+    Book numbers, chapter numbers, and verse numbers are fixed-width integer
+    columns; references, texts, and any additional verse fields live in UTF-8
+    buffers. Book and chapter names are interned once. A ``VerseRecord`` with
+    its own verse dictionary is only materialized when an ordinal is indexed,
+    which search does for the hits it returns rather than for every verse.
+    """
+
+    __slots__ = (
+        "book_numbers",
+        "chapters",
+        "verse_numbers",
+        "book_names",
+        "book_ranges",
+        "text_characters",
+        "mapped",
+        "_chapter_names",
+        "_chapter_name_ids",
+        "_layouts",
+        "_layout_ids",
+        "_names",
+        "_texts",
+        "_extras",
+        "_buffer",
+        "_chapter_ranges",
+    )
+
+    def __init__(self, buffer: bytes | mmap.mmap, identity: Mapping[str, Any]) -> None:
+        header, body = decode_columns(buffer, _MAGIC, "Verse store")
+        for key, expected in identity.items():
+            if header.get(key) != expected:
+                raise CacheIntegrityError(f"Verse store {key!r} does not match its translation.")
+        if header.get("format") != VERSE_STORE_FORMAT_VERSION:
+            raise CacheIntegrityError("Verse store uses an unsupported format version.")
+
+        verses = header.get("verses")
+        books = header.get("books")
+        chapter_names = header.get("chapter_names")
+        layouts = header.get("layouts")
+        text_characters = header.get("characters")
+        if (
+            not isinstance(verses, int)
+            or not isinstance(books, list)
+            or not isinstance(chapter_names, list)
+            or not isinstance(layouts, list)
+            or not isinstance(text_characters, int)
+        ):
+            raise CacheIntegrityError("Verse store header is malformed.")
+        self.book_numbers = column(body, header, "book_numbers", "H")
+        self.chapters = column(body, header, "chapters", "H")
+        self.verse_numbers = column(body, header, "verse_numbers", "H")
+        self._chapter_name_ids = column(body, header, "chapter_name_ids", "I")
+        self._layout_ids = column(body, header, "layout_ids", "H")
+        if any(
+            len(values) != verses
+            for values in (
+                self.book_numbers,
+                self.chapters,
+                self.verse_numbers,
+                self._chapter_name_ids,
+                self._layout_ids,
+            )
+        ):
+            raise CacheIntegrityError("Verse store columns are inconsistent.")
+        self._names = _StringColumn(
+            column(body, header, "name_offsets", "Q"), column(body, header, "names", "B"), verses
+        )
+        self._texts = _StringColumn(
+            column(body, header, "text_offsets", "Q"), column(body, header, "texts", "B"), verses
+        )
+        self._extras = _StringColumn(
+            column(body, header, "extra_offsets", "Q"), column(body, header, "extras", "B"), verses
+        )
+        try:
+            self.book_names = {int(nr): str(name) for nr, name, _, _ in books}
+            self.book_ranges = {int(nr): range(int(start), int(end)) for nr, _, start, end in books}
+        except (TypeError, ValueError) as error:
+            raise CacheIntegrityError("Verse store book table is malformed.") from error
+        self._chapter_names = tuple(str(name) for name in chapter_names)
+        self._layouts = tuple(tuple(str(key) for key in layout) for layout in layouts)
+        self.text_characters = text_characters
+        self.mapped = isinstance(buffer, mmap.mmap)
+        self._buffer = buffer
+        self._chapter_ranges: dict[tuple[int, int], range] | None = None
+
+    def __len__(self) -> int:
+        return len(self.book_numbers)
+
+    def __getitem__(self, ordinal: int) -> VerseRecord:  # type: ignore[override]
+        if ordinal < 0:
+            ordinal += len(self)
+        if not 0 <= ordinal < len(self):
+            raise IndexError("verse ordinal out of range")
+        book_nr = self.book_numbers[ordinal]
+        chapter = self.chapters[ordinal]
+        extras: dict[str, Any] = (
+            {} if self._extras.is_empty(ordinal) else json.loads(self._extras[ordinal])
+        )
+        verse: dict[str, Any] = {}
+        for key in self._layouts[self._layout_ids[ordinal]]:
+            if key in extras:
+                verse[key] = extras[key]
+            elif key == "chapter":
+                verse[key] = chapter
+            elif key == "verse":
+                verse[key] = self.verse_numbers[ordinal]
+            elif key == "name":
+                verse[key] = self._names[ordinal]
+            else:
+                verse[key] = self._texts[ordinal]
+        return VerseRecord(
+            ordinal=ordinal,
+            book_nr=book_nr,
+            book_name=self.book_names[book_nr],
+            chapter=chapter,
+            chapter_name=self._chapter_names[self._chapter_name_ids[ordinal]],
+            verse=verse,
+        )
+
+    def text(self, ordinal: int) -> str:
+        """Return one verse text without materializing its record."""
+        return self._texts[ordinal]
+
+    def texts(self) -> Iterator[str]:
+        """Yield every verse text in canonical order."""
+        return (self._texts[ordinal] for ordinal in range(len(self)))
+
+    def ordinals_for_books(self, books: Collection[int]) -> frozenset[int]:
+        """Return the verse ordinals belonging to the requested books."""
+        return frozenset(
+            ordinal
+            for book in books
+            for ordinal in self.book_ranges.get(book, ())
+        )
+
+    def chapter_ordinals(self, book: int, chapter: int) -> range:
+        """Return the ordinals of one chapter's verses, empty when it is absent.
+
+        The chapter table is built on first use from the book and chapter
+        columns; verses of a chapter are contiguous in canonical order.
+        """
+        chapter_ranges = self._chapter_ranges
+        if chapter_ranges is None:
+            chapter_ranges = {}
+            for book_nr, ordinals in self.book_ranges.items():
+                start = ordinals.start
+                for ordinal in range(ordinals.start + 1, ordinals.stop + 1):
+                    if ordinal == ordinals.stop or self.chapters[ordinal] != self.chapters[start]:
+                        chapter_ranges[book_nr, self.chapters[start]] = range(start, ordinal)
+                        start = ordinal
+            self._chapter_ranges = chapter_ranges
+        return chapter_ranges.get((book, chapter), range(0))
+
+    @property
+    def size(self) -> int:
+        """Return the serialized store size in bytes."""
+        return len(self._buffer)
+
+
+def encode_verse_store(data: Mapping[str, Any], identity: Mapping[str, Any]) -> bytes:
+    """Flatten validated translation data into the columnar representation."""
+    book_numbers = array("H")
+    chapters = array("H")
+    verse_numbers = array("H")
+    chapter_name_ids = array("I")
+    layout_ids = array("H")
+    strings: dict[str, tuple[array, list[bytes]]] = {
+        name: (array("Q", [0]), []) for name in ("name", "text", "extra")
+    }
+    lengths = {name: 0 for name in strings}
+    books_table: list[list[Any]] = []
+    chapter_names: dict[str, int] = {}
+    layouts: dict[tuple[str, ...], int] = {}
+    text_characters = 0
+
+    def append(name: str, value: str) -> None:
+        encoded = value.encode("utf-8")
+        offsets, parts = strings[name]
+        parts.append(encoded)
+        lengths[name] += len(encoded)
+        offsets.append(lengths[name])
+
+    try:
+        for book in sorted(data["books"], key=lambda item: int(item["nr"])):
+            book_nr = int(book["nr"])
+            start = len(book_numbers)
+            for chapter in sorted(book["chapters"], key=lambda item: int(item["chapter"])):
+                chapter_nr = int(chapter["chapter"])
+                chapter_name_id = chapter_names.setdefault(
+                    str(chapter["name"]), len(chapter_names)
+                )
+                for verse in sorted(chapter["verses"], key=lambda item: int(item["verse"])):
+                    if not all(key in verse for key in _VERSE_FIELDS):
+                        raise KeyError("verse")
+                    verse_nr = int(verse["verse"])
+                    # Values the columns cannot reproduce exactly travel with
+                    # the verse so the materialized dictionary is unchanged.
+                    extras = {
+                        key: value
+                        for key, value in verse.items()
+                        if not _columnar(key, value, chapter_nr, verse_nr)
+                    }
+                    book_numbers.append(book_nr)
+                    chapters.append(chapter_nr)
+                    verse_numbers.append(verse_nr)
+                    chapter_name_ids.append(chapter_name_id)
+                    layout = tuple(verse)
+                    layout_ids.append(layouts.setdefault(layout, len(layouts)))
+                    append("name", verse["name"] if "name" not in extras else "")
+                    append("text", verse["text"] if "text" not in extras else "")
+                    append(
+                        "extra",
+                        json.dumps(extras, ensure_ascii=False, separators=(",", ":"))
+                        if extras
+                        else "",
+                    )
+                    text_characters += len(str(verse["text"]))
+            books_table.append([book_nr, str(book["name"]), start, len(book_numbers)])
+    except (KeyError, TypeError, ValueError, OverflowError) as error:
+        raise CacheIntegrityError("Translation contains invalid book or verse data.") from error
+
+    return encode_columns(
+        _MAGIC,
+        {
+            **identity,
+            "format": VERSE_STORE_FORMAT_VERSION,
+            "verses": len(book_numbers),
+            "characters": text_characters,
+            "books": books_table,
+            "chapter_names": list(chapter_names),
+            "layouts": [list(layout) for layout in layouts],
+        },
+        (
+            ("book_numbers", book_numbers.tobytes()),
+            ("chapters", chapters.tobytes()),
+            ("verse_numbers", verse_numbers.tobytes()),
+            ("chapter_name_ids", chapter_name_ids.tobytes()),
+            ("layout_ids", layout_ids.tobytes()),
+            *(
+                section
+                for name, (offsets, parts) in strings.items()
+                for section in (
+                    (f"{name}_offsets", offsets.tobytes()),
+                    (f"{name}s", b"".join(parts)),
+                )
+            ),
+        ),
+    )
+
+
+def _columnar(key: str, value: Any, chapter: int, verse: int) -> bool:
+    if key == "chapter":
+        return type(value) is int and value == chapter
+    if key == "verse":
+        return type(value) is int and value == verse
+    if key in ("name", "text"):
+        return type(value) is str
+    return False
+
+
+def open_verse_store(path: Path, identity: Mapping[str, Any]) -> VerseStore | None:
+    """Map a persisted verse store read-only, or return ``None`` when it is unusable."""
+    mapped = map_file(path)
+    if mapped is None:
+        return None
+    try:
+        return VerseStore(mapped, identity)
+    except CacheIntegrityError:
+        return None
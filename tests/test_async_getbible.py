@@ -0,0 +1,175 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from getbible import AsyncGetBible, GetBible, SearchBible, TranslationNotFoundError
+from getbible.repository_client import AsyncRepositoryClient, RepositoryClient, httpx
+
+FIXTURE_REPOSITORY = Path(__file__).parent / "fixtures" / "repository"
+
+
+class _SilentRepositoryHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestAsyncGetBible(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.temporary = tempfile.TemporaryDirectory()
+        self.bible = GetBible(repo_path=FIXTURE_REPOSITORY, cache_dir=self.temporary.name)
+
+    def tearDown(self) -> None:
+        self.bible.close()
+        self.temporary.cleanup()
+
+    async def test_concurrent_lookups_share_one_fetch_per_resource(self) -> None:
+        async with AsyncGetBible(self.bible, max_workers=2) as bible:
+            with patch.object(
+                bible._repository,
+                "fetch_if_changed",
+                wraps=bible._repository.fetch_if_changed,
+            ) as fetch:
+                responses = await asyncio.gather(
+                    *(bible.select("1 1:1-3", "test") for _ in range(50))
+                )
+            self.assertEqual(
+                [call.args[0] for call in fetch.call_args_list],
+                ["test/books.json", "test/1/1.sha", "test/1/1.json"],
+            )
+            self.assertTrue(all(response == responses[0] for response in responses))
+            self.assertEqual(responses[0], self.bible.select("1 1:1-3", "test"))
+            self.assertEqual(
+                await bible.scripture("1 1:1-3", "test"),
+                self.bible.scripture("1 1:1-3", "test"),
+            )
+
+            info = bible.cache_info()
+            self.assertEqual(info["async"]["inflight"], 0)
+            self.assertEqual(info["async"]["offloaded"], 0)
+            self.assertEqual(info["chapters"]["misses"], 1)
+
+    async def test_missing_translations_and_searches_match_the_blocking_client(self) -> None:
+        async with AsyncGetBible(self.bible) as bible:
+            self.assertFalse(await bible.valid_translation("missing"))
+            with self.assertRaises(TranslationNotFoundError):
+                await bible.select("1 1:1", "missing")
+            self.assertEqual(bible.cache_info()["negative_translations"]["size"], 1)
+
+            criteria = SearchBible(words="any", limit=2)
+            self.assertEqual(
+                await bible.search("faith hope", "test", criteria),
+                self.bible.search("faith hope", "test", criteria),
+            )
+            self.assertEqual(bible.cache_info()["async"]["offloaded"], 1)
+
+    async def test_lookups_do_not_wait_for_locks_held_by_blocking_calls(self) -> None:
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_locks() -> None:
+            # A blocking lookup in the worker pool holds these across a fetch.
+            locks = self.bible._resource_locks
+            with (
+                self.bible.source_operation(),
+                locks.hold("books:test"),
+                locks.hold("chapter:test_1_1"),
+                self.bible._translation_validation_locks.hold("test"),
+            ):
+                held.set()
+                release.wait(timeout=10)
+
+        holder = threading.Thread(target=hold_locks)
+        holder.start()
+        self.addCleanup(holder.join, 10)
+        self.addCleanup(release.set)
+        self.assertTrue(held.wait(timeout=5))
+
+        async with AsyncGetBible(self.bible) as bible:
+            cold = await asyncio.wait_for(bible.select("1 1:1-3", "test"), timeout=5)
+            warm = await asyncio.wait_for(
+                bible.select_many(["1 1:1", "1 1:2-3"], "test"), timeout=5
+            )
+            self.assertTrue(holder.is_alive())
+            self.assertEqual(bible.cache_info()["async"]["offloaded"], 0)
+        release.set()
+        holder.join(timeout=10)
+        self.assertEqual(cold, self.bible.select("1 1:1-3", "test"))
+        self.assertEqual(warm, self.bible.select_many(["1 1:1", "1 1:2-3"], "test"))
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    async def test_remote_repository_uses_the_async_http_client(self) -> None:
+        remote = GetBible(
+            repo_path=self._serve_fixture_repository(),
+            cache_dir=Path(self.temporary.name) / "remote",
+            require_checksums=False,
+        )
+        self.addCleanup(remote.close)
+
+        async with AsyncGetBible(remote) as bible:
+            self.assertEqual(
+                await bible.select("1 1:1-3", "test"),
+                self.bible.select("1 1:1-3", "test"),
+            )
+            self.assertEqual(bible.cache_info()["async"]["fetches"], 3)
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    async def test_http_clients_of_every_loop_are_closed(self) -> None:
+        client = AsyncRepositoryClient(RepositoryClient(self._serve_fixture_repository()))
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever)
+        thread.start()
+        try:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(
+                    client.fetch_if_changed("test/books.json"), other
+                )
+            )
+            await client.fetch_if_changed("test/books.json")
+            sessions = list(client._sessions.values())
+            self.assertEqual(len(sessions), 2)
+            await client.aclose()
+            self.assertEqual(client._sessions, {})
+            self.assertTrue(all(http.is_closed for http in sessions))
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(timeout=5)
+            other.close()
+
+        # A client left behind by a loop that has since closed is dropped.
+        finished = threading.Thread(
+            target=asyncio.run, args=(client.fetch_if_changed("test/books.json"),)
+        )
+        finished.start()
+        finished.join(timeout=5)
+        (stale,) = client._sessions.values()
+        await client.fetch_if_changed("test/books.json")
+        self.assertEqual(list(client._sessions), [asyncio.get_running_loop()])
+        self.assertTrue(stale.is_closed)
+        await client.aclose()
+
+    def _serve_fixture_repository(self) -> str:
+        handler = partial(_SilentRepositoryHandler, directory=str(FIXTURE_REPOSITORY))
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        host, port = server.server_address
+        return f"http://{host}:{port}/"
+
+    @unittest.skipUnless(httpx is None, "httpx is installed")
+    def test_remote_repository_requires_httpx(self) -> None:
+        remote = GetBible(repo_path="https://api.getbible.net", cache_dir=self.temporary.name)
+        self.addCleanup(remote.close)
+        with self.assertRaises(ImportError):
+            AsyncGetBible(remote)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from getbible import GetBibleBookNumber
+from getbible.getbible_book_aliases import BookAliasIndex, shared_book_aliases
 
 
 class TestGetBibleBookNumber(unittest.TestCase):
@@ -100,5 +101,28 @@ class TestGetBibleBookNumber(unittest.TestCase):
         self.assertEqual(actual_result, expected_result, "Fallback to 'kjv' did not work for 'bad-translation'")
 
 
+    def test_alias_tables_load_on_first_use_and_are_shared(self):
+        index = BookAliasIndex(shared_book_aliases().data_path)
+        self.assertEqual(index.loaded(), frozenset())
+        self.assertEqual(index.table('kjv')['1john'], 62)
+        self.assertEqual(index.loaded(), {'kjv'})
+        self.assertIsNone(index.table('missing'))
+        with self.assertRaises(TypeError):
+            index.table('kjv')['1john'] = 1
+        self.assertIs(
+            GetBibleBookNumber()._GetBibleBookNumber__aliases,
+            self.get_book._GetBibleBookNumber__aliases,
+        )
+
+    def test_fallback_precedence_uses_the_merged_alias_index(self):
+        self.assertEqual(self.get_book.number('Jonas', 'kjv'), 32)
+        self.assertEqual(self.get_book.number('Jonas', 'kjv', ['lithuanian', 'darby']), 43)
+        self.assertEqual(self.get_book.number('Jonas', 'ls1910'), 43)
+        self.assertEqual(self.get_book.number('js', 'kjv', ['missing', 'estonian']), 23)
+        self.assertIsNone(self.get_book.number('Jonas', 'kjv', ['missing']))
+        self.assertIsNone(self.get_book.number('not a book', 'kjv'))
+        self.assertEqual(shared_book_aliases().candidates()['jonas'][0], ('almeida', 32))
+
+
 if __name__ == '__main__':
     unittest.main()
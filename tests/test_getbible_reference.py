@@ -1,6 +1,6 @@
 import unittest
 
-from getbible import BookReference, GetBibleReference
+from getbible import BookReference, GetBibleReference, ReferenceCompletion
 
 
 class TestGetBibleReference(unittest.TestCase):
@@ -83,6 +83,19 @@ class TestGetBibleReference(unittest.TestCase):
         expected_result = BookReference(book=1, chapter=1, verses=[1], reference='Gen')
         self.assertEqual(actual_result, expected_result, "Failed to find 'Gen 1:1' book reference.")
 
+    def test_complete_ranks_book_prefixes_and_keeps_the_typed_location(self):
+        self.assertEqual(
+            [candidate.name for candidate in self.get.complete('jo', 'kjv')][:5],
+            ['Joshua', 'Job', 'Jonah', 'John', 'Joel'],
+        )
+        self.assertEqual(
+            self.get.complete('1 jo 3:16-18', 'kjv'),
+            [ReferenceCompletion(book=62, name='1 John', chapter=3, verse=16)],
+        )
+        self.assertEqual(self.get.complete('john', 'nonexistent')[0].book, 43)
+        for prefix in ('', 'Gen 0', 'Gen 1:0', 'xyz', 'Gen 1:1;Ex', None):
+            self.assertEqual(self.get.complete(prefix, 'kjv'), [], prefix)
+
 
 if __name__ == '__main__':
     unittest.main()
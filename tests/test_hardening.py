@@ -35,6 +35,12 @@ class TestReferenceHardening(unittest.TestCase):
             ):
                 self.references.ref(reference, "kjv")
 
+    def test_non_decimal_digits_are_rejected_like_other_characters(self) -> None:
+        for reference in ("John ²", "John 1:²", "John 1:1-²", "²:1"):
+            with self.subTest(reference=reference):
+                self.assertFalse(self.references.valid(reference, "kjv"))
+        self.assertEqual(self.references.ref("John ٣:١-٢", "kjv").verses, [1, 2])
+
     def test_legacy_open_range_forms_remain_compatible(self) -> None:
         self.assertEqual(self.references.ref("John 1:2-", "kjv").verses, [2])
         self.assertEqual(self.references.ref("John 1:-5", "kjv").verses, [5])
@@ -62,6 +68,24 @@ class TestRequestBudgets(unittest.TestCase):
         self.addCleanup(bible.close)
         with self.assertRaises(RequestLimitError):
             bible.select("John 1:1;John 1:2", "kjv")
+        with self.assertRaises(RequestLimitError):
+            bible.select_many(["John 1:1", "John 1:2"], "kjv")
+
+    def test_completion_input_and_output_are_bounded(self) -> None:
+        bible = GetBible(
+            repo_path="/definitely/not/a/repository",
+            request_limits=RequestLimits(max_input_length=16, max_completions=3),
+        )
+        self.addCleanup(bible.close)
+        self.assertEqual(len(bible.complete("j", "kjv", limit=3)), 3)
+        with self.assertRaises(RequestLimitError):
+            bible.complete("j", "kjv", limit=4)
+        with self.assertRaises(RequestLimitError):
+            bible.complete("j" * 17, "kjv")
+        with self.assertRaises(ReferenceValidationError):
+            bible.complete(None, "kjv")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            bible.complete("j", "kjv", limit=0)
 
     def test_total_verse_budget_is_enforced(self) -> None:
         bible = GetBible(
@@ -43,6 +43,35 @@ class OperationalCacheTestCase(unittest.TestCase):
         target.mkdir()
         (target / "books.json").write_text(json.dumps(source), encoding="utf-8")
 
+    def _add_matthew_chapter(self) -> None:
+        source = json.loads(
+            (self.repository / "v2" / "test.json").read_text(encoding="utf-8")
+        )
+        matthew = source["books"][1]["chapters"][0]
+        chapter = {
+            key: source[key]
+            for key in (
+                "translation",
+                "abbreviation",
+                "lang",
+                "language",
+                "direction",
+                "encoding",
+            )
+        }
+        chapter.update(
+            {
+                "book_nr": 40,
+                "book_name": "Matthew",
+                "chapter": 1,
+                "name": matthew["name"],
+                "verses": matthew["verses"],
+            }
+        )
+        target = self.repository / "v2" / "test" / "40"
+        target.mkdir()
+        (target / "1.json").write_text(json.dumps(chapter), encoding="utf-8")
+
     def test_warm_translation_builds_requested_index_without_a_query(self) -> None:
         bible = GetBible(
             repo_path=self.repository,
@@ -63,6 +92,51 @@ class OperationalCacheTestCase(unittest.TestCase):
         self.assertIsInstance(json.dumps(bible.cache_info()), str)
         self.assertEqual(bible.cache_info()["active_resource_locks"], 0)
 
+    def test_warm_translations_builds_variants_in_worker_processes(self) -> None:
+        variants = [{}, {"case_sensitive": True, "diacritics": "insensitive"}]
+        bible = GetBible(repo_path=self.repository, cache_dir=self.root / "cache")
+        warmed = bible.warm_translations(["test", "test2"], variants=variants, workers=2)
+
+        self.assertEqual(warmed["workers"], 2)
+        self.assertEqual(list(warmed["translations"]), ["test", "test2"])
+        for report in warmed["translations"].values():
+            self.assertEqual(report["built_indexes"], 2)
+            self.assertEqual(report["mapped_indexes"], 2)
+            self.assertGreaterEqual(report["ready_seconds"], report["load_seconds"])
+        self.assertIsInstance(json.dumps(warmed), str)
+        self.assertEqual(
+            bible.search("Cafe", "test2", {"diacritics": "insensitive"})["query"]["total"],
+            1,
+        )
+
+        restarted = GetBible(repo_path=self.repository, cache_dir=self.root / "cache")
+        with patch("getbible.getbible.ProcessPoolExecutor") as pool:
+            rewarmed = restarted.warm_translations(["test", "test2"], variants=variants)
+        pool.assert_not_called()
+        self.assertEqual(
+            [report["built_indexes"] for report in rewarmed["translations"].values()],
+            [0, 0],
+        )
+        with self.assertRaises(ValueError):
+            restarted.warm_translations(["test"], workers=0)
+
+    def test_warm_translations_rejects_more_translations_than_corpora_retained(self) -> None:
+        bible = GetBible(
+            repo_path=self.repository,
+            cache_dir=self.root / "cache",
+            search_corpus_limit=1,
+        )
+        with (
+            patch.object(bible, "_search_corpus", wraps=bible._search_corpus) as load,
+            self.assertRaisesRegex(ValueError, "search_corpus_limit=1"),
+        ):
+            bible.warm_translations(["test", "test2"])
+        load.assert_not_called()
+
+        warmed = bible.warm_translations(["test", "test", "TEST"])
+        self.assertEqual(list(warmed["translations"]), ["test"])
+        self.assertEqual(bible.cache_info()["search_corpora"]["evictions"], 0)
+
     def test_search_corpora_and_translation_snapshots_are_lru_bounded(self) -> None:
         bible = GetBible(
             repo_path=self.repository,
@@ -118,34 +192,7 @@ class OperationalCacheTestCase(unittest.TestCase):
         self.assertEqual(info["evictions"], 1)
 
     def test_chapter_cache_is_bounded(self) -> None:
-        source = json.loads(
-            (self.repository / "v2" / "test.json").read_text(encoding="utf-8")
-        )
-        matthew = source["books"][1]["chapters"][0]
-        chapter = {
-            key: source[key]
-            for key in (
-                "translation",
-                "abbreviation",
-                "lang",
-                "language",
-                "direction",
-                "encoding",
-            )
-        }
-        chapter.update(
-            {
-                "book_nr": 40,
-                "book_name": "Matthew",
-                "chapter": 1,
-                "name": matthew["name"],
-                "verses": matthew["verses"],
-            }
-        )
-        target = self.repository / "v2" / "test" / "40"
-        target.mkdir()
-        (target / "1.json").write_text(json.dumps(chapter), encoding="utf-8")
-
+        self._add_matthew_chapter()
         bible = GetBible(
             repo_path=self.repository,
             cache_dir=self.root / "cache",
@@ -158,6 +205,54 @@ class OperationalCacheTestCase(unittest.TestCase):
         self.assertEqual(info["size"], 1)
         self.assertEqual(info["evictions"], 1)
 
+    def test_select_many_fetches_distinct_chapters_concurrently(self) -> None:
+        self._add_matthew_chapter()
+        bible = GetBible(repo_path=self.repository, cache_dir=self.root / "cache")
+        self.addCleanup(bible.close)
+        self.assertTrue(bible.valid_translation("test"))
+        fetch = bible._repository.fetch_if_changed
+        guard = threading.Lock()
+        requested: list[str] = []
+        active = 0
+        peak = 0
+
+        def slow_fetch(relative_path, validators=None):
+            nonlocal active, peak
+            with guard:
+                requested.append(relative_path)
+                active += 1
+                peak = max(peak, active)
+            try:
+                time.sleep(0.05)
+                return fetch(relative_path, validators)
+            finally:
+                with guard:
+                    active -= 1
+
+        references = ["1 1:1-2", "40 1:1", "1 1:3; 40 1:2"]
+        with (
+            patch.object(bible._repository, "fetch_if_changed", side_effect=slow_fetch),
+            patch.object(
+                bible, "_prefetch_chapters", wraps=bible._prefetch_chapters
+            ) as prefetch,
+        ):
+            selected = bible.select_many(references, "test")
+
+        prefetch.assert_called_once()
+
+        self.assertEqual(
+            sorted(requested),
+            ["test/1/1.json", "test/1/1.sha", "test/40/1.json", "test/40/1.sha"],
+        )
+        self.assertGreater(peak, 1)
+        self.assertEqual(bible.cache_info()["chapters"]["misses"], 2)
+        sequential = GetBible(repo_path=self.repository, cache_dir=self.root / "sequential")
+        self.addCleanup(sequential.close)
+        self.assertEqual(
+            selected, [sequential.select(reference, "test") for reference in references]
+        )
+        self.assertEqual(bible.select_many([], "test"), [])
+
     def test_zero_limits_disable_retention(self) -> None:
         bible = GetBible(
             repo_path=self.repository,
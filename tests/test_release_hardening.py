@@ -198,6 +198,7 @@ class ReleaseHardeningTestCase(unittest.TestCase):
             self.assertEqual(generation.generation, 1)
             self.assertTrue(generation.cache_namespace.endswith(":g1"))
         self.assertEqual(second.cache_info()["search_corpora"]["size"], 0)
+        self.assertEqual(second.cache_info()["search_results"]["size"], 0)
         self.assertEqual(second.cache_info()["negative_translations"]["size"], 0)
 
         translation_path = self.repository / "v2" / "test.json"
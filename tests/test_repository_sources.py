@@ -1,21 +1,47 @@
+import gzip
 import json
 import tempfile
 import threading
 import unittest
+from datetime import timedelta
 from functools import partial
-from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch
 
-from getbible import GetBible, SearchBible
+from getbible import GetBible, RepositoryResponseTooLarge, SearchBible
+from getbible.repository_client import RepositoryClient
 
 FIXTURE_REPOSITORY = Path(__file__).parent / "fixtures" / "repository"
 
 
 class _SilentRepositoryHandler(SimpleHTTPRequestHandler):
+    served: list[tuple[str, int]] = []
+
     def log_message(self, format: str, *args: object) -> None:
         pass
 
+    def send_response(self, code: int, message: str | None = None) -> None:
+        self.served.append((self.path.rsplit("/v2/", 1)[-1], code))
+        super().send_response(code, message)
+
+
+class _CompressedHandler(BaseHTTPRequestHandler):
+    body = json.dumps({"text": "In the beginning " * 4096}).encode("utf-8")
+    accepted: list[str] = []
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.accepted.append(self.headers.get("Accept-Encoding", ""))
+        content = gzip.compress(self.body)
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
 
 class TestRepositorySources(unittest.TestCase):
     @classmethod
@@ -66,6 +92,68 @@ class TestRepositorySources(unittest.TestCase):
         ]
         self.assertEqual(local, remote)
 
+    def test_expired_remote_resources_are_revalidated_with_conditional_requests(self):
+        remote = GetBible(
+            repo_path=self.repository_url,
+            cache_dir=Path(self.temporary.name) / "conditional",
+            require_checksums=False,
+            cache_ttl=timedelta(seconds=0),
+        )
+        self.addCleanup(remote.close)
+        first = remote.search("faith", "test")
+        remote.scripture("1 1:1", "test")
+
+        _SilentRepositoryHandler.served.clear()
+        restarted = GetBible(
+            repo_path=self.repository_url,
+            cache_dir=Path(self.temporary.name) / "conditional",
+            require_checksums=False,
+            cache_ttl=timedelta(seconds=0),
+        )
+        self.addCleanup(restarted.close)
+        second = restarted.search("faith", "test")
+        self.assertEqual(second["query"]["sha"], first["query"]["sha"])
+        self.assertEqual(
+            _SilentRepositoryHandler.served,
+            [
+                # The restarted worker's in-memory books cache is empty.
+                ("test/books.json", 200),
+                ("test.sha", 404),
+                ("test/books.json", 304),
+                ("test.json", 304),
+            ],
+        )
+        self.assertEqual(restarted.cache_info()["translation_cache"]["not_modified"], 2)
+
+        remote.scripture("1 1:1", "test")
+        _SilentRepositoryHandler.served.clear()
+        remote.scripture("1 1:1", "test")
+        self.assertIn(("test/1/1.json", 304), _SilentRepositoryHandler.served)
+
+    def test_compressed_transfers_are_bounded_after_decompression(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _CompressedHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        host, port = server.server_address
+        compressed_size = len(gzip.compress(_CompressedHandler.body))
+
+        client = RepositoryClient(f"http://{host}:{port}/", retries=0)
+        self.addCleanup(client.close)
+        self.assertEqual(client.fetch_bytes("test.json"), _CompressedHandler.body)
+        self.assertIn("gzip", _CompressedHandler.accepted[-1])
+
+        bounded = RepositoryClient(
+            f"http://{host}:{port}/",
+            retries=0,
+            max_response_bytes=compressed_size * 2,
+        )
+        self.addCleanup(bounded.close)
+        with self.assertRaises(RepositoryResponseTooLarge):
+            bounded.fetch_bytes("test.json")
+
     def test_close_releases_remote_http_sessions(self):
         self.assertTrue(self.remote.valid_translation("test"))
         sessions = tuple(self.remote._repository._sessions)
@@ -1,8 +1,11 @@
 import hashlib
 import json
+import math
+import os
 import shutil
 import tempfile
 import threading
+import time
 import unittest
 from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
@@ -14,8 +17,13 @@ from getbible import (
     GetBible,
     SearchBible,
     SearchCriteria,
+    SearchDeadlineExceeded,
+    SearchLimitError,
+    SearchLimits,
     SearchValidationError,
 )
+from getbible.search import SearchBudget, SearchEngine
+from getbible.translation_cache import TranslationCache
 
 FIXTURE_REPOSITORY = Path(__file__).parent / "fixtures" / "repository"
 
@@ -60,6 +68,11 @@ class TestSearchBible(unittest.TestCase):
         with self.assertRaises(SearchValidationError):
             SearchBible.from_value({"words": 1})
 
+    def test_bm25_sort_is_accepted_and_expensive(self):
+        criteria = SearchBible.from_value({"sort": "BM25"})
+        self.assertEqual(criteria.sort, "bm25")
+        self.assertTrue(criteria.expensive)
+
     def test_invalid_pagination_is_rejected(self):
         with self.assertRaises(SearchValidationError):
             SearchBible(limit=0)
@@ -176,12 +189,411 @@ class TestGetBibleSearch(unittest.TestCase):
         self.assertTrue(response["query"]["has_more"])
         self.assertEqual(len(response["matches"]), 1)
 
+    def test_relevance_pages_follow_score_then_canonical_order(self):
+        bible = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=self.temporary.name,
+            search_result_cache_limit=0,
+        )
+        for query, books in (("faith hope word", ()), ("faith", ()), ("faith", (40,))):
+            with self.subTest(query=query, books=books):
+                criteria = SearchBible(words="any", sort="relevance", limit=100, books=books)
+                full = bible.search(query, "test", criteria)["matches"]
+                keys = [
+                    (-match["score"], match["book_nr"], match["chapter"], match["verse"])
+                    for match in full
+                ]
+                self.assertEqual(keys, sorted(keys))
+                paged = [
+                    bible.search(query, "test", criteria.with_pagination(1, offset))
+                    ["matches"][0]
+                    for offset in range(len(full))
+                ]
+                self.assertEqual(paged, full)
+
+    def test_relevance_block_bounds_do_not_change_rankings(self):
+        criteria = SearchBible(sort="relevance", limit=2)
+        expected = self.bible.search("word", "test", criteria)
+        with tempfile.TemporaryDirectory() as directory, patch(
+            "getbible.search_index.SCORE_BLOCK_DOCUMENTS", 1
+        ):
+            bible = GetBible(repo_path=str(FIXTURE_REPOSITORY), cache_dir=directory)
+            response = bible.search("word", "test", criteria)
+        self.assertEqual(response["matches"], expected["matches"])
+        self.assertEqual(response["query"]["total"], expected["query"]["total"])
+
+    def test_bm25_normalizes_occurrences_by_verse_length(self):
+        relevance = self.bible.search("faith", "test", SearchBible(sort="relevance"))
+        bm25 = self.bible.search("faith", "test", SearchBible(sort="bm25"))
+        self.assertEqual(relevance["matches"][0]["reference"], "Genesis 1:3")
+        self.assertEqual(
+            [match["reference"] for match in bm25["matches"]],
+            ["Matthew 1:2", "Genesis 1:3", "Matthew 1:3"],
+        )
+        # Six of nine tokens in "faith grows when hope remains near." against
+        # an average of 73/9 tokens, with "faith" in three of nine verses.
+        idf = math.log(1 + (9 - 3 + 0.5) / (3 + 0.5))
+        expected = idf * 2.2 / (1 + 1.2 * (0.25 + 0.75 * 6 / (73 / 9)))
+        self.assertEqual(bm25["matches"][0]["score"], round(expected, 6))
+        self.assertEqual(bm25["query"]["total"], relevance["query"]["total"])
+
+    def test_bm25_ranks_multi_term_and_phrase_queries(self):
+        for query, criteria in (
+            ("faith hope word", SearchBible(words="any", sort="bm25")),
+            ("hope", SearchBible(match="substring", sort="bm25", books=(40,))),
+            ("the word", SearchBible(words="phrase", sort="bm25")),
+        ):
+            with self.subTest(query=query):
+                matches = self.bible.search(query, "test", criteria)["matches"]
+                self.assertTrue(matches)
+                scores = [match["score"] for match in matches]
+                self.assertEqual(scores, sorted(scores, reverse=True))
+                self.assertTrue(all(isinstance(score, float) for score in scores))
+
+    def test_substring_lookups_use_a_lazy_vocabulary_trigram_map(self):
+        self.bible.search("faith", "test")
+        info = self.bible.cache_info()["search_corpora"]["translations"]["test"]
+        self.assertEqual(info["trigram_indexes"], 0)
+
+        index = self.bible._search_corpus("test").index(False, "sensitive")
+        vocabulary = list(index.postings)
+        for term in ("ait", "faith", "afé", "ea", "e", "zzz", "the earth"):
+            with self.subTest(term=term):
+                self.assertEqual(
+                    index.find_substring(term).tokens,
+                    tuple(token for token in vocabulary if term in token),
+                )
+        info = self.bible.cache_info()["search_corpora"]["translations"]["test"]
+        self.assertEqual(info["trigram_indexes"], 1)
+
+    def test_substring_phrases_only_verify_anchor_candidates(self):
+        bible = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=self.temporary.name,
+            search_result_cache_limit=0,
+        )
+        criteria = SearchBible(words="phrase", match="substring")
+        bible.search("ord was sp", "test", criteria)
+        texts = type(bible._search_corpus("test").index(False, "sensitive").texts)
+        with patch.object(
+            texts, "__getitem__", autospec=True, side_effect=texts.__getitem__
+        ) as read:
+            response = bible.search("ord was sp", "test", criteria)
+        self.assertEqual(
+            [match["reference"] for match in response["matches"]], ["Matthew 1:4"]
+        )
+        # "ord" only occurs in "word", which appears in Matthew 1:3 and 1:4.
+        self.assertEqual(read.call_count, 2)
+
+    def test_index_positions_align_with_postings(self):
+        index = self.bible._search_corpus("test").index(False, "sensitive")
+        for token in index.postings:
+            self.assertEqual(len(index.positions[token]), len(index.postings[token]))
+        # Matthew 1:4 is "The Word was spoken, and the word was heard."
+        self.assertEqual(list(index.token_positions("word", 7)), [1, 6])
+        self.assertEqual(list(index.token_positions("was", 7)), [2, 7])
+        self.assertEqual(list(index.token_positions("word", 0)), [])
+
+    def test_phrase_and_proximity_use_positions_without_reading_text(self):
+        bible = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=self.temporary.name,
+            search_result_cache_limit=0,
+        )
+        bible.search("faith", "test")
+        texts = type(bible._search_corpus("test").index(False, "sensitive").texts)
+        with patch.object(
+            texts, "__getitem__", autospec=True, side_effect=texts.__getitem__
+        ) as read:
+            repeated = bible.search("the word was", "test", SearchBible(words="phrase"))
+            punctuated = bible.search("hope and love", "test", SearchBible(words="phrase"))
+            near = bible.search("faith hope", "test", SearchBible(proximity=2))
+            streamed = list(
+                bible.iter_search("word was", "test", {"words": "phrase"})
+            )
+        self.assertEqual(read.call_count, 0)
+        self.assertEqual(
+            [(match["reference"], match["occurrences"]) for match in repeated["matches"]],
+            [("Matthew 1:4", 2)],
+        )
+        self.assertEqual(
+            [match["reference"] for match in punctuated["matches"]], ["Genesis 1:3"]
+        )
+        self.assertEqual(
+            [match["reference"] for match in near["matches"]],
+            ["Genesis 1:3", "Matthew 1:2"],
+        )
+        self.assertEqual(
+            [(hit["reference"], hit["occurrences"]) for hit in streamed],
+            [("Matthew 1:4", 2)],
+        )
+
+    def test_possessive_phrase_keeps_token_boundaries(self):
+        bible = self._possessive_bible()
+        found = bible.search("the lord", "test", SearchBible(words="phrase"))
+        streamed = list(bible.iter_search("the lord", "test", {"words": "phrase"}))
+        possessive = bible.search("lord's house", "test", {"words": "phrase"})
+        self.assertEqual(
+            [(match["reference"], match["occurrences"]) for match in found["matches"]],
+            [("Genesis 1:1", 3)],
+        )
+        self.assertEqual(
+            [(hit["reference"], hit["occurrences"]) for hit in streamed],
+            [("Genesis 1:1", 3)],
+        )
+        self.assertEqual(
+            [match["reference"] for match in possessive["matches"]], ["Genesis 1:1"]
+        )
+
+    def test_phrase_streams_match_canonical_search_next_to_apostrophes(self):
+        bible = self._possessive_bible()
+        for query in ("lord", "the lord"):
+            criteria = {"words": "phrase", "limit": 100}
+            found = bible.search(query, "test", criteria)["matches"]
+            streamed = list(bible.iter_search(query, "test", criteria))
+            self.assertTrue(found)
+            self.assertEqual(
+                [(hit["reference"], hit["occurrences"], hit["score"]) for hit in streamed],
+                [(hit["reference"], hit["occurrences"], hit["score"]) for hit in found],
+            )
+
+    def test_ranked_one_word_phrase_keeps_the_phrase_matcher(self):
+        bible = self._possessive_bible()
+        ranked = bible.search("lord", "test", {"words": "phrase", "sort": "relevance"})
+        words = bible.search("lord", "test", {"sort": "relevance"})
+        self.assertEqual(
+            [(hit["reference"], hit["occurrences"]) for hit in ranked["matches"]],
+            [("Genesis 1:1", 3)],
+        )
+        self.assertEqual(
+            [(hit["reference"], hit["occurrences"]) for hit in words["matches"]],
+            [("Genesis 1:1", 1)],
+        )
+
+    def _possessive_bible(self) -> GetBible:
+        repository = Path(self.temporary.name) / "repository"
+        shutil.copytree(FIXTURE_REPOSITORY, repository)
+        path = repository / "v2" / "test.json"
+        translation = json.loads(path.read_text(encoding="utf-8"))
+        verses = translation["books"][0]["chapters"][0]["verses"]
+        verses[0]["text"] = "The lord's house and the lord, the lord\u2019s word."
+        verses[1]["text"] = "The lord's servant."
+        path.write_text(json.dumps(translation), encoding="utf-8")
+        return GetBible(
+            repo_path=str(repository),
+            cache_dir=str(Path(self.temporary.name) / "cache"),
+            search_result_cache_limit=0,
+        )
+
     def test_search_json_matches_dictionary_output(self):
         criteria = SearchBible(scope="new_testament", limit=2)
         dictionary = self.bible.search("faith", "test", criteria)
         encoded = self.bible.search_json("faith", "test", criteria)
         self.assertEqual(json.loads(encoded), dictionary)
 
+    def test_json_endpoints_are_byte_identical_to_dictionary_encoding(self):
+        criteria = SearchBible(words="any", diacritics="insensitive")
+        dictionary = self.bible.search("cafe faith", "test", criteria)
+        self.assertEqual(
+            self.bible.search_json("cafe faith", "test", criteria),
+            json.dumps(dictionary, ensure_ascii=False),
+        )
+        self.assertEqual(
+            self.bible.scripture("1 1:2,1;1 1:1-3", "test"),
+            json.dumps(self.bible.select("1 1:2,1;1 1:1-3", "test"), ensure_ascii=False),
+        )
+
+    def test_references_are_selected_from_a_loaded_snapshot_without_io(self):
+        bible = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=Path(self.temporary.name) / "snapshots",
+            select_from_snapshots=True,
+        )
+        self.addCleanup(bible.close)
+        bible.search("faith", "test")
+        with patch.object(
+            bible._repository, "fetch_if_changed", side_effect=AssertionError
+        ) as fetch:
+            selected = bible.select("1 1:3,1;40 1:1", "test")
+            encoded = bible.scripture("1 1:3,1;40 1:1", "test")
+        fetch.assert_not_called()
+        self.assertEqual(selected["test_1_1"], self.bible.select("1 1:3,1", "test")["test_1_1"])
+        self.assertEqual(selected["test_40_1"]["book_name"], "Matthew")
+        self.assertEqual(json.loads(encoded), selected)
+        self.assertEqual(bible.cache_info()["chapters"]["from_snapshots"], 2)
+        with self.assertRaises(ValueError):
+            bible.select("1 1:99", "test")
+
+    def test_completions_use_the_bounds_of_a_loaded_translation(self):
+        bible = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=Path(self.temporary.name) / "completions",
+        )
+        self.addCleanup(bible.close)
+        self.assertEqual(bible.complete("ma", "test")[0]["name"], "Malachi")
+        bible.search("faith", "test")
+        with patch.object(
+            bible._repository, "fetch_if_changed", side_effect=AssertionError
+        ) as fetch:
+            matthew = bible.complete("ma 1:", "test")
+            self.assertEqual(bible.complete("gen 1:5", "test"), [])
+            self.assertEqual(bible.complete("gen 2", "test"), [])
+        fetch.assert_not_called()
+        self.assertEqual(
+            matthew,
+            [
+                {
+                    "book": 40,
+                    "name": "Matthew",
+                    "chapter": 1,
+                    "verse": None,
+                    "reference": "Matthew 1",
+                    "chapters": 1,
+                    "verses": 4,
+                }
+            ],
+        )
+
+    def test_immutable_results_share_read_only_cached_objects(self):
+        bible = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=Path(self.temporary.name) / "immutable",
+            immutable_results=True,
+        )
+        self.addCleanup(bible.close)
+        first = bible.select("1 1:1-2", "test")
+        second = bible.select("1 1:2", "test")
+        self.assertEqual(first, self.bible.select("1 1:1-2", "test"))
+        self.assertIs(first["test_1_1"]["verses"][1], second["test_1_1"]["verses"][0])
+        with self.assertRaises(TypeError):
+            first["test_1_1"]["verses"][0]["text"] = "changed"
+        self.assertEqual(
+            bible.scripture("1 1:1-2", "test"), self.bible.scripture("1 1:1-2", "test")
+        )
+
+        searched = bible.search("faith", "test")
+        expected = self.bible.search("faith", "test")
+        self.assertEqual(searched["results"], expected["results"])
+        self.assertEqual(searched["query"]["translation"], expected["query"]["translation"])
+        self.assertIs(
+            searched["query"]["translation"],
+            bible.search("hope", "test")["query"]["translation"],
+        )
+        with self.assertRaises(TypeError):
+            searched["query"]["translation"]["translation"] = "changed"
+
+    def test_response_volume_budget_is_exact_compact_size(self):
+        response = self.bible.search("faith hope", "test")
+        size = len(
+            json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+        exact = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=self.temporary.name,
+            search_limits=SearchLimits(max_response_bytes=size),
+        )
+        self.assertEqual(
+            exact.search_json("faith hope", "test"),
+            json.dumps(response, ensure_ascii=False),
+        )
+        short = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=self.temporary.name,
+            search_limits=SearchLimits(max_response_bytes=size - 1),
+        )
+        with self.assertRaisesRegex(SearchLimitError, f"requires {size} bytes"):
+            short.search_json("faith hope", "test")
+
+    def test_repeated_queries_and_other_pages_reuse_cached_rankings(self):
+        criteria = SearchBible(words="any", limit=1)
+        with patch.object(
+            SearchEngine, "rank", autospec=True, side_effect=SearchEngine.rank
+        ) as rank:
+            first = self.bible.search("faith hope", "test", criteria)
+        self.assertEqual(rank.call_args.args[3], 1)
+        with patch("getbible.search.SearchEngine.rank") as rank:
+            repeated = self.bible.search("Faith Hope", "test", criteria)
+        rank.assert_not_called()
+        with patch.object(
+            SearchEngine, "rank", autospec=True, side_effect=SearchEngine.rank
+        ) as rank:
+            second_page = self.bible.search(
+                "faith hope", "test", criteria.with_pagination(1, 1)
+            )
+        self.assertEqual(rank.call_args.args[3], GetBible._SEARCH_RESULT_WINDOW)
+        with patch("getbible.search.SearchEngine.rank") as rank:
+            self.bible.search("faith hope", "test", criteria)
+            self.bible.search("faith hope", "test", criteria.with_pagination(1, 1))
+        rank.assert_not_called()
+        self.assertEqual(repeated["matches"], first["matches"])
+        self.assertEqual(repeated["query"]["cost"], first["query"]["cost"])
+        self.assertEqual(second_page["query"]["total"], first["query"]["total"])
+        self.assertNotEqual(second_page["matches"], first["matches"])
+        info = self.bible.cache_info()["search_results"]
+        self.assertEqual((info["size"], info["hits"], info["misses"]), (1, 3, 2))
+
+        self.bible.search("faith hope", "test", SearchBible(words="all"))
+        self.assertEqual(self.bible.cache_info()["search_results"]["size"], 2)
+
+    def test_search_result_cache_can_be_disabled(self):
+        bible = GetBible(
+            repo_path=str(FIXTURE_REPOSITORY),
+            cache_dir=self.temporary.name,
+            search_result_cache_limit=0,
+        )
+        bible.search("faith", "test")
+        with patch.object(
+            SearchEngine, "rank", autospec=True, side_effect=SearchEngine.rank
+        ) as rank:
+            bible.search("faith", "test")
+        rank.assert_called_once()
+        self.assertEqual(bible.cache_info()["search_results"]["size"], 0)
+
+    def test_streaming_search_matches_canonical_batch_results(self):
+        cases = (
+            ("faith hope", SearchBible(words="any")),
+            ("faith hope", SearchBible(exclude=("love",))),
+            ("faith hope", SearchBible(proximity=0)),
+            ("in the beginning", SearchBible(words="phrase")),
+            ("fai", SearchBible(match="substring", scope="new_testament")),
+            ("cafe faith", SearchBible(words="any", diacritics="insensitive", offset=1)),
+        )
+        for query, criteria in cases:
+            with self.subTest(query=query, criteria=criteria):
+                batch = self.bible.search(query, "test", criteria)
+                streamed = list(self.bible.iter_search(query, "test", criteria))
+                self.assertEqual(len(streamed), len(batch["matches"]))
+                for hit, match in zip(streamed, batch["matches"], strict=True):
+                    self.assertEqual({key: hit[key] for key in match}, match)
+        hit = next(self.bible.iter_search("faith", "test"))
+        self.assertEqual(hit["reference"], "Genesis 1:3")
+        self.assertEqual(hit["book_name"], "Genesis")
+        self.assertEqual(hit["scripture"]["name"], "Genesis 1:3")
+
+    def test_streaming_search_is_lazy_and_canonical_only(self):
+        with patch("getbible.search.SearchEngine.rank") as rank:
+            hits = self.bible.iter_search("faith", "test", SearchBible(limit=1))
+            self.assertEqual(len(list(hits)), 3)
+        rank.assert_not_called()
+        with self.assertRaises(SearchValidationError):
+            self.bible.iter_search("faith", "test", SearchBible(sort="relevance"))
+
+    def test_streaming_deadline_excludes_consumer_time_but_not_search_time(self):
+        with patch("getbible.search.time.monotonic", return_value=0.0):
+            budget = SearchBudget(SearchLimits(deadline_seconds=1.0))
+        with patch("getbible.search.time.monotonic", return_value=0.4):
+            budget.pause()
+        with patch("getbible.search.time.monotonic", return_value=100.0):
+            budget.resume()
+        with patch("getbible.search.time.monotonic", return_value=100.5):
+            budget.check_deadline()
+            budget.resume()
+        with (
+            patch("getbible.search.time.monotonic", return_value=100.7),
+            self.assertRaises(SearchDeadlineExceeded),
+        ):
+            budget.check_deadline()
+
     def test_legacy_string_can_be_passed_directly(self):
         response = self.bible.search(
             "faith hope",
@@ -240,6 +652,47 @@ class TestTranslationCache(unittest.TestCase):
         self.assertEqual(first["query"]["sha"], second["query"]["sha"])
         self.assertTrue(second["query"]["cache"]["stale"])
 
+    def test_stale_while_revalidate_serves_expired_snapshot_during_one_refresh(self):
+        bible = GetBible(
+            repo_path=str(self.repository),
+            cache_dir=str(self.root / "cache"),
+            cache_ttl=timedelta(seconds=0),
+            stale_while_revalidate=True,
+        )
+        first = bible.search("faith", "test")
+        release = threading.Event()
+        fetch_text = bible._repository.fetch_text
+
+        def blocked_fetch_text(path: str) -> str:
+            release.wait(timeout=10)
+            return fetch_text(path)
+
+        with patch.object(bible._repository, "fetch_text", side_effect=blocked_fetch_text):
+            for _ in range(3):
+                served = bible.search("faith", "test")
+                self.assertEqual(served["query"]["sha"], first["query"]["sha"])
+            info = bible.cache_info()["translation_cache"]
+            self.assertEqual(info["stale_served"], 3)
+            self.assertEqual(info["revalidating"], ["test"])
+            release.set()
+            for _ in range(1000):
+                info = bible.cache_info()["translation_cache"]
+                if info["background_refreshes"]:
+                    break
+                time.sleep(0.01)
+
+        self.assertEqual(info["background_refreshes"], 1)
+        self.assertEqual(info["background_refresh_failures"], 0)
+        self.assertEqual(info["source_checks"], 2)
+        self.assertGreater(info["background_refresh_max_seconds"], 0)
+        self.assertEqual(info["revalidating"], [])
+        with self.assertRaises(ValueError):
+            GetBible(
+                repo_path=str(self.repository),
+                strict_freshness=True,
+                stale_while_revalidate=True,
+            )
+
     def test_mismatched_published_sha_is_rejected(self):
         (self.repository / "v2" / "test.sha").write_text("0" * 40, encoding="utf-8")
         bible = GetBible(
@@ -281,6 +734,171 @@ class TestTranslationCache(unittest.TestCase):
             first["query"]["cache"]["checked_at"],
         )
 
+    def test_validated_sidecar_skips_revalidation_until_corrupt(self):
+        def client() -> GetBible:
+            return GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+
+        expected = client().search("faith", "test")
+        (sidecar,) = (self.root / "cache").rglob("*.validated-v*.bin")
+
+        second = client()
+        with patch.object(
+            TranslationCache,
+            "_decode_translation",
+            wraps=TranslationCache._decode_translation,
+        ) as decode:
+            self.assertEqual(second.search("faith", "test"), expected)
+        decode.assert_not_called()
+        self.assertEqual(second.cache_info()["translation_cache"]["validated_loads"], 1)
+
+        content = bytearray(sidecar.read_bytes())
+        content[-1] ^= 0xFF
+        sidecar.write_bytes(bytes(content))
+        third = client()
+        with patch.object(
+            TranslationCache,
+            "_decode_translation",
+            wraps=TranslationCache._decode_translation,
+        ) as decode:
+            self.assertEqual(third.search("faith", "test"), expected)
+        decode.assert_called_once()
+        self.assertNotEqual(sidecar.read_bytes(), bytes(content))
+
+    def test_stat_verification_hashes_payloads_only_when_changed_or_scrubbed(self):
+        def payload_hashes(**options) -> int:
+            bible = GetBible(
+                repo_path=str(self.repository), cache_dir=str(self.root / "cache"), **options
+            )
+            bible.search("faith", "test")
+            return bible.cache_info()["translation_cache"]["payload_hashes"]
+
+        self.assertEqual(payload_hashes(payload_verification="stat"), 0)
+        (payload,) = (self.root / "cache").rglob("objects/*.json")
+        self.assertEqual(payload_hashes(payload_verification="stat"), 0)
+        self.assertEqual(payload_hashes(), 1)
+
+        status = payload.stat()
+        os.utime(payload, ns=(status.st_atime_ns, status.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(payload_hashes(payload_verification="stat"), 1)
+        self.assertEqual(payload_hashes(payload_verification="stat"), 0)
+        self.assertEqual(
+            payload_hashes(payload_verification="stat", payload_scrub_interval=timedelta(0)),
+            1,
+        )
+        with self.assertRaises(ValueError):
+            GetBible(repo_path=str(self.repository), payload_verification="none")
+
+    def test_compressed_payloads_verify_canonical_bytes(self):
+        def load(**options) -> GetBible:
+            bible = GetBible(
+                repo_path=str(self.repository),
+                cache_dir=str(self.root / "cache"),
+                payload_compression="gzip",
+                **options,
+            )
+            self.assertEqual(bible.search("faith", "test")["query"]["total"], 3)
+            return bible
+
+        first = load()
+        source = (self.repository / "v2" / "test.json").read_bytes()
+        (payload,) = (self.root / "cache").rglob("objects/*.json.gz")
+        self.assertFalse(list((self.root / "cache").rglob("objects/*.json")))
+        self.assertLess(payload.stat().st_size, len(source))
+        self.assertEqual(
+            first.search("faith", "test")["query"]["sha"],
+            hashlib.sha1(source).hexdigest(),
+        )
+
+        for sidecar in (self.root / "cache").rglob("objects/*.validated-v*.bin"):
+            sidecar.unlink()
+        info = load().cache_info()["translation_cache"]
+        self.assertEqual((info["disk_hits"], info["downloads"]), (1, 0))
+
+        payload.write_bytes(payload.read_bytes()[:-8])
+        info = load().cache_info()["translation_cache"]
+        self.assertEqual(info["downloads"], 1)
+        with self.assertRaises(ValueError):
+            GetBible(repo_path=str(self.repository), payload_compression="zip")
+
+    def test_columnar_corpus_preserves_verse_fields_and_order(self):
+        translation_path = self.repository / "v2" / "test.json"
+        translation = json.loads(translation_path.read_text(encoding="utf-8"))
+        verse = translation["books"][0]["chapters"][0]["verses"][0]
+        reordered = {"text": verse["text"], "footnote": {"mark": "a"}}
+        reordered.update({key: value for key, value in verse.items() if key != "text"})
+        translation["books"][0]["chapters"][0]["verses"][0] = reordered
+        translation_path.write_text(json.dumps(translation), encoding="utf-8")
+        bible = GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+
+        response = bible.search("in the beginning", "test", SearchBible(words="phrase"))
+        returned = response["results"]["test_1_1"]["verses"][0]
+        self.assertEqual(returned, reordered)
+        self.assertEqual(list(returned), list(reordered))
+
+    def _index_files(self) -> list[Path]:
+        return [
+            path
+            for path in (self.root / "cache").rglob("*.search-v*")
+            if path.suffix != ".lock"
+        ]
+
+    def test_persisted_search_index_is_mapped_by_other_clients(self):
+        first = GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+        expected = first.search("faith hope", "test")
+        self.assertEqual(len(self._index_files()), 1)
+
+        second = GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+        with patch("getbible.search.encode_index") as encode:
+            response = second.search("faith hope", "test")
+        encode.assert_not_called()
+        self.assertEqual(response["matches"], expected["matches"])
+        corpus_info = second.cache_info()["search_corpora"]["translations"]["test"]
+        self.assertEqual(corpus_info["mapped_indexes"], 1)
+
+    def test_corrupt_persisted_search_index_is_rebuilt(self):
+        GetBible(
+            repo_path=str(self.repository),
+            cache_dir=str(self.root / "cache"),
+        ).search("faith", "test")
+        (path,) = self._index_files()
+        content = bytearray(path.read_bytes())
+        content[-1] ^= 0xFF
+        path.write_bytes(bytes(content))
+
+        bible = GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+        self.assertEqual(bible.search("faith", "test")["query"]["total"], 3)
+        self.assertNotEqual(path.read_bytes(), bytes(content))
+
+    def test_persisted_verse_store_is_mapped_and_rebuilt_when_corrupt(self):
+        first = GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+        expected = first.search("faith hope", "test")
+        (path,) = (self.root / "cache").rglob("*.verses-v*.store")
+
+        second = GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+        with patch("getbible.search.encode_verse_store") as encode:
+            response = second.search("faith hope", "test")
+        encode.assert_not_called()
+        self.assertEqual(response, expected)
+        corpus_info = second.cache_info()["search_corpora"]["translations"]["test"]
+        self.assertTrue(corpus_info["mapped_verses"])
+
+        content = bytearray(path.read_bytes())
+        content[-1] ^= 0xFF
+        path.write_bytes(bytes(content))
+        third = GetBible(repo_path=str(self.repository), cache_dir=str(self.root / "cache"))
+        self.assertEqual(third.search("faith hope", "test"), expected)
+        self.assertNotEqual(path.read_bytes(), bytes(content))
+
+    def test_search_index_persistence_can_be_disabled(self):
+        bible = GetBible(
+            repo_path=str(self.repository),
+            cache_dir=str(self.root / "cache"),
+            persist_search_indexes=False,
+        )
+        self.assertEqual(bible.search("faith", "test")["query"]["total"], 3)
+        self.assertEqual(self._index_files(), [])
+        self.assertEqual(list((self.root / "cache").rglob("*.store")), [])
+
 
 if __name__ == "__main__":
     unittest.main()